@@ -0,0 +1,99 @@
+#Version 10/18/26
+"""
+Ingestion benchmarks -- run from repo root: python benchmarks/bench_ingestion.py
+"""
+import sys, os, time, glob, tempfile
+import pandas as pd
+
+# Add libs folder to sys.path and import project-specific modules
+path_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(path_root, 'libs'))
+import pd_util
+import excel_engines
+
+pf_survey = os.path.join(path_root, 'tests', 'test_data_parse', 'tbl1_survey.xlsx')
+
+def TimeCall(func, n_repeat=3):
+    """
+    Return (best wall-clock seconds, result) for func() over n_repeat calls
+    10/18/26
+    """
+    t_best, result = None, None
+    for _ in range(n_repeat):
+        t0 = time.perf_counter()
+        result = func()
+        t = time.perf_counter() - t0
+        t_best = t if t_best is None else min(t_best, t)
+    return t_best, result
+
+def RawSurveyDf(n_rows):
+    """
+    Return header=None raw sheet df with tbl1_survey blocks tiled to n_rows
+    10/18/26
+    """
+    df = pd.read_excel(pf_survey, sheet_name=0, header=None)
+    n_tiles = -(-n_rows // len(df))
+    return pd.concat([df] * n_tiles, ignore_index=True).iloc[:n_rows]
+
+def BenchStrCoercion(n_rows=200000):
+    """
+    Time import_dtype=str coercion: per-cell map vs column-wise pd_util.DfToStr
+    10/18/26
+    """
+    df = RawSurveyDf(n_rows)
+    t_cell, df_cell = TimeCall(lambda: df.astype(object).map(pd_util.CellToStr))
+    t_vec, df_vec = TimeCall(lambda: pd_util.DfToStr(df))
+    pd.testing.assert_frame_equal(df_cell, df_vec)
+
+    print(f'str coercion ({n_rows} rows x {df.shape[1]} cols)')
+    print(f'  per-cell map: {t_cell:.3f}s')
+    print(f'  DfToStr:      {t_vec:.3f}s  ({t_cell / t_vec:.1f}x)')
+
+def BenchExcelEngines(n_rows=20000, lst_engines=None):
+    """
+    Time all-sheet header=None reads per registered engine on test workbooks
+    plus a tiled tbl1_survey workbook; flag engines whose dfs differ from
+    openpyxl (MISMATCH; 'known diff' if engine is in dict_engine_diffs)
+    10/18/26; Modified 10/18/26 known engine differences
+    """
+    lst_engines = lst_engines or list(excel_engines.dict_excel_engines)
+    with tempfile.TemporaryDirectory() as path_tmp:
+        pf_tiled = os.path.join(path_tmp, f'survey_{n_rows}.xlsx')
+        RawSurveyDf(n_rows).to_excel(pf_tiled, header=False, index=False)
+        lst_pf = sorted(glob.glob(os.path.join(path_root, 'tests', 'test_data*', '*.xlsx')))
+
+        print(f'Excel engines (all sheets, header=None)')
+        for pf in lst_pf + [pf_tiled]:
+            dict_expected = pd.read_excel(pf, sheet_name=None, header=None, engine='openpyxl')
+            n_cells = sum(df.size for df in dict_expected.values())
+            print(f'  {os.path.basename(pf)} ({n_cells} cells)')
+            for engine in lst_engines:
+                t, dict_dfs = TimeCall(lambda: ReadAllSheets(pf, engine))
+                status = 'ok' if IsSameDfs(dict_dfs, dict_expected) else \
+                    'known diff' if engine in excel_engines.dict_engine_diffs else 'MISMATCH'
+                print(f'    {engine:10s} {t:.4f}s  {n_cells / t:12,.0f} cells/s  {status}')
+
+def ReadAllSheets(pf, engine):
+    """
+    Return dict of all sheets' header=None dfs read with named engine
+    10/18/26
+    """
+    with excel_engines.OpenExcelFile(pf, engine) as xl:
+        return xl.parse(sheet_name=None, header=None)
+
+def IsSameDfs(dict_dfs, dict_expected):
+    """
+    Return True if dicts of dfs have same keys and equal dfs (incl. dtypes)
+    10/18/26
+    """
+    if list(dict_dfs) != list(dict_expected): return False
+    try:
+        for sht, df in dict_expected.items():
+            pd.testing.assert_frame_equal(dict_dfs[sht], df)
+    except AssertionError:
+        return False
+    return True
+
+if __name__ == '__main__':
+    BenchStrCoercion()
+    BenchExcelEngines()
@@ -0,0 +1,232 @@
+#Version 10/18/26
+"""
+Ingestion benchmark suite -- times Table.ImportToTblDf, Table.ParseRawData,
+InterleavedColBlocksTbl.ParseInterleavedBlocksProcedure and
+ColumnInfo.DataIngestionProcedure on synthetic workloads (see generators.py)
+and saves JSON results for comparison across runs
+
+Run from repo root:
+    python benchmarks/bench_suite.py [--size quick|default|large]
+    python benchmarks/bench_suite.py --compare results/base.json results/new.json
+"""
+import sys, os, time, json, platform, statistics, subprocess, tempfile, argparse
+import numpy as np
+import pandas as pd
+
+# Add libs and benchmarks folders to sys.path and import project-specific modules
+path_bench = os.path.dirname(os.path.abspath(__file__)) + os.sep
+path_root = os.path.dirname(os.path.dirname(path_bench)) + os.sep
+sys.path.insert(0, path_root + 'libs')
+sys.path.insert(0, path_bench)
+from projfiles import Files
+from projtables import ProjectTables, Table, InterleavedColBlocksTbl
+from col_info import ColumnInfo
+import generators
+
+path_results = path_bench + 'results' + os.sep
+
+# Workload sizes by --size option
+dict_sizes = {
+    'quick':{'n_repeat':1, 'structured':[(1, 1000, 8)], 'row_major':[20],
+             'interleaved':[(1000, 10)], 'colinfo':[200]},
+    'default':{'n_repeat':3, 'structured':[(1, 20000, 8), (4, 5000, 8)],
+               'row_major':[100, 1000], 'interleaved':[(10000, 20), (2000, 200)],
+               'colinfo':[1000, 4000]},
+    'large':{'n_repeat':3, 'structured':[(1, 200000, 16), (16, 20000, 16)],
+             'row_major':[10000], 'interleaved':[(100000, 50)], 'colinfo':[10000]}}
+
+"""
+================================================================================
+Timing helpers
+================================================================================
+"""
+def TimeStage(func, setup=None, n_repeat=3):
+    """
+    Return list of wall-clock seconds for func() over n_repeat runs (setup()
+    called untimed before each run; its return value is passed to func)
+    10/18/26
+    """
+    lst_t = []
+    for _ in range(n_repeat):
+        arg = setup() if setup is not None else None
+        t0 = time.perf_counter()
+        func(arg) if setup is not None else func()
+        lst_t.append(time.perf_counter() - t0)
+    return lst_t
+
+def ResultRecord(case, stage, dParams, lst_t, n_rows=None):
+    """
+    Return dict result record for one timed case/stage
+    10/18/26
+    """
+    record = {'case':case, 'stage':stage, 'params':dParams, 'times':lst_t,
+              'best':min(lst_t), 'median':statistics.median(lst_t)}
+    if n_rows: record['rows_per_s'] = n_rows / min(lst_t)
+    return record
+
+"""
+================================================================================
+Benchmark cases
+================================================================================
+"""
+def BenchStructured(path, ftype, n_files, n_rows, n_cols, n_repeat):
+    """
+    Time ImportToTblDf for structured files
+    10/18/26
+    """
+    dImportParams = generators.WriteStructuredFiles(path, ftype, n_files, n_rows, n_cols)
+    def Import():
+        Table('structured', dict(dImportParams)).ImportToTblDf()
+
+    dParams = {'ftype':ftype, 'n_files':n_files, 'n_rows':n_rows, 'n_cols':n_cols}
+    lst_t = TimeStage(Import, n_repeat=n_repeat)
+    return [ResultRecord(f'structured_{ftype}', 'ImportToTblDf', dParams, lst_t,
+                         n_rows * n_files)]
+
+def BenchRowMajor(path, n_blocks, n_repeat, n_rows_block=10):
+    """
+    Time ImportToTblDf and ParseRawData for a row-major sheet with n_blocks
+    10/18/26
+    """
+    dImportParams, dParseParams = generators.WriteRowMajorSheet(path, n_blocks, n_rows_block)
+    def NewTable():
+        return Table('row_major', dict(dImportParams), dict(dParseParams))
+    def ImportedTable():
+        tbl = NewTable()
+        tbl.ImportToTblDf()
+        return tbl
+
+    dParams = {'n_blocks':n_blocks, 'n_rows_block':n_rows_block}
+    n_rows = n_blocks * n_rows_block
+    lst_t_import = TimeStage(lambda: NewTable().ImportToTblDf(), n_repeat=n_repeat)
+    lst_t_parse = TimeStage(lambda tbl: tbl.ParseRawData(), ImportedTable, n_repeat)
+    return [ResultRecord('row_major', 'ImportToTblDf', dParams, lst_t_import, n_rows),
+            ResultRecord('row_major', 'ParseRawData', dParams, lst_t_parse, n_rows)]
+
+def BenchInterleaved(n_rows, n_blocks, n_repeat):
+    """
+    Time ParseInterleavedBlocksProcedure for interleaved sheet with n_blocks
+    10/18/26
+    """
+    df_raw, dParseParams = generators.InterleavedRawDf(n_rows, n_blocks)
+    def NewParse():
+        tbl = Table('interleaved', dParseParams=dict(dParseParams))
+        tbl.df_raw = df_raw.copy()
+        return InterleavedColBlocksTbl(tbl)
+
+    dParams = {'n_rows':n_rows, 'n_blocks':n_blocks}
+    lst_t = TimeStage(lambda parse: parse.ParseInterleavedBlocksProcedure(),
+                      NewParse, n_repeat)
+    return [ResultRecord('interleaved', 'ParseInterleavedBlocksProcedure',
+                         dParams, lst_t, n_rows * n_blocks)]
+
+def BenchColInfo(path, n_vars, n_repeat, n_rows=100):
+    """
+    Time ColumnInfo.DataIngestionProcedure with n_vars ColInfo variables
+    10/18/26
+    """
+    generators.WriteColInfoWorkload(path, n_vars, n_rows)
+    def NewTbls():
+        files = Files(IsTest=True, subdir_tests='test_data')
+        files.path_data = path
+        return ProjectTables(files)
+
+    dParams = {'n_vars':n_vars, 'n_rows':n_rows}
+    lst_t = TimeStage(lambda tbls: ColumnInfo(IsPrint=False).DataIngestionProcedure(tbls),
+                      NewTbls, n_repeat)
+    return [ResultRecord('colinfo', 'DataIngestionProcedure', dParams, lst_t)]
+
+"""
+================================================================================
+Suite, environment and results files
+================================================================================
+"""
+def RunSuite(size='default'):
+    """
+    Run all cases for size; return results dict (environment + records)
+    10/18/26
+    """
+    dSize = dict_sizes[size]
+    n_repeat = dSize['n_repeat']
+    lst_records = []
+    with tempfile.TemporaryDirectory() as path_tmp:
+        path = path_tmp + os.sep
+        for n_files, n_rows, n_cols in dSize['structured']:
+            for ftype in ['excel', 'csv']:
+                lst_records += BenchStructured(path, ftype, n_files, n_rows, n_cols, n_repeat)
+        for n_blocks in dSize['row_major']:
+            lst_records += BenchRowMajor(path, n_blocks, n_repeat)
+        for n_rows, n_blocks in dSize['interleaved']:
+            lst_records += BenchInterleaved(n_rows, n_blocks, n_repeat)
+        for n_vars in dSize['colinfo']:
+            lst_records += BenchColInfo(path, n_vars, n_repeat)
+    return {'size':size, 'environment':Environment(), 'results':lst_records}
+
+def Environment():
+    """
+    Return dict of run timestamp, git commit and package versions
+    10/18/26
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=path_root,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+    return {'timestamp':time.strftime('%Y-%m-%d %H:%M:%S'), 'git_commit':commit,
+            'python':platform.python_version(), 'pandas':pd.__version__,
+            'numpy':np.__version__, 'platform':platform.platform()}
+
+def SaveResults(dResults, pf=None):
+    """
+    Write results JSON (default results/bench_<size>_<timestamp>.json); return pf
+    10/18/26
+    """
+    if pf is None:
+        os.makedirs(path_results, exist_ok=True)
+        pf = path_results + f"bench_{dResults['size']}_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(pf, 'w') as f:
+        json.dump(dResults, f, indent=1)
+    return pf
+
+def CompareResults(pf_base, pf_new, threshold=1.2):
+    """
+    Return df of base vs new best times by case/stage/params (ratio > threshold
+    flagged as slower)
+    10/18/26
+    """
+    lst_dfs = []
+    for pf, label in [(pf_base, 'base'), (pf_new, 'new')]:
+        with open(pf) as f:
+            df = pd.DataFrame(json.load(f)['results'])
+        df['params'] = df['params'].map(lambda d: json.dumps(d, sort_keys=True))
+        lst_dfs.append(df.set_index(['case', 'stage', 'params'])['best'].rename(label))
+
+    df = pd.concat(lst_dfs, axis=1).dropna()
+    df['ratio'] = df['new'] / df['base']
+    df['is_slower'] = df['ratio'] > threshold
+    return df
+
+def PrintResults(dResults):
+    """
+    Print one line per result record
+    10/18/26
+    """
+    for r in dResults['results']:
+        rate = f"{r['rows_per_s']:12,.0f} rows/s" if 'rows_per_s' in r else ''
+        print(f"{r['case']:20s} {r['stage']:32s} {json.dumps(r['params']):60s} "
+              f"{r['best']:8.4f}s {rate}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Ingestion benchmark suite')
+    parser.add_argument('--size', default='default', choices=list(dict_sizes))
+    parser.add_argument('--out', default=None, help='results JSON path')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'),
+                        help='compare two results JSON files')
+    args = parser.parse_args()
+
+    if args.compare:
+        print(CompareResults(*args.compare).to_string())
+    else:
+        dResults = RunSuite(args.size)
+        PrintResults(dResults)
+        print('\nSaved', SaveResults(dResults, args.out))
@@ -0,0 +1,142 @@
+#Version 10/18/26
+"""
+Synthetic workload generators for the ingestion benchmark suite. Each
+generator writes files (or returns a raw df) plus the dImportParams and
+dParseParams a Table needs to ingest them
+"""
+import numpy as np
+import pandas as pd
+
+"""
+================================================================================
+Structured (rows/cols) Excel and CSV files
+================================================================================
+"""
+def StructuredDf(n_rows, n_cols, seed=0):
+    """
+    Return df with repeating date, str, int and float import-named columns
+    10/18/26
+    """
+    rng = np.random.default_rng(seed)
+    dict_cols = {}
+    for i in range(n_cols):
+        name = f'col_{i}_import_name'
+        if i % 4 == 0:
+            dict_cols[name] = pd.Timestamp('2025-01-01') + \
+                pd.to_timedelta(rng.integers(0, 365, n_rows), unit='D')
+        elif i % 4 == 1:
+            dict_cols[name] = rng.choice(['east', 'west', 'north', 'south'], n_rows)
+        elif i % 4 == 2:
+            dict_cols[name] = rng.integers(0, 1000, n_rows)
+        else:
+            dict_cols[name] = rng.normal(100, 25, n_rows).round(2)
+    return pd.DataFrame(dict_cols)
+
+def WriteStructuredFiles(path, ftype='excel', n_files=1, n_rows=1000, n_cols=8,
+                         sht='data'):
+    """
+    Write n_files structured files; return dImportParams for ImportToTblDf
+    10/18/26
+    """
+    ext = {'excel':'.xlsx', 'csv':'.csv', 'parquet':'.parquet', 'feather':'.feather'}[ftype]
+    lst_files = []
+    for i in range(n_files):
+        f = f'structured_{n_rows}x{n_cols}_{i}{ext}'
+        df = StructuredDf(n_rows, n_cols, seed=i)
+        if ftype == 'excel': df.to_excel(path + f, sheet_name=sht, index=False)
+        elif ftype == 'csv': df.to_csv(path + f, index=False)
+        elif ftype == 'parquet': df.to_parquet(path + f, index=False)
+        else: df.to_feather(path + f)
+        lst_files.append(f)
+
+    dImportParams = {'ftype':ftype, 'import_path':path, 'lst_files':lst_files}
+    if ftype == 'excel': dImportParams.update({'sht_type':'single', 'sht':sht})
+    return dImportParams
+
+"""
+================================================================================
+Unstructured row-major (survey-style) and interleaved column block sheets
+================================================================================
+"""
+def RowMajorRows(n_blocks, n_rows_block=10, n_cols=4, seed=0):
+    """
+    Return list of raw rows with n_blocks survey-style blocks (question row,
+    'Answer Choices' header row, data rows and blank separator rows)
+    10/18/26
+    """
+    rng = np.random.default_rng(seed)
+    lst_rows = [['Synthetic Survey'] + [None] * (n_cols - 1), [None] * n_cols]
+    for i in range(n_blocks):
+        lst_rows.append([f'Q{i + 1}. Question {i + 1}?'] + [None] * (n_cols - 1))
+        lst_rows.append(['Answer Choices'] + [f'col_{j}' for j in range(1, n_cols)])
+        for k in range(n_rows_block):
+            lst_rows.append([f'Answer {k + 1}'] + rng.integers(0, 500, n_cols - 1).tolist())
+        lst_rows += [[None] * n_cols, [None] * n_cols]
+    return lst_rows
+
+def WriteRowMajorSheet(path, n_blocks, n_rows_block=10, n_cols=4, sht='raw_table'):
+    """
+    Write row-major sheet with n_blocks; return (dImportParams, dParseParams)
+    10/18/26
+    """
+    f = f'row_major_{n_blocks}x{n_rows_block}.xlsx'
+    df_raw = pd.DataFrame(RowMajorRows(n_blocks, n_rows_block, n_cols))
+    df_raw.to_excel(path + f, sheet_name=sht, header=False, index=False)
+
+    dImportParams = {'ftype':'excel', 'import_path':path, 'lst_files':f,
+                     'sht_type':'single', 'sht':sht}
+    dParseParams = {'is_unstructured':True, 'parse_type':'row_major',
+        'import_dtype':str, 'flag_start_bound':'Answer Choices',
+        'flag_end_bound':'<blank>', 'icol_start_bound':0, 'icol_end_bound':0,
+        'iheader_rowoffset_from_flag':0, 'idata_rowoffset_from_flag':1}
+    return dImportParams, dParseParams
+
+def InterleavedRawDf(n_rows, n_blocks, n_cols_metadata=2, n_cols_block=2, seed=0):
+    """
+    Return (df_raw, dParseParams) for interleaved column blocks (block name
+    row, header row, n_rows data rows, trailing blank row)
+    10/18/26
+    """
+    rng = np.random.default_rng(seed)
+    n_cols = n_cols_metadata + n_blocks * n_cols_block
+    row_blocks = [None] * n_cols_metadata
+    row_header = [f'meta_{j}' for j in range(n_cols_metadata)]
+    for i in range(n_blocks):
+        row_blocks += [f'blk_{i}'] + [None] * (n_cols_block - 1)
+        row_header += [f'val_{j}' for j in range(n_cols_block)]
+
+    data = rng.normal(size=(n_rows, n_cols)).round(3).astype(object)
+    data[:, 0] = np.arange(n_rows)
+    df_raw = pd.DataFrame([row_blocks, row_header] + data.tolist() + [[None] * n_cols])
+    dParseParams = {'idx_start':0, 'n_cols_metadata':n_cols_metadata,
+                    'n_cols_block':n_cols_block}
+    return df_raw, dParseParams
+
+"""
+================================================================================
+ColInfo table with many variables (plus its two example tables' files)
+================================================================================
+"""
+def WriteColInfoWorkload(path, n_vars, n_rows=100):
+    """
+    Write col_info.xlsx ('cols' sheet) with n_vars split between ExampleTbl1
+    and ExampleTbl2 plus their Example1.xlsx/Example2.xlsx data files (as
+    read by ProjectTables with files.path_data = path)
+    10/18/26
+    """
+    lst_types = ['date', 'str', 'int', 'float']
+    rows = []
+    for i in range(n_vars):
+        tbl_name = 'ExampleTbl1' if i % 2 == 0 else 'ExampleTbl2'
+        rows.append({'name':f'var_{i}', 'description':None, 'units':None,
+            'type':lst_types[i % 4], 'name_import':f'col_{i}_import_name',
+            'index_order':None, 'val_default':None, 'IsCalculated':None,
+            'ExampleTbl1':i if tbl_name == 'ExampleTbl1' else None,
+            'ExampleTbl2':i if tbl_name == 'ExampleTbl2' else None,
+            'keep_col_import':True if i % 10 else None})
+    pd.DataFrame(rows).to_excel(path + 'col_info.xlsx', sheet_name='cols', index=False)
+
+    # Table data files: every var's column (incl. non-keep) in ColInfo order
+    df = StructuredDf(n_rows, n_vars)
+    for f, i_start in [('Example1.xlsx', 0), ('Example2.xlsx', 1)]:
+        df.iloc[:, i_start::2].to_excel(path + f, sheet_name='data', index=False)
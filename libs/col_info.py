@@ -1,6 +1,7 @@
 # Version 4/3/25
 import pandas as pd
 import numpy as np
+import instrument
 """
 =============================================================================
 Class ColumnInfo
@@ -23,14 +24,26 @@ class ColumnInfo:
         replace import names. 
         * tbls.__init__ imports tbls.ColInfo.df
         * refactor to use tbl.dImportParams to decide call Excel, CSV etc.
+        * keep cols and renames are set before import and applied by readers
+        * ColInfo steps timed as 'colinfo_setup' stage of each table
 
-        JDL 4/3/25
+        JDL 4/3/25; Modified 10/18/26
         """
-        tbls.ImportExcelInputs()
-        self.SetFlagColsBoolean(tbls)
+        with instrument.TimeStage(tbls.ColInfo, 'colinfo_setup'):
+            self.SetFlagColsBoolean(tbls)
         for tbl in tbls.lstExcelImports:
-            self.SetTblKeepColsFromImport(tbls, tbl.name)
-            self.ReplaceImportNames(tbls, tbl.name)
+            with instrument.TimeStage(tbl, 'colinfo_setup'):
+                self.SetTblImportCols(tbls, tbl.name)
+        tbls.ImportExcelInputs()
+
+    def DataIngestionScheduled(self, tbls, n_workers=4):
+        """
+        DataIngestionProcedure with ColInfo setup, per-table ColInfo apply
+        and imports run as a DAG on n_workers threads (see
+        ProjectTables.ImportScheduled); return IngestScheduler
+        10/18/26
+        """
+        return tbls.ImportScheduled(col_info=self, n_workers=n_workers)
 
     def ReplaceImportNames(self, tbls, tbl_name):
         """
@@ -48,6 +61,50 @@ class ColumnInfo:
         rename_dict = df_fil.set_index('name_import')['name'].to_dict()
         tbl.df.rename(columns=rename_dict, inplace=True)
 
+    def SetTblImportCols(self, tbls, tbl_name):
+        """
+        Set tbl.dImportParams['usecols'] to keep_col_import names,
+        ['dict_rename'] to map them to names, ['dtypes'] to their ColInfo
+        types and ['dict_defaults'] to their val_default so file readers only
+        read kept columns, set types and defaults and rename at read time
+        (['memory_hints'] used if dImportParams['optimize_memory'])
+        10/18/26
+        """
+        tbl = getattr(tbls, tbl_name)
+        fil = self.fil_keep_vars(tbls, tbl_name)
+        df_fil = tbls.ColInfo.df.loc[fil, ['name_import', 'name', 'type', 'val_default']]
+
+        tbl.dImportParams['usecols'] = list(df_fil['name_import'])
+        tbl.dImportParams['dict_rename'] = dict(zip(df_fil['name_import'], df_fil['name']))
+
+        # Defaults by import name (skip vars with no ColInfo val_default)
+        df_dflt = df_fil[df_fil['val_default'].notnull()]
+        tbl.dImportParams['dict_defaults'] = dict(zip(df_dflt['name_import'],
+                                                      df_dflt['val_default']))
+
+        # Storage hints by name for Table.OptimizeMemory (optional ColInfo
+        # 'storage' column; else from type)
+        tbl.dImportParams['memory_hints'] = self.MemoryHints(tbls, fil)
+
+        # Types by import name (skip vars with no ColInfo type)
+        df_fil = df_fil[df_fil['type'].notnull()]
+        tbl.dImportParams['dtypes'] = dict(zip(df_fil['name_import'], df_fil['type']))
+
+    def MemoryHints(self, tbls, fil):
+        """
+        Return dict of name to Table.OptimizeMemory hint ('category', 'bool' or
+        'keep') for fil rows of .ColInfo.df: 'storage' column value if present
+        else 'bool'/'category' from type
+        10/18/26
+        """
+        df = tbls.ColInfo.df.loc[fil]
+        ser_hints = df['type'].astype(str).str.strip().str.lower().map(
+            {'bool':'bool', 'np.bool':'bool', 'np.bool_':'bool', 'category':'category'})
+        if 'storage' in df.columns:
+            ser_hints = df['storage'].where(df['storage'].notnull(), ser_hints)
+        fil_hint = ser_hints.notnull()
+        return dict(zip(df.loc[fil_hint, 'name'], ser_hints[fil_hint]))
+
     def SetTblKeepColsFromImport(self, tbls, tbl_name, IsImportNames=True):
         """
         Subset tbl.df columns based on ColInfo.df
@@ -1,7 +1,9 @@
 #Version 4/3/25
 import pandas as pd
 import numpy as np
+import pd_util
 # 4/3/25 commented out references to util and pd_util libraries
+# 10/18/26 pd_util restored for ColInfo type string lookup (vs eval)
 
 class ColInfo():
     """
@@ -25,9 +27,17 @@ class ColInfo():
         self.col_calc = 'IsCalculated'
         self.col_IsIndex = 'IsIndex'
         self.col_defaultval = 'val_default'
+        self.col_storage = 'storage' #optional 'category', 'bool' or 'keep' hint
 
         self.dftable = self.CreateDFTable()
 
+        #Dict lookups: import name to name, name to type and name to default
+        self.dict_import_to_name = {}
+        self.dict_import_to_name_unique = {}
+        self.dict_name_to_type = {}
+        self.dict_name_to_default = {}
+        self.BuildLookupDicts()
+
         #Read columns for either single or multi-index
         self.sColIndex = self.Set_sColIndex()
         self.lstMultiindex = None
@@ -60,17 +70,46 @@ class ColInfo():
             for subkey in subdict:
                 self.lst_Nested.append(subdict[subkey])
 
-    def RecodeFlagColsToBool(self, df):
+    def RecodeFlagColsToBool(self, df, IsImportNames=False):
         """
         Recode all flag (boolean) columns from 1/blank to Boolean coding
-        JDL 5/22/22 - not validated xxx
+        (columns with non flag-like values are left unchanged)
+        JDL 5/22/22; Modified 10/18/26 implemented with pd_util
+        """
+        dict_hints = self.BuildMemoryHints(IsImportNames)
+        for col in df.columns:
+            if dict_hints.get(col) != 'bool': continue
+            ser = pd_util.RecodeFlagColToBool(df[col])
+            if ser is not None: df[col] = ser
+        return df
+
+    def OptimizeMemory(self, df, IsImportNames=False, cat_threshold=0.5):
+        """
+        Return (df with categoricals, downcast numerics and bool flags, df
+        report of bytes saved per column) using ColInfo types/storage hints
+        10/18/26
         """
-        fil = self.dftable[self.col_type] == 'bool'
-        lst_flags = list(self.dftable[fil].index)
+        dict_hints = self.BuildMemoryHints(IsImportNames)
+        return pd_util.OptimizeDfMemory(df, dict_hints, cat_threshold)
 
-        for sCol in lst_flags:
-            #df = pd_util.RecodeFlagColToBoolean(df, sCol)
-            pass
+    def BuildMemoryHints(self, IsImportNames=False):
+        """
+        Return dict of column (name or import name) to storage hint: ColInfo
+        storage column if specified; else 'bool' or 'category' from type
+        10/18/26
+        """
+        dict_type_hints = {'bool':'bool', 'np.bool':'bool', 'np.bool_':'bool',
+                           'category':'category'}
+        dict_hints = {}
+        for name, row in self.dftable.iterrows():
+            col = row[self.col_importname] if IsImportNames else name
+            if pd.isnull(col): continue
+
+            hint = row.get(self.col_storage)
+            if pd.isnull(hint):
+                hint = dict_type_hints.get(str(row.get(self.col_type)).strip().lower())
+            if hint is not None: dict_hints[col] = hint
+        return dict_hints
 
     def Set_sColIndex(self):
         """
@@ -177,7 +216,7 @@ class ColInfo():
 
         #Create lists of variables and data types
         self._lst_TblVars = list(df.index)
-        self._lst_TblTypes = [eval(x) for x in df[self.col_type]]
+        self._lst_TblTypes = [pd_util.ResolveDtype(x) for x in df[self.col_type]]
 
     def CISubsetTableNestedVars(self):
         """
@@ -209,24 +248,55 @@ class ColInfo():
             #Add variable's dictionary to master dictionary for the table
             self.dict_Nested[varNested] = dict(zip(lstNestedNames, lstVars))
 
-    def RenameDFColsFromImport(self, df):
+    def BuildLookupDicts(self):
+        """
+        Build dicts from .dftable once for bulk rename, type and default
+        operations (vs boolean scan of .dftable for each column)
+        * import name to name (first ColInfo row if import name repeats)
+        * unique import name to name and unique name to type and default
+        10/18/26
+        """
+        ser_import = self.dftable[self.col_importname]
+        fil = ser_import.notnull()
+
+        # First row for each import name and import names on exactly one row
+        fil_first = fil & ~ser_import.duplicated(keep='first')
+        self.dict_import_to_name = dict(zip(ser_import[fil_first], self.dftable.index[fil_first]))
+        fil_unique = fil & ~ser_import.duplicated(keep=False)
+        self.dict_import_to_name_unique = dict(zip(ser_import[fil_unique],
+                                                   self.dftable.index[fil_unique]))
+
+        # Names on exactly one row
+        fil_name = ~self.dftable.index.duplicated(keep=False)
+        df_unique = self.dftable[fil_name]
+        if self.col_type in df_unique.columns:
+            self.dict_name_to_type = df_unique[self.col_type].to_dict()
+        if self.col_defaultval in df_unique.columns:
+            self.dict_name_to_default = df_unique[self.col_defaultval].to_dict()
+
+    def LookupCIName(self, col, IsImportNames):
+        """
+        Return ColInfo variable name for df column (None if not exactly one
+        ColInfo row)
+        10/18/26
+        """
+        if IsImportNames: return self.dict_import_to_name_unique.get(col)
+        if col in self.dict_name_to_type or col in self.dict_name_to_default:
+            return col
+        return None
 
+    def RenameDFColsFromImport(self, df):
+        """
+        Rename df columns and index name(s) from import names to ColInfo names
+        Modified 10/18/26 single rename using .dict_import_to_name
+        """
         #Columns
-        for col in df:
-            if col in self.dftable['name_import'].values:
-                sName = self.dftable[self.dftable['name_import'] == col].index[0]
-                df = df.rename(columns={col:sName})
+        df = df.rename(columns=self.dict_import_to_name)
         
         #Index/Multiindex Name(s) - build list of either current or renamed index names
         if df.index.names[0] is None: return df
-        lst_new = []
-        for idxname in df.index.names:
-            if idxname in self.dftable['name_import'].values:
-                sName = self.dftable[self.dftable['name_import'] == idxname].index[0]
-                lst_new.append(sName)
-            else:
-                lst_new.append(idxname)
-        df.index.names = lst_new
+        df.index.names = [self.dict_import_to_name.get(idxname, idxname)
+                          for idxname in df.index.names]
         return df
 
     def CreateDFTable(self):
@@ -244,54 +314,50 @@ class ColInfo():
     def SetDefaultVals(self, df, IsImportNames, lstCols=[]):
         """
         Set DF col default values based on ColInfo
-        JDL 11/29/21
+        JDL 11/29/21; Modified 10/18/26 dict lookup and single fillna;
+        Arrow-backed columns (fill values cast to str for string columns)
         """
         if not 'val_default' in self.dftable.columns: return df
         if len(lstCols) == 0: lstCols = list(df.columns)
-        for col in lstCols:
 
-            #Get the CI index (variable name) of the variable's row in CI
-            if IsImportNames:
-                fil = self.dftable['name_import'] == col
-            else:
-                fil = self.dftable.index == col
-            if self.dftable[fil].index.size != 1: continue
-            idx = self.dftable[fil].index[0]
-
-            #Skip if column is not in ColInfo or if no default value
-            val_default = self.dftable.loc[idx, 'val_default']
-            #if util.IsNullVal(val_default): continue
-
-            #If value is NaN or 'nan', replace with default value
-            fil = (df[col].isnull()) | (df[col]=='nan')
-            df.loc[fil, col] = val_default
-        return df
+        #Map columns to defaults (skip if not exactly one CI row)
+        dict_defaults = {}
+        for col in lstCols:
+            name = self.LookupCIName(col, IsImportNames)
+            if name is None: continue
+            dict_defaults[col] = self.dict_name_to_default.get(name)
+        if len(dict_defaults) == 0: return df
+
+        #Treat 'nan' strings as NaN; fill NaN's with non-null default values
+        cols = list(dict_defaults)
+        df[cols] = df[cols].replace('nan', np.nan)
+        dict_fill = {k:pd_util.ArrowFillValue(df[k], v)
+                     for k, v in dict_defaults.items() if not pd.isnull(v)}
+        return df.fillna(value=dict_fill)
 
     def SetTypes(self, df, IsImportNames, lstCols=[]):
         """
         Set DF col variable types based on ColInfo
-        JDL 11/29/21
+        JDL 11/29/21; Modified 10/18/26 dict/type lookups and single astype;
+        Arrow-backed columns keep Arrow dtypes (e.g. str -> string[pyarrow]
+        vs object with '<NA>' strings)
         """
         if not 'type' in self.dftable.columns: return df
         if len(lstCols) == 0: lstCols = list(df.columns)
 
+        dict_types = {}
         for col in lstCols:
             
-            #Get the CI index (variable name) of the variable's row in CI
-            if IsImportNames:
-                fil = self.dftable['name_import'] == col
-            else:
-                fil = self.dftable.index == col
-                
-            #Skip if column is not in ColInfo or if no default value
-            if self.dftable[fil].index.size != 1: continue
-            idx = self.dftable[fil].index[0]
-
-            dtype = self.dftable.loc[idx, 'type']
-            #if util.IsNullVal(dtype): continue
-            
-            df[col] = df[col].astype(eval(dtype))
-        return df
+            #Skip if column is not in ColInfo (exactly one row) or has no type
+            name = self.LookupCIName(col, IsImportNames)
+            if name is None: continue
+            dtype = self.dict_name_to_type.get(name)
+            if pd.isnull(dtype): continue
+            dict_types[col] = pd_util.ResolveDtype(dtype)
+            if pd_util.IsArrowCol(df[col]):
+                dict_types[col] = pd_util.ArrowDtype(dict_types[col])
+
+        return df.astype(dict_types)
 
     def RemoveIndexColsFromLst(self, lst):
         """
@@ -0,0 +1,386 @@
+#Version 10/18/26
+import os, re, zipfile, threading
+import xml.etree.ElementTree as ET
+import pandas as pd
+from pandas.io.parsers import TextParser
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, \
+    is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH, \
+    CALENDAR_MAC_1904
+
+"""
+================================================================================
+Excel reader engine registry -- dImportParams['engine'] selects the engine used
+to open workbooks. Each engine is a callable(pf) returning a handle with
+.sheet_names, .parse(sheet_name, header, skiprows, usecols, dtype, ...) and
+.close() (e.g. pd.ExcelFile). Engines return openpyxl's DataFrame shape/dtypes
+except for the differences listed in dict_engine_diffs
+================================================================================
+"""
+def PandasExcelEngine(engine):
+    """
+    Return opener for pd.ExcelFile with specified pandas engine
+    10/18/26
+    """
+    def OpenPandasExcelFile(pf):
+        return pd.ExcelFile(pf, engine=engine)
+    return OpenPandasExcelFile
+
+def RegisterExcelEngine(name, opener):
+    """
+    Add or replace a named engine in dict_excel_engines
+    10/18/26
+    """
+    dict_excel_engines[name] = opener
+
+def OpenExcelFile(pf, engine=None):
+    """
+    Return workbook handle for pf from named engine (None for pandas default)
+    10/18/26
+    """
+    if engine is None: return pd.ExcelFile(pf)
+    if engine not in dict_excel_engines:
+        raise ValueError(f"Unrecognized Excel engine: {engine} " + \
+                         f"(registered: {list(dict_excel_engines)})")
+    return dict_excel_engines[engine](pf)
+
+"""
+================================================================================
+ValuesExcelFile Class -- pure-values .xlsx reader (zipfile + XML iterparse);
+skips openpyxl's per-cell objects, styles and formulas
+================================================================================
+"""
+class ValuesExcelFile():
+    """
+    Read-only, values-only .xlsx handle with pd.ExcelFile-style interface.
+    Cell conversion matches pandas' openpyxl reader: integral numbers as int,
+    date-formatted numbers as datetime, errors as NaN and blanks as ''.
+    String escapes (_xHHHH_) are decoded (see dict_engine_diffs)
+    10/18/26; Modified 10/18/26 decode _xHHHH_ escapes
+    """
+    # SpreadsheetML and relationships XML namespaces
+    ns_main = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+    ns_rel_id = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+    def __init__(self, pf):
+        self.pf = pf
+        self.zf = zipfile.ZipFile(pf)
+
+        # Sheet name: zip member path (workbook order), date epoch and styles
+        self.dict_sheet_paths = {}
+        self.epoch = WINDOWS_EPOCH
+        self.lst_shared_strings = []
+        self.date_styles, self.timedelta_styles = set(), set()
+
+        self.ReadWorkbook()
+        self.ReadSharedStrings()
+        self.ReadStyles()
+
+    @property
+    def sheet_names(self):
+        return list(self.dict_sheet_paths)
+
+    def close(self):
+        self.zf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    ============================================================================
+    Workbook-level parts: sheet names/paths, shared strings and date styles
+    ============================================================================
+    """
+    def ReadWorkbook(self):
+        """
+        Set .dict_sheet_paths from workbook.xml and its rels; set .epoch
+        10/18/26
+        """
+        self.dict_sheet_paths, is_1904 = ReadWorkbookXml(self.zf)
+        if is_1904: self.epoch = CALENDAR_MAC_1904
+
+    def ReadSharedStrings(self):
+        """
+        Set .lst_shared_strings from sharedStrings.xml (if present)
+        10/18/26
+        """
+        if 'xl/sharedStrings.xml' not in self.zf.namelist(): return
+        with self.zf.open('xl/sharedStrings.xml') as f:
+            for _, elem in ET.iterparse(f):
+                if elem.tag == self.ns_main + 'si':
+                    self.lst_shared_strings.append(InlineText(elem, self.ns_main))
+                    elem.clear()
+
+    def ReadStyles(self):
+        """
+        Set .date_styles and .timedelta_styles (cellXfs indices) from styles.xml
+        10/18/26
+        """
+        if 'xl/styles.xml' not in self.zf.namelist(): return
+        ns = self.ns_main
+        root = ET.fromstring(self.zf.read('xl/styles.xml'))
+        dict_custom = {int(fmt.get('numFmtId')):fmt.get('formatCode')
+                       for fmt in root.iter(ns + 'numFmt')}
+
+        cell_xfs = root.find(ns + 'cellXfs')
+        if cell_xfs is None: return
+        for idx, xf in enumerate(cell_xfs.iter(ns + 'xf')):
+            id_fmt = int(xf.get('numFmtId', 0))
+            fmt = dict_custom.get(id_fmt, builtin_format_code(id_fmt))
+            if fmt is None: continue
+            if is_date_format(fmt): self.date_styles.add(idx)
+            if is_timedelta_format(fmt): self.timedelta_styles.add(idx)
+
+    """
+    ============================================================================
+    Sheet data and pd.ExcelFile.parse-style reads
+    ============================================================================
+    """
+    def GetSheetData(self, sht):
+        """
+        Return list of row lists of cell values for sheet name or index
+        (trailing blank rows trimmed; rows padded to max width with '')
+        10/18/26
+        """
+        if not isinstance(sht, str): sht = self.sheet_names[sht]
+        if sht not in self.dict_sheet_paths:
+            raise ValueError(f"Worksheet named '{sht}' not found")
+
+        ns = self.ns_main
+        tag_row, tag_c, tag_v = ns + 'row', ns + 'c', ns + 'v'
+        data, idx_row = [], 0
+        with self.zf.open(self.dict_sheet_paths[sht]) as f:
+            for _, elem in ET.iterparse(f):
+                if elem.tag != tag_row: continue
+
+                # Fill skipped (missing) rows with empty rows
+                idx_row = int(elem.get('r', idx_row + 1))
+                data.extend([] for _ in range(idx_row - 1 - len(data)))
+
+                row, idx_col = [], 0
+                for c in elem.iter(tag_c):
+                    ref = c.get('r')
+                    idx_col = column_index_from_string(ref.rstrip('0123456789')) \
+                        if ref else idx_col + 1
+                    row.extend([''] * (idx_col - 1 - len(row)))
+                    row.append(self.CellValue(c, tag_v))
+
+                while row and row[-1] == '': row.pop()
+                data.append(row)
+                elem.clear()
+
+        # Trim trailing empty rows and pad rows to max width
+        while data and not data[-1]: data.pop()
+        if data:
+            n_cols = max(len(row) for row in data)
+            data = [row + [''] * (n_cols - len(row)) for row in data]
+        return data
+
+    def CellValue(self, c, tag_v):
+        """
+        Return value of a <c> cell element (pandas openpyxl conversions)
+        10/18/26
+        """
+        data_type = c.get('t', 'n')
+        if data_type == 'inlineStr':
+            elem_is = c.find(self.ns_main + 'is')
+            return '' if elem_is is None else InlineText(elem_is, self.ns_main)
+
+        val = c.findtext(tag_v)
+        if not val: return ''
+        if data_type == 'n':
+            num = float(val) if ('.' in val or 'E' in val or 'e' in val) else int(val)
+            style = int(c.get('s', 0))
+            if style in self.date_styles:
+                try:
+                    return from_excel(num, self.epoch,
+                                      timedelta=style in self.timedelta_styles)
+                except (OverflowError, ValueError):
+                    return float('nan')
+            return int(num) if int(num) == num else float(num)
+        elif data_type == 's':
+            return self.lst_shared_strings[int(val)]
+        elif data_type == 'b':
+            return bool(int(val))
+        elif data_type == 'e':
+            return float('nan')
+        elif data_type == 'd':
+            return from_ISO8601(val)
+        return val
+
+    def parse(self, sheet_name=0, header=0, skiprows=None, usecols=None,
+              dtype=None, nrows=None, **kwds):
+        """
+        Return df (or dict of dfs if sheet_name is list or None) for sheet(s)
+        with same header/skiprows/usecols/dtype handling as pd.read_excel
+        10/18/26
+        """
+        is_dict = isinstance(sheet_name, list) or sheet_name is None
+        lst_sheets = self.sheet_names if sheet_name is None else \
+            sheet_name if isinstance(sheet_name, list) else [sheet_name]
+
+        dict_dfs = {}
+        for sht in dict.fromkeys(lst_sheets):
+            data = self.GetSheetData(sht)
+            if not data:
+                dict_dfs[sht] = pd.DataFrame()
+                continue
+            parser = TextParser(data, header=header, skiprows=skiprows,
+                                usecols=usecols, dtype=dtype, nrows=nrows,
+                                skip_blank_lines=False, **kwds)
+            dict_dfs[sht] = parser.read(nrows=nrows)
+
+        return dict_dfs if is_dict else dict_dfs[lst_sheets[-1]]
+
+"""
+================================================================================
+Workbook metadata probe -- sheet names, order, zip paths and dimensions from
+xl/workbook.xml (and each sheet's leading <dimension> element) without building
+a workbook; results cached per file path, size and mtime
+================================================================================
+"""
+# Probe results by absolute path: (size, mtime_ns, dProbe)
+dict_workbook_probes = {}
+lock_probes = threading.Lock()
+
+def ProbeWorkbook(pf):
+    """
+    Return dict of 'sheet_names' (workbook order) and 'sheets' (name: dict of
+    'index', 'path', 'dimension' ref and 'n_rows'/'n_cols' or None if sheet
+    has no dimension) for an .xlsx/.xlsm zip; None if pf is not a
+    SpreadsheetML zip (e.g. .xls, .xlsb, .ods). Cached by path and mtime
+    10/18/26
+    """
+    pf_abs = os.path.abspath(pf)
+    stat = os.stat(pf_abs)
+    with lock_probes:
+        cached = dict_workbook_probes.get(pf_abs)
+    if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+
+    dProbe = ProbeWorkbookZip(pf_abs)
+    with lock_probes:
+        dict_workbook_probes[pf_abs] = (stat.st_size, stat.st_mtime_ns, dProbe)
+    return dProbe
+
+def ProbeWorkbookZip(pf):
+    """
+    Return uncached ProbeWorkbook result for pf
+    10/18/26
+    """
+    if not zipfile.is_zipfile(pf): return None
+    with zipfile.ZipFile(pf) as zf:
+        if 'xl/workbook.xml' not in zf.namelist(): return None
+        dict_sheet_paths, _ = ReadWorkbookXml(zf)
+
+        dict_sheets = {}
+        for idx, (name, path) in enumerate(dict_sheet_paths.items()):
+            ref = SheetDimension(zf, path)
+            n_rows, n_cols = None, None
+            if ref is not None:
+                col_min, row_min, col_max, row_max = range_boundaries(ref)
+                n_rows, n_cols = row_max - row_min + 1, col_max - col_min + 1
+            dict_sheets[name] = {'index':idx, 'path':path, 'dimension':ref,
+                                 'n_rows':n_rows, 'n_cols':n_cols}
+    return {'sheet_names':list(dict_sheet_paths), 'sheets':dict_sheets}
+
+def ReadWorkbookXml(zf):
+    """
+    Return (dict of sheet name: zip member path in workbook order, True if
+    1904 date system) from xl/workbook.xml and its rels
+    10/18/26
+    """
+    ns = ValuesExcelFile.ns_main
+    root = ET.fromstring(zf.read('xl/workbook.xml'))
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    dict_targets = {rel.get('Id'):rel.get('Target') for rel in rels}
+
+    wb_pr = root.find(ns + 'workbookPr')
+    is_1904 = wb_pr is not None and wb_pr.get('date1904') in ['1', 'true']
+
+    dict_sheet_paths = {}
+    for sht in root.iter(ns + 'sheet'):
+        target = dict_targets[sht.get(ValuesExcelFile.ns_rel_id)]
+        path = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+        dict_sheet_paths[sht.get('name')] = path
+    return dict_sheet_paths, is_1904
+
+def SheetDimension(zf, path):
+    """
+    Return sheet's <dimension ref> (e.g. 'A1:D13'; single cell ref expanded
+    to a range) or None; stops reading at <sheetData> so cell data are not
+    decompressed
+    10/18/26
+    """
+    ns = ValuesExcelFile.ns_main
+    if path not in zf.namelist(): return None
+    with zf.open(path) as f:
+        for _, elem in ET.iterparse(f, events=('start',)):
+            if elem.tag == ns + 'dimension':
+                ref = elem.get('ref')
+                return ref if ':' in ref else ref + ':' + ref
+            if elem.tag == ns + 'sheetData': return None
+    return None
+
+def SheetNamesFromZip(pf):
+    """
+    Return sheet names in workbook order from xl/workbook.xml of an .xlsx/.xlsm
+    zip (no workbook object, shared strings or sheet data loaded); None if pf
+    is not a SpreadsheetML zip (e.g. .xls, .xlsb, .ods)
+    10/18/26; Modified 10/18/26 cached ProbeWorkbook
+    """
+    dProbe = ProbeWorkbook(pf)
+    return None if dProbe is None else list(dProbe['sheet_names'])
+
+def ClearWorkbookProbes():
+    """
+    Clear cached ProbeWorkbook results
+    10/18/26
+    """
+    with lock_probes:
+        dict_workbook_probes.clear()
+
+"""
+================================================================================
+Helper functions
+================================================================================
+"""
+
+def InlineText(elem, ns):
+    """
+    Return text of <si> or <is> element (plain <t> plus rich-text run <t>'s;
+    phonetic <rPh> runs excluded) with _xHHHH_ escapes decoded
+    10/18/26; Modified 10/18/26 decode all escapes (was _x005F_ only)
+    """
+    lst_text = [t.text or '' for t in elem.findall(ns + 't')]
+    lst_text += [t.text or '' for t in elem.findall(ns + 'r/' + ns + 't')]
+    return UnescapeText(''.join(lst_text))
+
+# OOXML string escape for a character as 4 hex digits (e.g. _x000D_ for \r;
+# _x005F_ escapes a literal '_' so _x005F_x000D_ is the text '_x000D_')
+regex_escape = re.compile(r'_x([0-9A-Fa-f]{4})_')
+
+def UnescapeText(text):
+    """
+    Return text with _xHHHH_ escapes decoded to their characters
+    10/18/26
+    """
+    if '_x' not in text: return text
+    return regex_escape.sub(lambda m: chr(int(m.group(1), 16)), text)
+
+# Registered engines (name: opener callable returning workbook handle)
+dict_excel_engines = {'openpyxl':PandasExcelEngine('openpyxl'),
+                      'calamine':PandasExcelEngine('calamine'),
+                      'values':ValuesExcelFile}
+
+# Known differences from openpyxl reads (engines not listed match openpyxl).
+# openpyxl leaves _xHHHH_ string escapes as text (shared strings: strips 'x005F_')
+dict_engine_diffs = {
+    'calamine':['trailing rows of formatted but empty cells kept as all-NaN rows '
+                '(e.g. col_info.xlsx ExcelSteps)',
+                '_xHHHH_ string escapes decoded (e.g. _x000D_ to carriage return)'],
+    'values':['_xHHHH_ string escapes decoded (e.g. _x000D_ to carriage return)']}
@@ -39,7 +39,7 @@ def instance_project_classes(IsTest=False, IsParse=False, IsModel=False):
 def instance_classes_dboard(IsTest=False):
     """
     Instance customized [production-mode] classes for dashboard plots
-    JDL 3/20/25
+    JDL 3/20/25; Modified 10/18/26 IsLazy (tables load on first .df access)
     """
     #Tuples of libs aka *.py filename, module/class name) 
     mods_cls_names = [('libs.projfiles', 'Files'), 
@@ -55,7 +55,7 @@ def instance_classes_dboard(IsTest=False):
     files = Files(proj_abbrev='', subdir_home='most_recent', IsTest=False, subdir_tests='')
 
     ProjectTables = class_objs['ProjectTables']
-    tbls = ProjectTables(files, IsParse=True)
+    tbls = ProjectTables(files, IsParse=True, IsLazy=True)
 
     ParseImports = class_objs['ParseImports']
     parse = ParseImports()
@@ -0,0 +1,254 @@
+#Version 10/18/26
+import os, json, hashlib, shutil, threading, time
+import pandas as pd
+
+"""
+================================================================================
+IngestCache Class -- on-disk cache of Table import and parse results keyed on
+source files' signatures and canonical hash of dImportParams and dParseParams
+================================================================================
+"""
+class IngestCache():
+    """
+    Content-addressed cache of ingested (.df or .lst_dfs) and parsed (.df)
+    Table results stored under path_cache (typically files.path_cache)
+    * key_mode='mtime' keys files on size + modification time
+    * key_mode='hash' keys files on sha1 of file contents
+    * max_bytes (optional) evicts least-recently-used entries beyond limit
+    Frames are stored as feather (pyarrow) if columnar-compatible else pickle
+    Instances sharing a path_cache share one lock; index changes re-read the
+    index under the lock and replace it atomically. Cache hits touch the
+    entry folder (LRU time) instead of rewriting the index
+    10/18/26
+    """
+    # Index file name and dImportParams keys that do not affect results
+    f_index = 'cache_index.json'
+    lst_params_exclude = ['path_cache', 'cache_max_bytes', 'cache_key',
+                          'n_workers', 'worker_mode', 'profile_stage', 'path_profile',
+                          'track_memory', 'path_incremental', 'col_source_file',
+                          'depends_on', 'n_workers_parse']
+
+    def __init__(self, path_cache, max_bytes=None, key_mode='mtime'):
+        self.path_cache = path_cache
+        self.max_bytes = max_bytes
+        self.key_mode = key_mode
+        self.pf_index = self.path_cache + self.f_index
+
+        # dict of entries by key: tbl_name, kind, lst_parts, bytes, last_used
+        self.dict_index = {}
+        self.lock = GetCacheLock(self.path_cache)
+
+        os.makedirs(self.path_cache, exist_ok=True)
+        self.ReadIndex()
+
+    def ReadIndex(self):
+        """
+        Read cache index from .pf_index (empty if none)
+        10/18/26
+        """
+        self.dict_index = {}
+        if os.path.exists(self.pf_index):
+            with open(self.pf_index) as f:
+                self.dict_index = json.load(f)
+
+    def WriteIndex(self):
+        """
+        Write cache index to .pf_index atomically (temp file + rename; call
+        holding .lock)
+        10/18/26
+        """
+        pf_tmp = f'{self.pf_index}.{os.getpid()}_{threading.get_ident()}.tmp'
+        with open(pf_tmp, 'w') as f:
+            json.dump(self.dict_index, f, indent=1)
+        os.replace(pf_tmp, self.pf_index)
+
+    """
+    ============================================================================
+    Cache keys
+    ============================================================================
+    """
+    def BuildKey(self, stage, lst_files, dImportParams, dParseParams):
+        """
+        Return cache key from stage ('import' or 'parse'), source files'
+        signatures and canonical hash of import and parse params
+        10/18/26
+        """
+        dImport = {k:v for k, v in dImportParams.items()
+                   if k not in self.lst_params_exclude}
+        lst_sigs = [self.FileSignature(pf) for pf in lst_files]
+        key_src = [stage, lst_sigs, dImport, dParseParams]
+        return hashlib.sha1(CanonicalJSON(key_src).encode()).hexdigest()
+
+    def FileSignature(self, pf):
+        """
+        Return list identifying file contents (path + size/mtime or sha1)
+        10/18/26
+        """
+        if self.key_mode == 'hash':
+            return [pf, FileContentHash(pf)]
+        stat = os.stat(pf)
+        return [pf, stat.st_size, stat.st_mtime_ns]
+
+    """
+    ============================================================================
+    Load, save, evict and invalidate entries
+    ============================================================================
+    """
+    def Load(self, key):
+        """
+        Return (kind, lst of dfs) for key or None if not cached
+        10/18/26
+        """
+        with self.lock:
+            self.ReadIndex()
+            if key not in self.dict_index: return None
+            entry = self.dict_index[key]
+            try:
+                lst_dfs = [ReadFrame(self.path_cache + key + os.sep + f)
+                           for f in entry['lst_parts']]
+            except (OSError, ValueError):
+                self.RemoveEntry(key)
+                self.WriteIndex()
+                return None
+
+            # Hit: touch entry folder for LRU (index not rewritten)
+            os.utime(self.path_cache + key)
+        return entry['kind'], lst_dfs
+
+    def Save(self, key, tbl_name, kind, lst_dfs):
+        """
+        Save list of dfs as a cache entry and evict beyond .max_bytes
+        10/18/26
+        """
+        with self.lock:
+            self.ReadIndex()
+            if key in self.dict_index: self.RemoveEntry(key)
+            path_entry = self.path_cache + key + os.sep
+            os.makedirs(path_entry, exist_ok=True)
+
+            lst_parts = [WriteFrame(df, path_entry + 'part_' + str(i))
+                         for i, df in enumerate(lst_dfs)]
+            n_bytes = sum(os.path.getsize(path_entry + f) for f in lst_parts)
+
+            self.dict_index[key] = {'tbl_name':tbl_name, 'kind':kind,
+                'lst_parts':lst_parts, 'bytes':n_bytes, 'last_used':time.time()}
+            self.Evict()
+            self.WriteIndex()
+
+    def Evict(self):
+        """
+        Remove least-recently-used entries until total bytes <= .max_bytes
+        10/18/26
+        """
+        if self.max_bytes is None: return
+        lst_keys = sorted(self.dict_index, key=self.LastUsed)
+        n_bytes = sum(entry['bytes'] for entry in self.dict_index.values())
+        for key in lst_keys:
+            if n_bytes <= self.max_bytes: break
+            n_bytes -= self.dict_index[key]['bytes']
+            self.RemoveEntry(key)
+
+    def LastUsed(self, key):
+        """
+        Return entry's last use time (later of save time and last hit's
+        folder touch)
+        10/18/26
+        """
+        try:
+            t_hit = os.path.getmtime(self.path_cache + key)
+        except OSError:
+            t_hit = 0.0
+        return max(self.dict_index[key]['last_used'], t_hit)
+
+    def Invalidate(self, tbl_name=None):
+        """
+        Remove all entries or only those for tbl_name
+        10/18/26
+        """
+        with self.lock:
+            self.ReadIndex()
+            lst_keys = [k for k, entry in self.dict_index.items()
+                        if tbl_name is None or entry['tbl_name'] == tbl_name]
+            for key in lst_keys:
+                self.RemoveEntry(key)
+            self.WriteIndex()
+
+    def RemoveEntry(self, key):
+        """
+        Delete an entry's folder and its index item
+        10/18/26
+        """
+        shutil.rmtree(self.path_cache + key, ignore_errors=True)
+        self.dict_index.pop(key, None)
+
+    @property
+    def total_bytes(self):
+        """
+        Total bytes of cached entries
+        10/18/26
+        """
+        return sum(entry['bytes'] for entry in self.dict_index.values())
+
+"""
+================================================================================
+Helper functions
+================================================================================
+"""
+# Locks by absolute cache folder (shared by all IngestCache instances)
+dict_cache_locks = {}
+lock_cache_locks = threading.Lock()
+
+def GetCacheLock(path_cache):
+    """
+    Return the process-wide reentrant lock for path_cache
+    10/18/26
+    """
+    key = os.path.abspath(path_cache)
+    with lock_cache_locks:
+        if key not in dict_cache_locks: dict_cache_locks[key] = threading.RLock()
+        return dict_cache_locks[key]
+
+def CanonicalJSON(obj):
+    """
+    Return sorted-key JSON string of obj (non-JSON values such as types as repr)
+    10/18/26
+    """
+    return json.dumps(obj, sort_keys=True, default=repr)
+
+def FileContentHash(pf, n_bytes_chunk=2**20):
+    """
+    Return sha1 hex digest of a file's contents
+    10/18/26
+    """
+    sha = hashlib.sha1()
+    with open(pf, 'rb') as f:
+        for chunk in iter(lambda: f.read(n_bytes_chunk), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def WriteFrame(df, pf_stem):
+    """
+    Write df as feather if columnar-compatible (str column names, default
+    index, single-type columns) else as pickle; return file name
+    10/18/26
+    """
+    is_str_cols = all(isinstance(c, str) for c in df.columns)
+    is_default_idx = isinstance(df.index, pd.RangeIndex) and df.index.start == 0 \
+        and df.index.step == 1
+    if is_str_cols and is_default_idx:
+        try:
+            df.to_feather(pf_stem + '.feather')
+            return os.path.basename(pf_stem) + '.feather'
+        except (ImportError, ValueError, TypeError, NotImplementedError):
+            if os.path.exists(pf_stem + '.feather'): os.remove(pf_stem + '.feather')
+
+    df.to_pickle(pf_stem + '.pkl')
+    return os.path.basename(pf_stem) + '.pkl'
+
+def ReadFrame(pf):
+    """
+    Read a cached frame written by WriteFrame
+    10/18/26
+    """
+    if pf.endswith('.feather'): return pd.read_feather(pf)
+    return pd.read_pickle(pf)
@@ -0,0 +1,154 @@
+#Version 10/18/26
+import os, json, hashlib
+from ingest_cache import CanonicalJSON, FileContentHash, WriteFrame, ReadFrame
+
+"""
+================================================================================
+IngestManifest Class -- manifest of a Table's previously ingested files (path,
+size, mtime and content hash) plus its persisted base table for incremental
+sweep-folder ingestion (Table.ImportIncremental)
+================================================================================
+"""
+class IngestManifest():
+    """
+    Manifest and base table stored under path_store (typically
+    files.path_incremental) as <tbl_name>_manifest.json and <tbl_name>_base.*
+    * Files are keyed by lst_files name (before import_path is prepended)
+    * Size/mtime match skips hashing; changed size/mtime with unchanged hash
+      is treated as unchanged
+    * params_key change (import/parse params) invalidates all files
+    10/18/26
+    """
+    def __init__(self, path_store, tbl_name):
+        self.path_store = path_store
+        self.tbl_name = tbl_name
+        self.pf_manifest = path_store + tbl_name + '_manifest.json'
+        self.pf_base_stem = path_store + tbl_name + '_base'
+
+        # dict of file name: {'path', 'size', 'mtime_ns', 'sha1'}
+        self.dict_files = {}
+        self.params_key = None
+        self.f_base = None
+        self.dict_entries_pending = {} # new/changed files' entries from DiffFiles
+
+        os.makedirs(self.path_store, exist_ok=True)
+        self.ReadManifest()
+
+    def ReadManifest(self):
+        """
+        Read .dict_files, .params_key and .f_base from .pf_manifest (if any)
+        10/18/26
+        """
+        if not os.path.exists(self.pf_manifest): return
+        with open(self.pf_manifest) as f:
+            dManifest = json.load(f)
+        self.dict_files = dManifest['files']
+        self.params_key = dManifest['params_key']
+        self.f_base = dManifest['f_base']
+
+    def WriteManifest(self):
+        """
+        Write manifest atomically (temp file + rename)
+        10/18/26
+        """
+        dManifest = {'tbl_name':self.tbl_name, 'params_key':self.params_key,
+                     'f_base':self.f_base, 'files':self.dict_files}
+        with open(self.pf_manifest + '.tmp', 'w') as f:
+            json.dump(dManifest, f, indent=1)
+        os.replace(self.pf_manifest + '.tmp', self.pf_manifest)
+
+    def SetParamsKey(self, dImportParams, dParseParams, lst_params_exclude):
+        """
+        Set .params_key from import/parse params; return True if params
+        changed since last ingestion
+        10/18/26
+        """
+        dImport = {k:v for k, v in dImportParams.items() if k not in lst_params_exclude}
+        key = hashlib.sha1(CanonicalJSON([dImport, dParseParams]).encode()).hexdigest()
+        is_changed = self.params_key is not None and key != self.params_key
+        self.params_key = key
+        return is_changed
+
+    """
+    ============================================================================
+    File diff
+    ============================================================================
+    """
+    def DiffFiles(self, dict_paths):
+        """
+        Return dict of 'new', 'changed', 'deleted' and 'unchanged' file name
+        lists for dict_paths (file name: path) vs manifest; sets
+        .dict_entries_pending with entries for new/changed files
+        10/18/26
+        """
+        dDiff = {'new':[], 'changed':[], 'deleted':[], 'unchanged':[]}
+        self.dict_entries_pending = {}
+        for f, pf in dict_paths.items():
+            stat = os.stat(pf)
+            entry = {'path':pf, 'size':stat.st_size, 'mtime_ns':stat.st_mtime_ns,
+                     'sha1':None}
+            entry_prev = self.dict_files.get(f)
+
+            # Same size and mtime as manifest: unchanged without hashing
+            if entry_prev is not None and entry_prev['size'] == entry['size'] \
+                    and entry_prev['mtime_ns'] == entry['mtime_ns']:
+                dDiff['unchanged'].append(f)
+                continue
+
+            entry['sha1'] = FileContentHash(pf)
+            if entry_prev is None:
+                dDiff['new'].append(f)
+                self.dict_entries_pending[f] = entry
+            elif entry_prev['sha1'] == entry['sha1']:
+                dDiff['unchanged'].append(f)
+                self.dict_files[f] = entry
+            else:
+                dDiff['changed'].append(f)
+                self.dict_entries_pending[f] = entry
+
+        dDiff['deleted'] = [f for f in self.dict_files if f not in dict_paths]
+        return dDiff
+
+    def CommitFiles(self, dDiff):
+        """
+        Update .dict_files for ingested (pending) and deleted files
+        10/18/26
+        """
+        self.dict_files.update(self.dict_entries_pending)
+        for f in dDiff['deleted']: self.dict_files.pop(f, None)
+        self.dict_entries_pending = {}
+
+    """
+    ============================================================================
+    Persisted base table
+    ============================================================================
+    """
+    def ReadBase(self):
+        """
+        Return persisted base table df (None if none)
+        10/18/26
+        """
+        if self.f_base is None: return None
+        pf = self.path_store + self.f_base
+        return ReadFrame(pf) if os.path.exists(pf) else None
+
+    def WriteBase(self, df):
+        """
+        Write base table df (feather or pickle via WriteFrame); remove prior
+        base file if its format changed
+        10/18/26
+        """
+        f_base_prev = self.f_base
+        self.f_base = WriteFrame(df, self.pf_base_stem)
+        if f_base_prev is not None and f_base_prev != self.f_base:
+            pf_prev = self.path_store + f_base_prev
+            if os.path.exists(pf_prev): os.remove(pf_prev)
+
+    def Reset(self):
+        """
+        Remove manifest and base table files and clear manifest
+        10/18/26
+        """
+        for pf in [self.pf_manifest, self.path_store + (self.f_base or '')]:
+            if os.path.isfile(pf): os.remove(pf)
+        self.dict_files, self.params_key, self.f_base = {}, None, None
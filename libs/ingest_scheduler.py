@@ -0,0 +1,251 @@
+#Version 10/18/26
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import pandas as pd
+import instrument
+
+"""
+================================================================================
+IngestScheduler Class -- runs ProjectTables ingestion as a DAG of table stages
+(ColInfo setup, per-table ColInfo apply, import, parse) on a worker pool.
+Independent stages run in parallel; a stage starts once its dependencies
+finish. Tables declare dependencies on other tables (incl. 'ColInfo') with
+dImportParams['depends_on'] (table's first stage waits for their last stage)
+================================================================================
+"""
+class IngestScheduler():
+    """
+    Stage DAG for lst_tbls (default tbls' Excel and CSV inputs) plus ColInfo
+    * col_info (ColumnInfo instance) adds ColInfo 'colinfo_setup' and per-table
+      'colinfo' stages for lst_colinfo_tbls (default tbls.lstExcelImports) as
+      in ColumnInfo.DataIngestionProcedure
+    * Unstructured (non-streaming) tables get a 'parse' stage after 'import'
+    * After Run, .df_schedule has each stage's start/end/wall seconds and
+      .lst_critical_path the longest (by wall time) chain of dependent stages
+    10/18/26
+    """
+    def __init__(self, tbls, lst_tbls=None, col_info=None, lst_colinfo_tbls=None,
+                 n_workers=4):
+        self.tbls = tbls
+        self.col_info = col_info
+        self.n_workers = n_workers
+        if lst_tbls is None: lst_tbls = tbls.lstExcelImports + tbls.lstImportsCSV
+        if lst_colinfo_tbls is None: lst_colinfo_tbls = tbls.lstExcelImports
+        self.lst_tbls = [tbls.ColInfo] + [tbl for tbl in lst_tbls if tbl is not tbls.ColInfo]
+        self.lst_colinfo_names = [tbl.name for tbl in lst_colinfo_tbls] \
+            if col_info is not None else []
+
+        # dict of (table name, stage): {'func', 'deps'} in insertion order
+        self.dict_nodes = {}
+        self.df_schedule = None
+        self.lst_critical_path = None
+        self.BuildGraph()
+
+    """
+    ============================================================================
+    Graph
+    ============================================================================
+    """
+    def BuildGraph(self):
+        """
+        Set .dict_nodes stage functions and dependencies; check depends_on
+        names and cycles
+        10/18/26
+        """
+        dict_stages = {tbl.name:self.TblStages(tbl) for tbl in self.lst_tbls}
+        for tbl in self.lst_tbls:
+            lst_stages = dict_stages[tbl.name]
+            lst_deps = []
+            if tbl.name in self.lst_colinfo_names:
+                lst_deps.append(('ColInfo', dict_stages['ColInfo'][-1][0]))
+            for name in self.DependsOn(tbl):
+                if name not in dict_stages:
+                    raise ValueError(f"{tbl.name}: depends_on table not scheduled: {name}")
+                lst_deps.append((name, dict_stages[name][-1][0]))
+
+            # Each stage depends on the table's previous stage
+            for stage, func in lst_stages:
+                self.dict_nodes[(tbl.name, stage)] = {'func':func, 'deps':lst_deps}
+                lst_deps = [(tbl.name, stage)]
+        self.TopoOrder()
+
+    def TblStages(self, tbl):
+        """
+        Return list of (stage, func) for tbl in run order
+        10/18/26
+        """
+        if tbl is self.tbls.ColInfo:
+            lst_stages = [('import', tbl.EnsureLoaded)]
+            if self.col_info is not None:
+                lst_stages.append(('colinfo_setup', self.SetFlagColsStage))
+            return lst_stages
+
+        lst_stages = []
+        if tbl.name in self.lst_colinfo_names:
+            lst_stages.append(('colinfo', lambda: self.SetTblImportColsStage(tbl)))
+        if 'path_incremental' in tbl.dImportParams:
+            return lst_stages + [('import', tbl.ImportIncremental)]
+
+        lst_stages.append(('import', tbl.ImportToTblDf))
+        if self.IsParsed(tbl): lst_stages.append(('parse', tbl.ParseRawData))
+        return lst_stages
+
+    def DependsOn(self, tbl):
+        """
+        Return list of table names from tbl.dImportParams['depends_on']
+        10/18/26
+        """
+        depends_on = tbl.dImportParams.get('depends_on', [])
+        return depends_on if isinstance(depends_on, list) else [depends_on]
+
+    def IsParsed(self, tbl):
+        """
+        Return True if tbl's raw import needs a separate ParseRawData stage
+        (unstructured, parse_type set and not parsed while streaming)
+        10/18/26
+        """
+        dParse = tbl.dParseParams
+        return bool(dParse.get('is_unstructured')) and \
+            dParse.get('parse_type', 'none') != 'none' and \
+            not (dParse.get('parse_type') == 'row_major' and dParse.get('is_streaming_parse'))
+
+    def TopoOrder(self):
+        """
+        Return list of node keys in dependency order; raise ValueError if the
+        graph has a cycle
+        10/18/26
+        """
+        dict_n_deps = {node:len(d['deps']) for node, d in self.dict_nodes.items()}
+        dict_children = {node:[] for node in self.dict_nodes}
+        for node, d in self.dict_nodes.items():
+            for dep in d['deps']: dict_children[dep].append(node)
+
+        lst_order = [node for node, n in dict_n_deps.items() if n == 0]
+        for node in lst_order:
+            for child in dict_children[node]:
+                dict_n_deps[child] -= 1
+                if dict_n_deps[child] == 0: lst_order.append(child)
+
+        if len(lst_order) < len(self.dict_nodes):
+            lst_cycle = sorted({node[0] for node, n in dict_n_deps.items() if n > 0})
+            raise ValueError(f"depends_on cycle among tables: {lst_cycle}")
+        return lst_order
+
+    """
+    ============================================================================
+    ColInfo stages (timed as 'colinfo_setup' like DataIngestionProcedure)
+    ============================================================================
+    """
+    def SetFlagColsStage(self):
+        """
+        Convert ColInfo flag columns to boolean
+        10/18/26
+        """
+        with instrument.TimeStage(self.tbls.ColInfo, 'colinfo_setup'):
+            self.col_info.SetFlagColsBoolean(self.tbls)
+
+    def SetTblImportColsStage(self, tbl):
+        """
+        Set tbl's ColInfo keep columns, renames, types and defaults
+        10/18/26
+        """
+        with instrument.TimeStage(tbl, 'colinfo_setup'):
+            self.col_info.SetTblImportCols(self.tbls, tbl.name)
+
+    """
+    ============================================================================
+    Run and critical path
+    ============================================================================
+    """
+    def Run(self):
+        """
+        Run stages on a worker pool as their dependencies finish; set
+        .df_schedule and .lst_critical_path. A failed stage cancels stages
+        not yet started and raises RuntimeError naming the table and stage
+        10/18/26
+        """
+        dict_times = {}
+        dict_n_deps = {node:len(d['deps']) for node, d in self.dict_nodes.items()}
+        t_run0 = time.perf_counter()
+
+        def RunNode(node):
+            t0 = time.perf_counter() - t_run0
+            self.dict_nodes[node]['func']()
+            dict_times[node] = (t0, time.perf_counter() - t_run0)
+
+        # Own pool (stages may submit file reads to the shared worker pools)
+        with ThreadPoolExecutor(max_workers=self.n_workers,
+                                thread_name_prefix='ingest_dag') as pool:
+            dict_futures = {pool.submit(RunNode, node):node
+                            for node, n in dict_n_deps.items() if n == 0}
+            while dict_futures:
+                set_done, _ = wait(dict_futures, return_when=FIRST_COMPLETED)
+                for future in set_done:
+                    node = dict_futures.pop(future)
+                    self.RaiseIfFailed(future, node, dict_futures)
+                    for child in self.Children(node):
+                        dict_n_deps[child] -= 1
+                        if dict_n_deps[child] == 0:
+                            dict_futures[pool.submit(RunNode, child)] = child
+
+        self.SetSchedule(dict_times)
+        return self.df_schedule
+
+    def RaiseIfFailed(self, future, node, dict_futures):
+        """
+        Cancel pending stages and raise RuntimeError if future failed
+        10/18/26
+        """
+        e = future.exception()
+        if e is None: return
+        for future_pending in dict_futures: future_pending.cancel()
+        msg = f"{node[0]}: failed stage {node[1]}"
+        raise RuntimeError(f"{msg} ({type(e).__name__}: {e})") from e
+
+    def Children(self, node):
+        """
+        Return list of nodes that depend on node
+        10/18/26
+        """
+        return [child for child, d in self.dict_nodes.items() if node in d['deps']]
+
+    def SetSchedule(self, dict_times):
+        """
+        Set .lst_critical_path (chain of dependent stages with the largest
+        total wall time) and .df_schedule (table, stage, deps, start, end,
+        wall and is_critical per stage in dependency order)
+        10/18/26
+        """
+        # Longest chain ending at each node and its predecessor on that chain
+        dict_cp, dict_prev = {}, {}
+        for node in self.TopoOrder():
+            start, end = dict_times[node]
+            lst_deps = self.dict_nodes[node]['deps']
+            prev = max(lst_deps, key=lambda dep: dict_cp[dep], default=None)
+            dict_prev[node] = prev
+            dict_cp[node] = (end - start) + (dict_cp[prev] if prev is not None else 0.0)
+
+        node = max(dict_cp, key=dict_cp.get) if dict_cp else None
+        self.lst_critical_path = []
+        while node is not None:
+            self.lst_critical_path.insert(0, node)
+            node = dict_prev[node]
+
+        rows = []
+        for node in self.TopoOrder():
+            start, end = dict_times[node]
+            rows.append({'table':node[0], 'stage':node[1],
+                'deps':[f'{dep[0]}.{dep[1]}' for dep in self.dict_nodes[node]['deps']],
+                'start':start, 'end':end, 'wall':end - start,
+                'is_critical':node in self.lst_critical_path})
+        lst_cols = ['table', 'stage', 'deps', 'start', 'end', 'wall', 'is_critical']
+        self.df_schedule = pd.DataFrame(rows, columns=lst_cols)
+
+    def CriticalPathSummary(self):
+        """
+        Return df of critical path wall seconds by table (largest first; the
+        first table limits end-to-end ingest time)
+        10/18/26
+        """
+        df = self.df_schedule[self.df_schedule['is_critical']]
+        return df.groupby('table', sort=False)['wall'].sum().sort_values(ascending=False)
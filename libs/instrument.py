@@ -0,0 +1,182 @@
+#Version 10/18/26
+import os, time, cProfile, functools, threading, tracemalloc
+from contextlib import contextmanager
+import pandas as pd
+
+"""
+================================================================================
+Ingestion stage timings -- wall and CPU seconds per stage accumulated in
+tbl.timings (dict of stage: {'wall', 'cpu', 'n_calls'}). Stages may nest (e.g.
+'import' includes 'read_file'). Optional cProfile hook runs around
+dImportParams['profile_stage'] and writes stats under
+dImportParams['path_profile'] (typically files.path_profile)
+
+Optional memory accounting (dImportParams['track_memory']) appends one row per
+stage call to tbl.memory: tracemalloc peak and retained bytes above the
+stage's starting traced memory plus deep memory of tbl.df, .df_raw and
+.lst_dfs after the stage. Off by default (no tracemalloc overhead)
+================================================================================
+"""
+@contextmanager
+def TimeStage(tbl, stage):
+    """
+    Context manager to add wall/CPU time of with-block to tbl.timings[stage]
+    (and profile it if stage is tbl's profile_stage; track memory if
+    tbl's track_memory)
+    10/18/26
+    """
+    profiler = StartProfiler(tbl, stage)
+    mem = StartMemory() if tbl.dImportParams.get('track_memory') else None
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+        if mem is not None: StopMemory(tbl, stage, mem)
+        if profiler is not None: StopProfiler(tbl, stage, profiler)
+        AddTiming(tbl.timings, stage, wall, cpu)
+
+def Timed(stage):
+    """
+    Decorator to time a method as stage on its Table (self, or self.tbl for
+    parsing classes)
+    10/18/26
+    """
+    def Decorator(method):
+        @functools.wraps(method)
+        def Wrapper(self, *args, **kwargs):
+            with TimeStage(getattr(self, 'tbl', self), stage):
+                return method(self, *args, **kwargs)
+        return Wrapper
+    return Decorator
+
+def AddTiming(timings, stage, wall, cpu):
+    """
+    Add wall and CPU seconds and a call count to timings[stage]
+    10/18/26
+    """
+    if stage not in timings: timings[stage] = {'wall':0.0, 'cpu':0.0, 'n_calls':0}
+    timings[stage]['wall'] += wall
+    timings[stage]['cpu'] += cpu
+    timings[stage]['n_calls'] += 1
+
+def StartProfiler(tbl, stage):
+    """
+    Return enabled cProfile.Profile if stage is dImportParams['profile_stage']
+    (profile accumulates over repeated calls to the stage); else None
+    10/18/26
+    """
+    if tbl.dImportParams.get('profile_stage') != stage: return None
+    if tbl.profiler is None: tbl.profiler = cProfile.Profile()
+    tbl.profiler.enable()
+    return tbl.profiler
+
+def StopProfiler(tbl, stage, profiler):
+    """
+    Disable profiler and write its cumulative stats to
+    <path_profile><tbl.name>_<stage>.prof (read with pstats.Stats)
+    10/18/26
+    """
+    profiler.disable()
+    path_profile = tbl.dImportParams.get('path_profile', '')
+    if path_profile: os.makedirs(path_profile, exist_ok=True)
+    tbl.pf_profile = path_profile + f'{tbl.name}_{stage}.prof'
+    profiler.dump_stats(tbl.pf_profile)
+
+"""
+================================================================================
+Memory accounting helpers -- open stages in all threads share one process-wide
+tracemalloc session (started when the first stage opens, stopped when the last
+closes). Peaks are carried to every open stage before tracemalloc's peak is
+reset, so nested and concurrent stages keep their peaks. With concurrent
+stages (e.g. ImportScheduled) rows include other threads' allocations
+================================================================================
+"""
+lock_mem = threading.Lock()
+lst_mem_open = [] # open stage entries (all threads)
+mem_state = {'is_owner':False} # True if StartMemory started tracemalloc
+
+def StartMemory():
+    """
+    Start tracemalloc if first open stage and not tracing; add and return
+    stage entry with starting traced bytes
+    10/18/26; Modified 10/18/26 shared across threads
+    """
+    with lock_mem:
+        if not lst_mem_open and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            mem_state['is_owner'] = True
+
+        # Carry peak so far to open stages before resetting peak
+        current, _ = CarryPeak()
+        tracemalloc.reset_peak()
+
+        entry = {'base':current, 'peak':current, 'ident':threading.get_ident()}
+        lst_mem_open.append(entry)
+        return entry
+
+def StopMemory(tbl, stage, entry):
+    """
+    Remove stage entry and append stage memory row to tbl.memory (stop
+    tracemalloc if last open stage and StartMemory started it)
+    10/18/26; Modified 10/18/26 shared across threads
+    """
+    with lock_mem:
+        current, _ = CarryPeak()
+        lst_mem_open.remove(entry)
+        tbl.memory.append({'stage':stage, 'peak_bytes':entry['peak'] - entry['base'],
+                           'retained_bytes':current - entry['base'], **TblMemory(tbl)})
+
+        # Exclude deep memory_usage allocations from enclosing stages' peaks
+        # (peak kept if other threads' stages may have allocated meanwhile)
+        if not lst_mem_open:
+            if mem_state['is_owner']: tracemalloc.stop()
+            mem_state['is_owner'] = False
+        elif all(d['ident'] == entry['ident'] for d in lst_mem_open):
+            tracemalloc.reset_peak()
+
+def CarryPeak():
+    """
+    Set open stage entries' peaks to at least the current traced peak;
+    return (current, peak) traced bytes (call holding lock_mem)
+    10/18/26
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    for d in lst_mem_open: d['peak'] = max(d['peak'], peak)
+    return current, peak
+
+def TblMemory(tbl):
+    """
+    Return dict of deep memory bytes of tbl.df, tbl.df_raw and tbl.lst_dfs
+    10/18/26
+    """
+    return {'df_bytes':FrameBytes(tbl.df), 'df_raw_bytes':FrameBytes(tbl.df_raw),
+            'lst_dfs_bytes':sum(FrameBytes(df) for df in tbl.lst_dfs or [])}
+
+def FrameBytes(df):
+    """
+    Return deep memory bytes of df (incl. index) or Arrow table (0 if None)
+    10/18/26
+    """
+    if isinstance(df, pd.DataFrame): return int(df.memory_usage(deep=True).sum())
+    return int(getattr(df, 'nbytes', 0))
+
+def MemoryDf(lst_tbls):
+    """
+    Return df of memory rows with one row per table and stage call
+    10/18/26
+    """
+    lst_cols = ['table', 'stage', 'peak_bytes', 'retained_bytes', 'df_bytes',
+                'df_raw_bytes', 'lst_dfs_bytes']
+    rows = [{'table':tbl.name, **dMem} for tbl in lst_tbls for dMem in tbl.memory]
+    return pd.DataFrame(rows, columns=lst_cols)
+
+def TimingsDf(lst_tbls):
+    """
+    Return df of timings with one row per table and stage (in recorded order)
+    10/18/26
+    """
+    lst_cols = ['table', 'stage', 'wall', 'cpu', 'n_calls']
+    rows = [{'table':tbl.name, 'stage':stage, **dTiming}
+            for tbl in lst_tbls for stage, dTiming in tbl.timings.items()]
+    return pd.DataFrame(rows, columns=lst_cols)
@@ -3,13 +3,20 @@ import pandas as pd
 import numpy as np
 import io
 import contextlib
+import itertools
+import excel_engines
 
-def dfExcelImport(sPF, sht=0, skiprows=None, IsDeleteBlankCols=False):
+def dfExcelImport(sPF, sht=0, skiprows=None, IsDeleteBlankCols=False, engine=None,
+                  dtype_backend=None):
     """
     Import an Excel file optionally from specified sheet; delete extraneous columns
     Modified 12/5/23 to convert column names to strings in case they are integers
+    Modified 10/18/26 optional reader engine (see excel_engines) and
+    dtype_backend (e.g. 'pyarrow')
     """
-    df = pd.read_excel(sPF, sheet_name=sht, skiprows=skiprows)
+    with excel_engines.OpenExcelFile(sPF, engine) as xl:
+        df = xl.parse(sheet_name=sht, skiprows=skiprows,
+                      **BackendKwds(dtype_backend))
 
     #Delete Unnamed columns that result from Excel UsedRange bigger than detected data
     if IsDeleteBlankCols:
@@ -17,6 +24,286 @@ def dfExcelImport(sPF, sht=0, skiprows=None, IsDeleteBlankCols=False):
         df = df.drop(lst_drop, axis=1)
     return df
 
+"""
+ColInfo type strings mapped to dtypes (safe lookup vs eval of type strings)
+Keys are lower case except pandas nullable names (e.g. 'Int64' vs numpy
+'int64'); read-time dtypes can be passed to read_csv/read_excel
+"""
+dict_dtypes = {'str':str, 'object':object, 'string':'string',
+    'int':'int64', 'np.int64':'int64', 'np.int32':'int32', 'np.int16':'int16',
+    'np.int8':'int8', 'pd.int64dtype()':'Int64', 'pd.int32dtype()':'Int32',
+    'int64':'int64', 'int32':'int32', 'nullable_int':'Int64',
+    'Int64':'Int64', 'Int32':'Int32', 'pd.Int64Dtype()':'Int64', 'pd.Int32Dtype()':'Int32',
+    'float':'float64', 'np.float64':'float64', 'np.float32':'float32',
+    'float64':'float64', 'float32':'float32',
+    'bool':'bool', 'np.bool':'bool', 'np.bool_':'bool', 'boolean':'boolean',
+    'date':'datetime64[ns]', 'datetime':'datetime64[ns]',
+    'datetime64[ns]':'datetime64[ns]', 'category':'category'}
+
+# Types converted after read (readers' dtype= cannot parse dates or 1/blank
+# flags; non-nullable ints are set after blanks are filled with defaults)
+lst_dtypes_post_read = ['datetime64[ns]', 'bool', 'boolean',
+                        'int64', 'int32', 'int16', 'int8']
+
+def ResolveDtype(type_str):
+    """
+    Return dtype for a ColInfo type string (e.g. 'str', 'np.int64', 'date');
+    case-sensitive match first so nullable 'Int64' is not numpy 'int64'
+    10/18/26; Modified 10/18/26 case-sensitive lookup first
+    """
+    key = str(type_str).strip()
+    if key in dict_dtypes: return dict_dtypes[key]
+    if key.lower() not in dict_dtypes:
+        raise ValueError(f"Unrecognized ColInfo type: {type_str}")
+    return dict_dtypes[key.lower()]
+
+def SplitReadDtypes(dict_types):
+    """
+    Resolve dict of column:type string and split into dicts of dtypes to
+    pass to readers (dtype=) and to set after read with one df.astype()
+    10/18/26
+    """
+    dict_read, dict_post = {}, {}
+    for col, type_str in dict_types.items():
+        dtype = ResolveDtype(type_str)
+        if dtype in lst_dtypes_post_read:
+            dict_post[col] = dtype
+        else:
+            dict_read[col] = dtype
+    return dict_read, dict_post
+
+def AstypePostRead(df, dict_post):
+    """
+    Return df with post-read dtypes set in one astype; bool columns are
+    recoded from 1/blank flags first (blank as False vs astype's NaN as True)
+    10/18/26
+    """
+    dict_post = {k:v for k, v in dict_post.items() if k in df}
+    for col, dtype in dict_post.items():
+        if dtype == 'bool' or str(dtype) == 'bool[pyarrow]':
+            ser = RecodeFlagColToBool(df[col])
+            if ser is None: ser = df[col].fillna(False)
+            df = df.assign(**{col:ser})
+    return df.astype(dict_post)
+
+"""
+Arrow dtype backend -- readers return pyarrow-backed columns (pd.ArrowDtype)
+with dtype_backend='pyarrow'; ColInfo dtypes are mapped to Arrow equivalents
+so read-time and post-read types keep columns Arrow-backed (object and
+category are left as is)
+"""
+lst_dtype_backends = [None, 'numpy_nullable', 'pyarrow']
+
+def BackendKwds(dtype_backend):
+    """
+    Return reader kwargs dict for dtype_backend (empty if None; pandas
+    readers reject dtype_backend=None)
+    10/18/26
+    """
+    if dtype_backend not in lst_dtype_backends:
+        raise ValueError(f"dtype_backend must be one of {lst_dtype_backends}: {dtype_backend}")
+    return {} if dtype_backend is None else {'dtype_backend':dtype_backend}
+
+def ArrowDtype(dtype):
+    """
+    Return pd.ArrowDtype equivalent of a resolved ColInfo dtype (e.g. str ->
+    string[pyarrow], 'datetime64[ns]' -> timestamp[ns][pyarrow]); object and
+    category are returned unchanged
+    10/18/26
+    """
+    import pyarrow as pa
+    dict_arrow = {'string':pa.string(), 'int64':pa.int64(), 'int32':pa.int32(),
+        'int16':pa.int16(), 'int8':pa.int8(), 'Int64':pa.int64(), 'Int32':pa.int32(),
+        'float64':pa.float64(), 'float32':pa.float32(), 'bool':pa.bool_(),
+        'boolean':pa.bool_(), 'datetime64[ns]':pa.timestamp('ns')}
+    key = 'string' if dtype is str else dtype
+    if isinstance(key, str) and key in dict_arrow: return pd.ArrowDtype(dict_arrow[key])
+    return dtype
+
+def ArrowDtypes(dict_dtypes):
+    """
+    Return dict of column: ArrowDtype(dtype) for dict of column: dtype
+    10/18/26
+    """
+    return {col:ArrowDtype(dtype) for col, dtype in dict_dtypes.items()}
+
+def IsArrowCol(ser):
+    """
+    Return True if Series ser is pyarrow-backed
+    10/18/26
+    """
+    return isinstance(ser.dtype, pd.ArrowDtype)
+
+def ArrowFillValue(ser, value):
+    """
+    Return fill value compatible with Arrow-backed ser (str for string
+    columns, e.g. a numeric ColInfo val_default; else value)
+    10/18/26
+    """
+    if IsArrowCol(ser) and pd.api.types.is_string_dtype(ser.dtype):
+        return CellToStr(value)
+    return value
+
+def CellToStr(x):
+    """
+    Convert a cell value to str (None for blank; integral float as int str)
+    10/18/26
+    """
+    if pd.isna(x): return None
+    if isinstance(x, float) and x.is_integer(): return str(int(x))
+    return str(x)
+
+def DfToStr(df):
+    """
+    Convert df values to str column-by-column (vectorized equivalent of
+    df.astype(object).map(CellToStr))
+    10/18/26
+    """
+    dict_cols = {i:ColToStr(df.iloc[:, i]) for i in range(df.shape[1])}
+    df_str = pd.DataFrame(dict_cols, index=df.index)
+    df_str.columns = df.columns
+    return df_str
+
+def ColToStr(ser):
+    """
+    Return object array of str values for a Series (see CellToStr)
+    10/18/26
+    """
+    arr = ser.to_numpy()
+    is_na = pd.isna(arr)
+
+    # Float cols; int and bool cols format same as Python scalars
+    if arr.dtype.kind == 'f':
+        out = FloatsToStr(arr)
+    elif arr.dtype.kind in 'iub':
+        out = ObjsToStr(arr.tolist())
+
+    # Object (mixed) cols: float cells formatted as floats; others with str()
+    elif arr.dtype.kind == 'O':
+        is_float = np.fromiter(map(isinstance, arr, itertools.repeat(float)),
+                               dtype=bool, count=len(arr))
+        out = np.empty(len(arr), dtype=object)
+        out[~is_float] = ObjsToStr(arr[~is_float])
+        out[is_float] = FloatsToStr(arr[is_float].astype(np.float64))
+
+    # Other (e.g. datetime64) cols format as their scalar types per cell
+    else:
+        out = np.array([CellToStr(x) for x in ser.astype(object)], dtype=object)
+
+    out[is_na] = None
+    return out
+
+def FloatsToStr(arr):
+    """
+    Return object array of str for float array (integral values as int str);
+    formats each unique value once (repeated values typical in tabular data)
+    10/18/26
+    """
+    codes, uniques = pd.factorize(arr, use_na_sentinel=False)
+    out = np.empty(len(uniques), dtype=object)
+    is_int = np.isfinite(uniques) & (np.floor(uniques) == uniques)
+
+    # int64 cast for integral values in range; Python int for larger ones
+    is_int64 = is_int & (np.abs(uniques) < 2**63)
+    out[is_int64] = ObjsToStr(uniques[is_int64].astype(np.int64).tolist())
+    out[is_int & ~is_int64] = ObjsToStr(map(int, uniques[is_int & ~is_int64].tolist()))
+    out[~is_int] = ObjsToStr(uniques[~is_int].tolist())
+    return out[codes]
+
+def ObjsToStr(iter_vals):
+    """
+    Return object array of str() of values (vs numpy fixed-width str array)
+    10/18/26
+    """
+    return np.fromiter(map(str, iter_vals), dtype=object)
+
+"""
+Memory optimization -- categoricals for low-cardinality strings, smallest safe
+numeric widths and 1/blank flags as bool. dict_hints maps columns to 'category',
+'bool' or 'keep' (skip); unhinted columns are optimized by dtype
+"""
+# Flag cell values recoded to True (other non-blank values prevent recoding)
+lst_flag_true = [1, True, '1', 'true', 'yes', 'y', 'x']
+lst_flag_false = [0, False, '0', 'false', 'no', 'n', '']
+
+def OptimizeDfMemory(df, dict_hints=None, cat_threshold=0.5):
+    """
+    Return (df with compact column dtypes, df report of bytes before/after
+    and saved per column)
+    10/18/26
+    """
+    dict_hints = dict_hints or {}
+    ser_before = df.memory_usage(deep=True, index=False)
+    dtypes_before = df.dtypes
+
+    # Shallow copy so input df columns are not replaced
+    df = df.copy(deep=False)
+    for col in df.columns:
+        ser = OptimizeCol(df[col], dict_hints.get(col), cat_threshold)
+        if ser is not None: df[col] = ser
+
+    ser_after = df.memory_usage(deep=True, index=False)
+    df_report = pd.DataFrame({'dtype_before':dtypes_before.astype(str),
+        'dtype_after':df.dtypes.astype(str), 'bytes_before':ser_before,
+        'bytes_after':ser_after, 'bytes_saved':ser_before - ser_after})
+    return df, df_report.rename_axis('col')
+
+def OptimizeCol(ser, hint=None, cat_threshold=0.5):
+    """
+    Return compact version of Series ser (or None if unchanged) based on hint
+    or dtype: flags to bool, numerics downcast and low-cardinality strings
+    (nunique <= cat_threshold * non-null count) to category
+    10/18/26
+    """
+    if hint == 'keep': return None
+    if hint == 'bool': return RecodeFlagColToBool(ser)
+    if hint == 'category':
+        return None if isinstance(ser.dtype, pd.CategoricalDtype) else ser.astype('category')
+
+    kind = ser.dtype.kind
+    if kind in 'iu' or (kind == 'f' and not ser.dtype == 'float32'):
+        return DowncastNumeric(ser)
+    if ser.dtype == object or isinstance(ser.dtype, pd.StringDtype) or \
+            (IsArrowCol(ser) and pd.api.types.is_string_dtype(ser.dtype)):
+        n_valid = ser.count()
+        if n_valid > 0 and ser.nunique() <= cat_threshold * n_valid:
+            return ser.astype('category')
+    return None
+
+def DowncastNumeric(ser):
+    """
+    Return Series downcast to smallest signed int (ints) or to float32 if
+    lossless (floats); None if no smaller width is safe (Arrow-backed
+    columns stay Arrow-backed)
+    10/18/26
+    """
+    if ser.dtype.kind in 'iu':
+        # Signed downcast only (unsigned ints wrap on subtraction)
+        ser_new = pd.to_numeric(ser, downcast='integer')
+    else:
+        ser_new = ser.astype(ArrowDtype('float32') if IsArrowCol(ser) else 'float32')
+        is_same = (ser_new.astype(ser.dtype) == ser) | (ser.isna() & ser_new.isna())
+        if not is_same.all(): return None
+    return None if ser_new.dtype == ser.dtype else ser_new
+
+def RecodeFlagColToBool(ser):
+    """
+    Return bool Series for 1/blank (or True/False-like) flag column; None if
+    already bool or if any value is not flag-like
+    10/18/26
+    """
+    if ser.dtype == bool: return None
+    vals = ser.to_numpy(dtype=object)
+    is_na = pd.isna(vals)
+    ser_lower = pd.Series(vals[~is_na]).map(lambda x: x.strip().lower()
+                                            if isinstance(x, str) else x)
+    is_true = ser_lower.isin(lst_flag_true).to_numpy()
+    if not (is_true | ser_lower.isin(lst_flag_false).to_numpy()).all(): return None
+
+    arr = np.zeros(len(ser), dtype=bool)
+    arr[np.flatnonzero(~is_na)[is_true]] = True
+    return pd.Series(arr, index=ser.index, name=ser.name)
+
 def Df_Roundup(df, n_decimals):
     """
     Roundup df values based on n_decimals precision
@@ -49,6 +49,9 @@ class Files():
         self.subdir_tests = subdir_tests #optional path to tests subfolder
         self.path_subdir_home = '' #optional path to home subfolder (within proj_case_studies)
         self.pathfile_error_codes = '' #path to ErrorCodes.xlsx
+        self.path_cache = '' #on-disk cache of ingested/parsed tables
+        self.path_profile = '' #cProfile stats from ingestion profile hook
+        self.path_incremental = '' #incremental ingestion manifests/base tables
 
         #Optional subdirectory within tests folder - to contain issue-specific files
         if IsTest: self.subdir_tests = subdir_tests
@@ -100,6 +103,18 @@ class Files():
         #Error codes file location
         self.pathfile_error_codes = self.path_data + 'ErrorCodes.xlsx'
 
+        #Ingestion cache (Table dImportParams['path_cache'])
+        self.path_cache = self.path_root + 'cache' + os.sep
+        if self.IsTest: self.path_cache = self.path_data + 'cache' + os.sep
+
+        #Ingestion profiler stats (ProjectTables.SetProfileHook)
+        self.path_profile = self.path_root + 'profiles' + os.sep
+        if self.IsTest: self.path_profile = self.path_data + 'profiles' + os.sep
+
+        #Incremental sweep-folder ingestion (Table dImportParams['path_incremental'])
+        self.path_incremental = self.path_root + 'incremental' + os.sep
+        if self.IsTest: self.path_incremental = self.path_data + 'incremental' + os.sep
+
     def SetProjectSpecificPaths(self):
         """
         Project specific directories and files
@@ -136,6 +151,9 @@ class Files():
       print('files.path_case_studies\n', self.path_case_studies, '\n')
       print('files.path_home\n', self.path_home, '\n')
       print('files.path_libs\n', self.path_libs, '\n')
+      print('files.path_cache\n', self.path_cache, '\n')
+      print('files.path_profile\n', self.path_profile, '\n')
+      print('files.path_incremental\n', self.path_incremental, '\n')
       if self.IsTest:
         print('files.path_tests\n', self.path_tests, '\n')
 
@@ -1,13 +1,22 @@
 #Version 4/21/25
-import os, sys
+import os, sys, threading, glob, re, asyncio, atexit
 import pandas as pd
 import numpy as np
 from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
 import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 path_libs = os.getcwd() + os.sep + 'libs' + os.sep
 if not path_libs in sys.path: sys.path.append(path_libs)
 import pd_util
+from ingest_cache import IngestCache
+from ingest_manifest import IngestManifest
+from ingest_scheduler import IngestScheduler
+import excel_engines
+import instrument
+from instrument import Timed
 
 """
 ================================================================================
@@ -21,18 +30,30 @@ JDL 9/3/24
 class ProjectTables():
     """
     Collection of imported or generated data tables for a project
-    JDL 9/26/24; Modified 4/9/25
+    (IsLazy=True defers each table's import/parse to first access of tbl.df;
+    dtype_backend='pyarrow' reads input tables to Arrow-backed columns)
+    JDL 9/26/24; Modified 4/9/25; 10/18/26 IsLazy, dtype_backend
     """
-    def __init__(self, files, IsPrint=False):
+    def __init__(self, files, IsPrint=False, IsLazy=False, dtype_backend=None):
         """
         Instance attributes including Table instances
         """
         self.IsPrint = IsPrint
+        self.IsLazy = IsLazy
+        self.dtype_backend = dtype_backend
+        self.pool_prefetch = None
         self.files = files
 
         #Instance project-specific tables and ColInfo
         self.InstanceTblObjs()
         self.InstanceAndImportColInfo()
+
+        #Reader dtype backend for input tables (ColInfo read NumPy-backed)
+        self.SetDtypeBackend(self.dtype_backend)
+
+        #Lazy mode: input tables load on first .df access
+        if self.IsLazy:
+            for tbl in self.lstExcelImports + self.lstImportsCSV: tbl.SetLazy()
         
     def InstanceTblObjs(self):
         """
@@ -46,13 +67,15 @@ class ProjectTables():
                         'ftype': 'excel',
                         'sht':'data'}
 
+        # Each table gets its own dict (ColumnInfo sets table-specific items)
         dImportParams['lst_files'] = 'Example1.xlsx'
-        self.ExampleTbl1 = Table('ExampleTbl1', dImportParams)
+        self.ExampleTbl1 = Table('ExampleTbl1', dImportParams.copy())
 
         dImportParams['lst_files'] = 'Example2.xlsx'
-        self.ExampleTbl2 = Table('ExampleTbl2', dImportParams)
+        self.ExampleTbl2 = Table('ExampleTbl2', dImportParams.copy())
 
         self.lstExcelImports = [self.ExampleTbl1, self.ExampleTbl2]
+        self.lstImportsCSV = []
 
     def InstanceAndImportColInfo(self):
         """
@@ -66,21 +89,99 @@ class ProjectTables():
                         'sht':'cols'}
 
         self.ColInfo = Table('ColInfo', dImportParams)
-        self.ColInfo.ImportToTblDf()
+        if self.IsLazy:
+            self.ColInfo.SetLazy()
+        else:
+            self.ColInfo.ImportToTblDf()
         #self.ImportExcelInputs(lstExcelImports=[self.ColInfo])
         #self.ColInfo.ImportToTblDf_New()
 
+    def SetDtypeBackend(self, dtype_backend, lst_tbls=None):
+        """
+        Set dImportParams['dtype_backend'] for lst_tbls (default Excel and
+        CSV inputs; None removes it); takes effect at each table's next import
+        10/18/26; Modified 10/18/26 default excludes ColInfo
+        """
+        pd_util.BackendKwds(dtype_backend)
+        if lst_tbls is None: lst_tbls = self.lstExcelImports + self.lstImportsCSV
+        for tbl in lst_tbls:
+            if dtype_backend is None:
+                tbl.dImportParams.pop('dtype_backend', None)
+            else:
+                tbl.dImportParams['dtype_backend'] = dtype_backend
+
+    def LstTables(self):
+        """
+        Return list of Table instances that are tbls attributes
+        10/18/26
+        """
+        return [val for val in vars(self).values() if isinstance(val, Table)]
+
+    def Prefetch(self, lst_tbls=None, n_workers=2):
+        """
+        Load lazy tables (default all not yet loaded) in background threads;
+        return list of futures (tbl.df access waits for an in-progress load)
+        10/18/26
+        """
+        if lst_tbls is None: lst_tbls = self.LstTables()
+        lst_tbls = [tbl for tbl in lst_tbls if tbl.is_lazy and not tbl.is_loaded]
+
+        # Own pool (loads may submit file reads to the shared worker pools)
+        if self.pool_prefetch is None:
+            self.pool_prefetch = ThreadPoolExecutor(max_workers=n_workers,
+                                                    thread_name_prefix='prefetch')
+        return [self.pool_prefetch.submit(tbl.EnsureLoaded) for tbl in lst_tbls]
+
+    def TimingsSummary(self):
+        """
+        Return df of all tables' stage timings (table, stage, wall, cpu, n_calls)
+        10/18/26
+        """
+        return instrument.TimingsDf(self.LstTables())
+
+    def MemorySummary(self):
+        """
+        Return df of all tables' stage memory rows (tracemalloc peak/retained
+        bytes and deep df/df_raw/lst_dfs bytes; empty unless tracking is on)
+        10/18/26
+        """
+        return instrument.MemoryDf(self.LstTables())
+
+    def SetMemoryTracking(self, IsTrack=True, lst_tbls=None):
+        """
+        Turn stage memory accounting on or off for lst_tbls (default all tables)
+        10/18/26
+        """
+        if lst_tbls is None: lst_tbls = self.LstTables()
+        for tbl in lst_tbls:
+            tbl.dImportParams['track_memory'] = IsTrack
+
+    def SetProfileHook(self, stage, lst_tbls=None):
+        """
+        Profile stage (e.g. 'read_file') with cProfile for lst_tbls (default
+        all tables); stats written to files.path_profile as <tbl>_<stage>.prof
+        10/18/26
+        """
+        if lst_tbls is None: lst_tbls = self.LstTables()
+        for tbl in lst_tbls:
+            tbl.dImportParams['profile_stage'] = stage
+            tbl.dImportParams['path_profile'] = self.files.path_profile
+
     def ImportExcelInputs(self, lstExcelImports=None):
         """
         Read rows/cols input data - use pd_util.ImportExcel() to avoid importing 
         blank columns in sheet's Excel .UsedRange. Specify 
         tbl.dParseParams['col_last_df'] to specify where to truncate columns
-        JDL 11/16/24 Add lstImports optional argument
+        (IsLazy resets tables to import on first .df access with current params)
+        JDL 11/16/24 Add lstImports optional argument; Modified 10/18/26 IsLazy
         """
         if lstExcelImports is None: lstExcelImports = self.lstExcelImports
 
         for tbl in lstExcelImports:
-            tbl.ImportExcelDf()
+            if self.IsLazy:
+                tbl.SetLazy()
+                continue
+            tbl.ImportToTblDf()
 
             if self.IsPrint:
                 print('\nImported Excel', tbl.name, tbl.pf, tbl.sht)
@@ -90,17 +191,71 @@ class ProjectTables():
         """
         Read rows/cols input data from CSV files (read directly to .df with no
         parsing of initially-imported .df_raw)
-        JDL 3/31/25
+        JDL 3/31/25; Modified 10/18/26 use ImportToTblDf (optional chunksize);
+        IsLazy as in ImportExcelInputs
         """
         if lstImportsCSV is None: lstImportsCSV = self.lstImportsCSV
 
         for tbl in lstImportsCSV:
-            tbl.df = pd.read_csv(tbl.pf)
+            if self.IsLazy:
+                tbl.SetLazy()
+                continue
+            tbl.ImportToTblDf()
 
             if self.IsPrint:
                 print('\nImported CSV', tbl.name, tbl.pf)
                 print(tbl.df)
 
+    def ImportScheduled(self, lst_tbls=None, col_info=None, n_workers=4):
+        """
+        Import (and parse) lst_tbls (default Excel and CSV inputs) as a DAG of
+        stages on n_workers threads; stages wait only on the table's previous
+        stage, ColInfo (if col_info given) and dImportParams['depends_on']
+        tables. Return IngestScheduler (.df_schedule, .lst_critical_path)
+        10/18/26
+        """
+        scheduler = IngestScheduler(self, lst_tbls, col_info, n_workers=n_workers)
+        scheduler.Run()
+        if self.IsPrint:
+            print('\nCritical path:', scheduler.lst_critical_path)
+            print(scheduler.df_schedule)
+        return scheduler
+
+    async def ImportAllAsync(self, lst_tbls=None, max_concurrency=4, timeout=None,
+                             IsRaise=False):
+        """
+        Import lst_tbls (default Excel and CSV inputs) concurrently from an
+        asyncio event loop: at most max_concurrency tables import at once on a
+        call-scoped thread pool, each with its own timeout (seconds; None for
+        no limit). Returns dict of table name: None or the table's exception
+        (IsRaise=True raises the first failure and cancels the other tables).
+        Cancelling the awaiting task cancels all tables
+        10/18/26
+        """
+        if lst_tbls is None: lst_tbls = self.lstExcelImports + self.lstImportsCSV
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pool = ThreadPoolExecutor(max_workers=max_concurrency,
+                                  thread_name_prefix='import_async')
+
+        # Timeout starts once a table holds a concurrency slot
+        async def ImportTbl(tbl):
+            async with semaphore:
+                await tbl.ImportToTblDfAsync(timeout=timeout, executor=pool)
+            if self.IsPrint:
+                print('\nImported', tbl.name, tbl.pf)
+                print(tbl.df)
+
+        lst_tasks = [asyncio.ensure_future(ImportTbl(tbl)) for tbl in lst_tbls]
+        try:
+            lst_results = await asyncio.gather(*lst_tasks, return_exceptions=not IsRaise)
+        except BaseException:
+            for task in lst_tasks: task.cancel()
+            await asyncio.gather(*lst_tasks, return_exceptions=True)
+            raise
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return {tbl.name:result for tbl, result in zip(lst_tbls, lst_results)}
+
     def ImportRawInputs(self):
         """
         Read each table's raw data using openpyxl to work on sheets whose data 
@@ -128,17 +283,286 @@ class Table():
         self.dImportParams = dImportParams or {}
         self.dParseParams = dParseParams or {'parse_type':'none'}
         self.df_raw = pd.DataFrame() # temp raw data in .lst_dfs iteration
+
+        # Lazy mode: .df property imports/parses on first access (SetLazy)
+        self.is_lazy = False
+        self.is_loaded = True
+        self.is_loading = False
+        self.lock_load = threading.RLock()
+        self.event_cancel = None # threading.Event set to stop an async import
+        self.ident_load = None # thread building ._df_load in an async import
+        self._df_load = None
         self.df = pd.DataFrame()
         self.col_info = None
 
         # Temp variables for looping through files
         self.pf = None
         self.sht = None
+        self.xl = None # pd.ExcelFile handle open for current .pf
+        self.engine = None # Excel reader engine name (None for pandas default)
         self.lst_dfs = None
         self.sht_type = None
         self.is_unstructured = None
+        self.is_streaming_parse = None
         self.lst_dfs = None
 
+        # Optional concurrent file/sheet reads (n_workers > 1)
+        self.n_workers = None
+        self.worker_mode = None
+
+        # Optional read-time column subset, dtypes and rename (structured reads)
+        self.usecols = None
+        self.dict_rename = None
+        self.dict_dtypes_read = None
+        self.dict_dtypes_post = None
+        self.dict_defaults = None
+
+        # Optional reader dtype backend (e.g. 'pyarrow') and its reader kwargs
+        self.dtype_backend = None
+        self.dict_backend = {}
+
+        # Optional chunked CSV reads (rows per chunk) and parquet sink path
+        self.chunksize = None
+        self.pf_sink = None
+
+        # Optional compact dtypes after import/parse and bytes saved report
+        self.is_optimize_memory = False
+        self.df_memory_report = None
+
+        # Files from last ImportToTblDf and optional IngestCache instance
+        self.lst_files = None
+        self.cache = None
+
+        # Incremental ingestion manifest and last run's file diff
+        self.manifest = None
+        self.dict_incremental = None
+
+        # Stage timings and memory rows (see instrument.py); cProfile hook
+        self.timings = {}
+        self.memory = []
+        self.profiler = None
+        self.pf_profile = None
+
+    """
+    ================================================================================
+    Lazy loading -- .df property backed by ._df; first access of a lazy table's
+    .df runs Load (import + parse) once. Concurrent accesses wait on .lock_load.
+    During an async import the loading thread's .df is ._df_load (other threads
+    see the previous .df until the import succeeds)
+    ================================================================================
+    """
+    @property
+    def df(self):
+        if self.is_lazy and not self.is_loaded: self.EnsureLoaded()
+        if self.ident_load == threading.get_ident(): return self._df_load
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        if self.ident_load == threading.get_ident():
+            self._df_load = df
+        else:
+            self._df = df
+        if not self.is_loading: self.is_loaded = True
+
+    def SetLazy(self):
+        """
+        Mark table to load on first .df access (discards current .df)
+        10/18/26
+        """
+        with self.lock_load:
+            self.is_lazy = True
+            self._df = pd.DataFrame()
+            self.is_loaded = False
+
+    def EnsureLoaded(self):
+        """
+        Run Load if not loaded (once across threads; reentrant calls from Load
+        itself are skipped)
+        10/18/26
+        """
+        with self.lock_load:
+            if self.is_loaded or self.is_loading: return
+            self.is_loading = True
+            try:
+                self.Load()
+                self.is_loaded = True
+            finally:
+                self.is_loading = False
+
+    def Load(self, lst_files=None):
+        """
+        Import and (for unstructured non-streaming tables) parse to .df using
+        .dImportParams and .dParseParams (incremental if 'path_incremental')
+        10/18/26; Modified 10/18/26 optional lst_files (as ImportToTblDf)
+        """
+        if 'path_incremental' in self.dImportParams:
+            self.ImportIncremental()
+            return
+        self.ImportToTblDf(lst_files)
+        if self.is_unstructured and not self.is_streaming_parse and \
+                self.parse_type != 'none':
+            self.ParseRawData()
+
+    """
+    ================================================================================
+    Async import -- Load (import + parse) on an executor thread awaited from an
+    asyncio event loop. Timeout or cancellation sets the call's cancel event; the
+    worker thread stops at its next file/sheet/block check (CheckCancelled)
+    without setting .df
+    ================================================================================
+    """
+    async def ImportToTblDfAsync(self, lst_files=None, timeout=None, executor=None):
+        """
+        Await Load (import and parse as unstructured tables need; run on
+        executor; default loop executor) with optional timeout in seconds
+        (raises TimeoutError)
+        10/18/26; Modified 10/18/26 parse unstructured tables
+        """
+        loop = asyncio.get_running_loop()
+        event = threading.Event()
+        future = loop.run_in_executor(executor, self.RunCancellable, event,
+                                      self.Load, lst_files)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except BaseException:
+            event.set()
+            raise
+
+    def RunCancellable(self, event, func, *args):
+        """
+        Run func(*args) holding .lock_load with .event_cancel set to event
+        (a cancelled import's thread finishes before the next one starts).
+        func builds .df in ._df_load, set to .df only if func succeeds
+        (otherwise .df and .lst_dfs are left as before the call)
+        10/18/26; Modified 10/18/26 set .df only on success
+        """
+        with self.lock_load:
+            self.event_cancel = event
+            lst_dfs_prev = self.lst_dfs
+            self._df_load, self.ident_load = self._df, threading.get_ident()
+            try:
+                self.CheckCancelled()
+                result = func(*args)
+                self._df = self._df_load
+                return result
+            except BaseException:
+                self.lst_dfs = lst_dfs_prev
+                raise
+            finally:
+                self.event_cancel, self.ident_load, self._df_load = None, None, None
+
+    def CheckCancelled(self):
+        """
+        Raise RuntimeError if the current async import was cancelled
+        10/18/26
+        """
+        if self.event_cancel is not None and self.event_cancel.is_set():
+            raise RuntimeError(f"{self.name}: import cancelled")
+
+    """
+    ================================================================================
+    ImportIncremental Procedure
+    Sweep-folder ingestion: import/parse only new or changed files and update a
+    persisted base table keyed by source file column (see IngestManifest)
+    ================================================================================
+    """
+    @Timed('import_incremental')
+    def ImportIncremental(self):
+        """
+        Procedure to update .df from persisted base table plus new/changed
+        files (rows of changed and deleted files replaced/removed); rows ordered
+        by lst_files. Sets .dict_incremental to file diff lists
+        10/18/26
+        """
+        lst_names = self.SetLstFileNames()
+        dict_paths = dict(zip(lst_names, self.SetLstFiles(lst_names)))
+        self.SetFileIngestParams()
+        self.SetManifest()
+
+        # Missing base table: re-read all files
+        df_base = self.manifest.ReadBase()
+        if df_base is None: self.manifest.dict_files = {}
+        dDiff = self.manifest.DiffFiles(dict_paths)
+
+        # Read new/changed files; drop base rows for read and deleted files
+        # (read files' rows may be in base if manifest write was interrupted)
+        lst_read = dDiff['new'] + dDiff['changed']
+        lst_dfs_new = [self.ReadSourceFile(f) for f in lst_read]
+        lst_drop = lst_read + dDiff['deleted']
+        if df_base is not None and lst_drop:
+            df_base = df_base[~df_base[self.col_source_file].isin(lst_drop)]
+
+        self.df = self.OrderBySourceFile(df_base, lst_dfs_new, lst_names)
+        if lst_drop or df_base is None:
+            self.manifest.WriteBase(self.df)
+        self.manifest.CommitFiles(dDiff)
+        self.manifest.WriteManifest()
+        self.lst_files = list(dict_paths.values())
+        self.dict_incremental = dDiff
+
+    def SetLstFileNames(self):
+        """
+        Return list of file names from dImportParams['lst_files'] or, if not
+        specified, sorted names matching dImportParams['sweep_glob'] in
+        import_path (e.g. '*.xlsx')
+        10/18/26
+        """
+        if 'lst_files' in self.dImportParams or 'sweep_glob' not in self.dImportParams:
+            lst_files = self.dImportParams['lst_files']
+            return lst_files if isinstance(lst_files, list) else [lst_files]
+
+        path = self.dImportParams.get('import_path', '')
+        lst_pfs = glob.glob(path + self.dImportParams['sweep_glob'])
+        return sorted(os.path.relpath(pf, path or None) for pf in lst_pfs)
+
+    def SetManifest(self):
+        """
+        Instance .manifest for dImportParams['path_incremental'] and set
+        .col_source_file; reset manifest if import/parse params changed
+        10/18/26
+        """
+        self.col_source_file = self.SetImportParam('source_file', 'col_source_file')
+        self.manifest = IngestManifest(self.dImportParams['path_incremental'], self.name)
+        lst_exclude = IngestCache.lst_params_exclude + ['lst_files', 'sweep_glob']
+        if self.manifest.SetParamsKey(self.dImportParams, self.dParseParams, lst_exclude):
+            self.manifest.Reset()
+            self.manifest.SetParamsKey(self.dImportParams, self.dParseParams, lst_exclude)
+
+    def ReadSourceFile(self, f):
+        """
+        Return df imported (and parsed if unstructured) from file f with
+        .col_source_file set to f
+        10/18/26
+        """
+        self.df = pd.DataFrame()
+        self.ImportToTblDf([f])
+        if self.is_unstructured and not self.is_streaming_parse and \
+                self.parse_type != 'none':
+            self.ParseRawData()
+        return self.df.assign(**{self.col_source_file:f})
+
+    def OrderBySourceFile(self, df_base, lst_dfs_new, lst_names):
+        """
+        Return concat of base and new dfs with rows ordered by source file
+        position in lst_names (stable within each file)
+        10/18/26
+        """
+        lst_dfs = ([df_base] if df_base is not None else []) + lst_dfs_new
+        if not lst_dfs: return pd.DataFrame()
+        df = pd.concat(lst_dfs, ignore_index=True)
+
+        codes = pd.Categorical(df[self.col_source_file], categories=lst_names).codes
+        return df.iloc[np.argsort(codes, kind='stable')].reset_index(drop=True)
+
+    def ResetIncremental(self):
+        """
+        Remove this table's incremental manifest and base table (next
+        ImportIncremental re-reads all files)
+        10/18/26
+        """
+        IngestManifest(self.dImportParams['path_incremental'], self.name).Reset()
+
     """
     ================================================================================
     ParseRawData Procedure
@@ -147,14 +571,67 @@ class Table():
     JDL 4/21/25
     ================================================================================
     """
+    @Timed('parse')
     def ParseRawData(tbl):
         """
         Procedure to parse raw data for a given Table instance.
+        (Optionally load/save parsed .df from/to cache; Modified 10/18/26)
+        (Optional dImportParams['n_workers_parse'] > 1 parses frames on a
+        process pool; Modified 10/18/26)
         """
-        for df in tbl.lst_dfs:
+        if tbl.LoadFromCache('parse', tbl.lst_files): return
+
+        n_workers_parse = tbl.SetImportParam(1, 'n_workers_parse')
+        is_parallel = n_workers_parse > 1 and len(tbl.lst_dfs) > 1 and \
+            tbl.dParseParams['parse_type'] == 'row_major'
+        if is_parallel: tbl.ParseFramesParallel(n_workers_parse)
+
+        for df in tbl.lst_dfs if not is_parallel else []:
+            tbl.CheckCancelled()
             if tbl.dParseParams['parse_type'] == 'row_major':
                 parse = RowMajorTbl(tbl, df)
                 parse.ReadBlocksProcedure()
+
+        tbl.ApplyDtypeBackend()
+        if tbl.is_optimize_memory: tbl.OptimizeMemory()
+        tbl.SaveToCache('parse', tbl.lst_files)
+
+    @Timed('parse_parallel')
+    def ParseFramesParallel(self, n_workers):
+        """
+        Parse each .lst_dfs frame with ParseFrameTask on a reusable process
+        pool; merge results to .df in frame order (same output as serial)
+        10/18/26
+        """
+        pool = GetWorkerPool('process', n_workers)
+        lst_futures = [pool.submit(ParseFrameTask, self.dParseParams, df)
+                       for df in self.lst_dfs]
+
+        for i, future in enumerate(lst_futures):
+            if self.event_cancel is not None and self.event_cancel.is_set():
+                for future_pending in lst_futures: future_pending.cancel()
+                self.CheckCancelled()
+            try:
+                lst_blocks, lst_block_id_vals, timings = future.result()
+            except Exception as e:
+                msg = f"{self.name}: failed parsing frame {i}"
+                raise RuntimeError(f"{msg} ({type(e).__name__}: {e})") from e
+            self.MergeParsedFrame(lst_blocks, lst_block_id_vals)
+            for stage, dTiming in timings.items():
+                instrument.AddTiming(self.timings, stage, dTiming['wall'], dTiming['cpu'])
+
+    def MergeParsedFrame(self, lst_blocks, lst_block_id_vals):
+        """
+        Merge one frame's parsed blocks and block ID values to .df as
+        RowMajorTbl.ReadBlocksProcedure does serially (block ID columns are
+        set on all rows parsed so far)
+        10/18/26
+        """
+        self.df = pd.concat([self.df] + lst_blocks, axis=0)
+        for name, value in lst_block_id_vals:
+            self.df[name] = value
+        self.df = self.df.reset_index(drop=True)
+
     """
     ================================================================================
     ApplyColInfo Procedure
@@ -170,6 +647,7 @@ class Table():
     JDL 4/10/25 Rewritten to allow multisheet Excel and separate ingest/parse
     ================================================================================
     """
+    @Timed('import')
     def ImportToTblDf(self, lst_files=None):
         """
         Procedure to import file(s) + sheet(s) to self.df (structured rows/cols)
@@ -178,7 +656,12 @@ class Table():
 
         Can directly specify lst_files as arg or as dImportParams['lst_files']
         Refactored JDL 4/10/25; Comments updated 4/21/25 to clarify
+        Modified 10/18/26 one pd.ExcelFile handle per workbook; stage timings;
+        cancel checks for ImportToTblDfAsync
         """
+        # Explicit import of a lazy table replaces its pending load
+        if not self.is_loading: self.is_loaded = True
+
         # Set lst_files based on dImportParams['lst_files'] or input arg    
         lst_files = self.SetLstFiles(lst_files)
 
@@ -188,27 +671,74 @@ class Table():
         # initialize list df's and temp df (temp if structured; or for parsing later)
         self.lst_dfs = []
         self.df_temp = pd.DataFrame()
+        if self.is_streaming_parse: self.df = pd.DataFrame()
+
+        # Optionally load unchanged files' previous import from cache
+        self.SetCache()
+        if self.LoadFromCache('import', lst_files): return
+
+        # Optionally stream structured CSV files in chunks to .df or parquet sink
+        if self.chunksize is not None and self.dImportParams['ftype'] == 'csv' \
+                and not self.is_unstructured:
+            self.ReadCSVChunked(lst_files)
+            if self.pf_sink is None:
+                if self.is_optimize_memory: self.OptimizeMemory()
+                self.SaveToCache('import', lst_files)
+            return
+
+        # Optionally read files/sheets concurrently on a worker pool
+        lst_files_serial = lst_files
+        if self.n_workers > 1 and not self.is_streaming_parse:
+            self.ReadFilesParallel(lst_files)
+            lst_files_serial = []
 
         # Loop over input list of files to ingest
-        for self.pf in lst_files:
+        for self.pf in lst_files_serial:
+            self.CheckCancelled()
 
             # Read from Excel single/multiple sheets self.pf; append to lst_dfs
-            if self.dImportParams['ftype'] == 'excel':
+            # (workbook opened once for all sheet reads)
+            if self.dImportParams['ftype'] == 'excel' and self.is_streaming_parse:
+                self.SetLstSheets()
+                self.ReadExcelFileStreaming()
+
+            elif self.dImportParams['ftype'] == 'excel':
+                # Sheet names probed before open; skip file if none match
                 self.SetLstSheets()
-                self.ReadExcelFileSheets()
+                if not self.lst_sheets: continue
+                self.OpenExcelFile()
+                try:
+                    self.ReadExcelFileSheets()
+                finally:
+                    self.CloseExcelFile()
 
             # Read from CSV self.pf; append to lst_dfs
             elif self.dImportParams['ftype'] == 'csv':
                 self.ReadCSVFile()
 
-            # Read from feather self.pf; append to lst_dfs
-            elif self.dImportParams['ftype'] == 'feather':
-                pass
+            # Read from feather or parquet self.pf; append to lst_dfs
+            elif self.dImportParams['ftype'] in ['feather', 'parquet']:
+                self.ReadColumnarFile()
 
         #Concat if rows/cols aka structured (e.g. no parsing needed)
+        self.CheckCancelled()
         if not self.is_unstructured:
-            self.df = pd.concat(self.lst_dfs, ignore_index=True)
+            if self.dImportParams['ftype'] in ['feather', 'parquet']:
+                self.dict_dtypes_post.update(self.dict_dtypes_read)
+                self.df = self.SubsetRenameCols(ConcatArrowTables(self.lst_dfs,
+                                                                  self.dtype_backend))
+            else:
+                with instrument.TimeStage(self, 'concat'):
+                    self.df = pd.concat(self.lst_dfs, ignore_index=True) \
+                        if self.lst_dfs else pd.DataFrame()
             self.lst_dfs = []
+            if self.is_optimize_memory: self.OptimizeMemory()
+
+        # Streamed blocks are parsed to .df during import
+        elif self.is_streaming_parse:
+            self.ApplyDtypeBackend()
+
+        self.SaveToCache('import', lst_files)
 
     def SetLstFiles(self, lst_files):
         """
@@ -223,6 +753,7 @@ class Table():
         # Optionally prepend import_path to each file name
         if 'import_path' in self.dImportParams:
             lst_files = [self.dImportParams['import_path'] + f for f in lst_files]
+        self.lst_files = lst_files
         return lst_files
 
     def SetFileIngestParams(self):
@@ -230,13 +761,94 @@ class Table():
         Set Table attributes for the current file 
         (concise vs referencing dict items and also factors in default vals if
         dict item not specified)
-        JDL 4/10/25
+        JDL 4/10/25; Modified 10/18/26 optional reader params; dtype_backend
         """
         self.is_unstructured = self.SetParseParam(False, 'is_unstructured')
         self.n_skip_rows = self.SetParseParam(0, 'n_skip_rows')
         self.parse_type = self.SetParseParam('none', 'parse_type')
+        self.is_streaming_parse = self.is_unstructured and \
+            self.parse_type == 'row_major' and \
+            self.SetParseParam(False, 'is_streaming_parse')
+        self.n_workers = self.SetImportParam(1, 'n_workers')
+        self.worker_mode = self.SetImportParam('thread', 'worker_mode')
+        self.usecols = self.SetImportParam(None, 'usecols')
+        self.dict_rename = self.SetImportParam(None, 'dict_rename')
+        self.dict_dtypes_read, self.dict_dtypes_post = \
+            pd_util.SplitReadDtypes(self.SetImportParam({}, 'dtypes'))
+        self.dtype_backend = self.SetImportParam(None, 'dtype_backend')
+        self.dict_backend = pd_util.BackendKwds(self.dtype_backend)
+        if self.dtype_backend == 'pyarrow':
+            self.dict_dtypes_read = pd_util.ArrowDtypes(self.dict_dtypes_read)
+            self.dict_dtypes_post = pd_util.ArrowDtypes(self.dict_dtypes_post)
+        self.dict_defaults = self.SetImportParam(None, 'dict_defaults')
+        self.chunksize = self.SetImportParam(None, 'chunksize')
+        self.pf_sink = self.SetImportParam(None, 'chunk_sink')
+        self.is_optimize_memory = self.SetImportParam(False, 'optimize_memory')
         if self.dImportParams['ftype'] == 'excel':
             self.sht_type = self.SetImportParam('single', 'sht_type')
+            self.engine = self.SetImportParam(None, 'engine')
+
+    def SetCache(self):
+        """
+        Instance .cache if dImportParams['path_cache'] is specified (optional
+        'cache_max_bytes' and 'cache_key' of 'mtime' or 'hash')
+        10/18/26
+        """
+        self.cache = None
+        if 'path_cache' not in self.dImportParams: return
+        self.cache = IngestCache(self.dImportParams['path_cache'],
+                        max_bytes=self.SetImportParam(None, 'cache_max_bytes'),
+                        key_mode=self.SetImportParam('mtime', 'cache_key'))
+
+    def LoadFromCache(self, stage, lst_files):
+        """
+        Set .df or .lst_dfs from cached stage result; return True if found
+        10/18/26
+        """
+        if self.cache is None: return False
+        key = self.cache.BuildKey(stage, lst_files, self.dImportParams,
+                                  self.dParseParams)
+        result = self.cache.Load(key)
+        if result is None: return False
+
+        kind, lst_dfs = result
+        if kind == 'lst_dfs':
+            self.lst_dfs = lst_dfs
+        else:
+            self.df, self.lst_dfs = lst_dfs[0], []
+        return True
+
+    def SaveToCache(self, stage, lst_files):
+        """
+        Save stage result (.lst_dfs if unstructured import; otherwise .df;
+        streaming parse imports set .df)
+        10/18/26
+        """
+        if self.cache is None: return
+        key = self.cache.BuildKey(stage, lst_files, self.dImportParams,
+                                  self.dParseParams)
+        if stage == 'import' and self.is_unstructured and not self.is_streaming_parse:
+            self.cache.Save(key, self.name, 'lst_dfs', self.lst_dfs)
+        else:
+            self.cache.Save(key, self.name, 'df', [self.df])
+
+    def ResetTimings(self):
+        """
+        Clear .timings, .memory and profiler stats (otherwise accumulate
+        over ColInfo setup, import and parse calls)
+        10/18/26
+        """
+        self.timings = {}
+        self.memory = []
+        self.profiler = None
+
+    def InvalidateCache(self):
+        """
+        Remove this table's cache entries
+        10/18/26
+        """
+        if self.cache is None: self.SetCache()
+        if self.cache is not None: self.cache.Invalidate(self.name)
 
     def SetImportParam(self, valDefault, param_name):
         """
@@ -260,83 +872,319 @@ class Table():
         """
         Set .lst_sheets based on sht_type and sht in dImportParams
         (Called within iteration with self.pf file)
-        JDL 4/10/25
+        * 'list': sht is list of sheet names (or positions) in list order;
+          names not in workbook are skipped
+        * 'regex': names matching re.search(sht) (sht str or compiled
+          pattern); 'startswith', 'endswith' and 'contains': sht is str or
+          list of strs (any match)
+        JDL 4/10/25; Modified 10/18/26 sheet names from workbook.xml probe;
+        list/regex/startswith/endswith/contains
         """
         self.lst_sheets = []
+        sht = self.dImportParams.get('sht', 0)
 
         if self.sht_type == 'single':
 
             # Set sheet name to either specified or 0 (e.g. first sheet)
-            self.lst_sheets = [self.dImportParams.get('sht', 0)]
+            self.lst_sheets = [sht]
 
             # If sheet name is 0, reset it to first sheet name
             if self.lst_sheets[0] == 0:
-                wb = load_workbook(filename=self.pf, read_only=True)
-                self.lst_sheets[0] = wb.sheetnames[0]
-                wb.close()
+                self.lst_sheets[0] = self.GetSheetNames()[0]
 
         elif self.sht_type == 'all':
-            wb = load_workbook(filename=self.pf, read_only=True)
-            self.lst_sheets = wb.sheetnames
-            wb.close()
+            self.lst_sheets = self.GetSheetNames()
         
         elif self.sht_type == 'list':
-            pass
+            lst_names = self.GetSheetNames()
+            lst_sht = sht if isinstance(sht, list) else [sht]
+            lst_sht = [lst_names[s] if isinstance(s, int) and s < len(lst_names)
+                       else s for s in lst_sht]
+            self.lst_sheets = [s for s in dict.fromkeys(lst_sht) if s in lst_names]
 
         elif self.sht_type == 'regex':
-            pass
+            if not isinstance(sht, (str, re.Pattern)):
+                msg = f"{self.name}: sht_type 'regex' requires sht pattern"
+                raise ValueError(f"{msg} (str or re.compile); got {sht!r}")
+            pattern = re.compile(sht)
+            self.lst_sheets = [s for s in self.GetSheetNames() if pattern.search(s)]
+
+        elif self.sht_type in ['startswith', 'endswith', 'contains']:
+            lst_sht = sht if isinstance(sht, list) else [sht]
+            if self.sht_type == 'startswith':
+                fn_match = lambda name: name.startswith(tuple(lst_sht))
+            elif self.sht_type == 'endswith':
+                fn_match = lambda name: name.endswith(tuple(lst_sht))
+            else:
+                fn_match = lambda name: any(s in name for s in lst_sht)
+            self.lst_sheets = [s for s in self.GetSheetNames() if fn_match(s)]
+
+        else:
+            raise ValueError(f"{self.name}: unrecognized sht_type: {self.sht_type}")
+
+    @Timed('read_parallel')
+    def ReadFilesParallel(self, lst_files):
+        """
+        Read all files (and Excel files' sheets) on a reusable worker pool;
+        append results to lst_dfs in file/sheet order
+        10/18/26
+        """
+        # Build ordered list of (file, sheet) read tasks
+        lst_tasks = []
+        for self.pf in lst_files:
+            if self.dImportParams['ftype'] == 'excel':
+                self.SetLstSheets()
+                lst_tasks += [(self.pf, sht) for sht in self.lst_sheets]
+            else:
+                lst_tasks.append((self.pf, None))
+
+        # Submit all tasks, then collect results in submission order
+        pool = GetWorkerPool(self.worker_mode, self.n_workers)
+        lst_futures = [pool.submit(ReadFileTask, self.dImportParams, 
+                        self.dParseParams, pf, sht) for pf, sht in lst_tasks]
+
+        for (pf, sht), future in zip(lst_tasks, lst_futures):
+            if self.event_cancel is not None and self.event_cancel.is_set():
+                for future_pending in lst_futures: future_pending.cancel()
+                self.CheckCancelled()
+            try:
+                self.lst_dfs.append(future.result())
+            except Exception as e:
+                msg = f"{self.name}: failed reading file {pf}, sheet {sht}"
+                raise RuntimeError(f"{msg} ({type(e).__name__}: {e})") from e
 
-        elif self.sht_type == 'startswith':
-            pass
+    @Timed('open_file')
+    def OpenExcelFile(self):
+        """
+        Open .xl pd.ExcelFile handle for .pf (shared by sheet listing and reads)
+        using .engine reader (see excel_engines.dict_excel_engines)
+        10/18/26
+        """
+        self.CloseExcelFile()
+        self.xl = excel_engines.OpenExcelFile(self.pf, self.engine)
 
-        elif self.sht_type == 'endswith':
-            pass
+    def CloseExcelFile(self):
+        """
+        Close .xl handle if open
+        10/18/26
+        """
+        if self.xl is not None: self.xl.close()
+        self.xl = None
 
-        elif self.sht_type == 'contains':
-            pass
+    def GetSheetNames(self):
+        """
+        Return .pf sheet names in workbook order (from .xl handle if open;
+        else cached xl/workbook.xml probe without loading workbook; else temp
+        handle)
+        10/18/26
+        """
+        if self.xl is not None: return self.xl.sheet_names
+        lst_names = excel_engines.SheetNamesFromZip(self.pf)
+        if lst_names is not None: return lst_names
+        with excel_engines.OpenExcelFile(self.pf, self.engine) as xl:
+            return xl.sheet_names
 
     def ReadExcelFileSheets(self):
         """
         Loop through sheets in lst_sheets and read their data
-        JDL 4/10/25
+        JDL 4/10/25; Modified 10/18/26 read all sheets in one batched call
         """
+        dict_raw = self.ReadExcelRawSheets(self.lst_sheets)
         for self.sht in self.lst_sheets:
-            self.ReadExcelSht()
+            self.df_temp = self.CleanExcelSht(dict_raw[self.sht])
             self.lst_dfs.append(self.df_temp)
             self.df_temp = pd.DataFrame()
 
+    @Timed('read_file')
+    def ReadExcelFileStreaming(self):
+        """
+        Parse row major blocks from each sheet in lst_sheets while streaming
+        openpyxl read_only rows (sheets not loaded; blocks appended to .df)
+        10/18/26
+        """
+        wb = load_workbook(filename=self.pf, read_only=True, data_only=True)
+        try:
+            for self.sht in self.lst_sheets:
+                ws = wb[self.sht]
+                ws.reset_dimensions()
+                parse = RowMajorTbl(self)
+                parse.ReadBlocksStreamProcedure(ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
+
     def ReadExcelSht(self):
         """
         Read data from the current sheet into a temporary DataFrame.
+        Modified 10/18/26 column-wise str coercion (vs per-cell lambda)
+        """
+        df = self.ReadExcelRawSheets([self.sht])[self.sht]
+        self.df_temp = self.CleanExcelSht(df)
+
+    @Timed('read_file')
+    def ReadExcelRawSheets(self, lst_sheets):
+        """
+        Return dict of sheet name: df for lst_sheets read in one batched parse
+        call (from .xl handle if open, else temporary handle for .pf)
+        10/18/26
+        """
+        xl = self.xl if self.xl is not None else \
+            excel_engines.OpenExcelFile(self.pf, self.engine)
+        try:
+            if self.is_unstructured:
+                return xl.parse(sheet_name=lst_sheets, header=None)
+            return xl.parse(sheet_name=lst_sheets, skiprows=self.n_skip_rows,
+                            usecols=self.usecols, dtype=self.dict_dtypes_read or None,
+                            **self.dict_backend)
+        finally:
+            if xl is not self.xl: xl.close()
+
+    def CleanExcelSht(self, df):
+        """
+        Return sheet df with str coercion (unstructured with import_dtype=str)
+        or column subset/rename (structured)
+        10/18/26
         """
         if self.is_unstructured:
-            #self.df_temp = self.ImportExcelRaw()
-            self.df_temp = pd.read_excel(self.pf, sheet_name=self.sht, header=None)
 
             # Negate Pandas inferring float data type for integers and NaNs for blanks
             if 'import_dtype' in self.dParseParams and self.dParseParams['import_dtype'] == str:
-                self.df_temp = self.df_temp.astype(object)
-                self.df_temp = self.df_temp.map(lambda x: None if pd.isna(x) \
-                    else str(int(x)) if isinstance(x, float) and x.is_integer() else str(x))
-        else:
-            self.df_temp = pd.read_excel(self.pf, sheet_name=self.sht, skiprows=self.n_skip_rows)
+                with instrument.TimeStage(self, 'str_coercion'):
+                    df = pd_util.DfToStr(df)
+            return df
+        return self.SubsetRenameCols(df)
 
     def ReadCSVFile(self):
         """
         Import current CSV file into a temporary df and append to lst_dfs
-        JDL 4/10/25
-        """
-        if self.is_unstructured:
-            # Read CSV without treating first row as headers
-            self.df_temp = pd.read_csv(self.pf, header=None)
-        else:
-            # Read CSV with optional skiprows
-            self.df_temp = pd.read_csv(self.pf, skiprows=self.n_skip_rows)
+        JDL 4/10/25; Modified 10/18/26 stage timings
+        """
+        with instrument.TimeStage(self, 'read_file'):
+            if self.is_unstructured:
+                # Read CSV without treating first row as headers
+                self.df_temp = pd.read_csv(self.pf, header=None)
+            else:
+                # Read CSV with optional skiprows and column subset
+                self.df_temp = pd.read_csv(self.pf, skiprows=self.n_skip_rows,
+                        usecols=self.usecols, dtype=self.dict_dtypes_read or None,
+                        **self.dict_backend)
+        if not self.is_unstructured:
+            self.df_temp = self.SubsetRenameCols(self.df_temp)
 
         # Append temp df to lst_dfs and re-initialize
         self.lst_dfs.append(self.df_temp)
         self.df_temp = pd.DataFrame()
 
+    def ReadCSVChunked(self, lst_files):
+        """
+        Stream CSV chunks from IterCSVChunks to .df (concat) or, if
+        dImportParams['chunk_sink'] is set, append them to parquet .pf_sink
+        (peak memory bounded by chunksize; .df left empty). Numeric types are
+        promoted across chunks; str vs other types raise ValueError
+        10/18/26; Modified 10/18/26 check types across chunks
+        """
+        iter_chunks = self.IterCSVChunks(lst_files)
+        try:
+            if self.pf_sink is not None:
+                self.df = pd.DataFrame()
+                WriteChunksParquet(iter_chunks, self.pf_sink)
+                return
+            lst_chunks = list(iter_chunks)
+            CheckChunkDtypes(lst_chunks)
+        except ValueError as e:
+            raise ValueError(f"{self.name}: {e}") from e
+        self.df = pd.concat(lst_chunks, ignore_index=True) if lst_chunks \
+            else pd.DataFrame()
+
+    def IterCSVChunks(self, lst_files=None):
+        """
+        Generator of .chunksize-row dfs from CSV files with keep columns,
+        types, defaults and renames applied to each chunk (structured)
+        10/18/26
+        """
+        # Standalone use sets files and params from dImportParams
+        if lst_files is None:
+            lst_files = self.SetLstFiles(None)
+            self.SetFileIngestParams()
+        if self.chunksize is None:
+            raise ValueError(f"{self.name}: dImportParams['chunksize'] required for chunked CSV reads")
+
+        for self.pf in lst_files:
+            if self.is_unstructured:
+                reader = pd.read_csv(self.pf, header=None, chunksize=self.chunksize)
+            else:
+                reader = pd.read_csv(self.pf, skiprows=self.n_skip_rows,
+                    usecols=self.usecols, dtype=self.dict_dtypes_read or None,
+                    chunksize=self.chunksize, **self.dict_backend)
+            with reader:
+                for chunk in reader:
+                    self.CheckCancelled()
+                    yield chunk if self.is_unstructured else self.SubsetRenameCols(chunk)
+
+    def SubsetRenameCols(self, df):
+        """
+        Order columns as .usecols (readers return file order), fill blanks with
+        .dict_defaults, set types not set by reader (pd_util.AstypePostRead)
+        and rename with .dict_rename (e.g. ColInfo import names to project names)
+        10/18/26; Modified 10/18/26 Arrow-compatible default fill values;
+        blank bool flags as False
+        """
+        with instrument.TimeStage(self, 'subset_rename'):
+            if self.usecols is not None: df = df[self.usecols]
+            if self.dict_defaults:
+                df = df.fillna({k:pd_util.ArrowFillValue(df[k], v)
+                                for k, v in self.dict_defaults.items() if k in df})
+        if self.dict_dtypes_post:
+            with instrument.TimeStage(self, 'set_types'):
+                df = pd_util.AstypePostRead(df, self.dict_dtypes_post)
+        if self.dict_rename is not None:
+            with instrument.TimeStage(self, 'subset_rename'):
+                df = df.rename(columns=self.dict_rename)
+        return df
+
+    def ApplyDtypeBackend(self):
+        """
+        Convert parsed .df columns to Arrow-backed dtypes if dtype_backend is
+        'pyarrow' (raw frames stay NumPy-backed for parsing)
+        10/18/26
+        """
+        if self.dtype_backend == 'pyarrow':
+            self.df = self.df.convert_dtypes(dtype_backend='pyarrow')
+
+    @Timed('optimize_memory')
+    def OptimizeMemory(self, dict_hints=None, cat_threshold=None):
+        """
+        Convert .df to compact dtypes (categoricals, downcast numerics and bool
+        flags; see pd_util.OptimizeDfMemory); set and return .df_memory_report
+        Hints default to dImportParams['memory_hints'] (e.g. set by ColumnInfo)
+        10/18/26
+        """
+        if dict_hints is None: dict_hints = self.SetImportParam(None, 'memory_hints')
+        if cat_threshold is None: cat_threshold = self.SetImportParam(0.5, 'cat_threshold')
+        self.df, self.df_memory_report = pd_util.OptimizeDfMemory(self.df,
+                                                    dict_hints, cat_threshold)
+        return self.df_memory_report
+
+    @Timed('read_file')
+    def ReadColumnarFile(self):
+        """
+        Read current feather or parquet file (memory-mapped) with optional
+        dImportParams['usecols'] column projection and append to lst_dfs
+        (Arrow table if structured for single conversion in ConcatArrowTables)
+        10/18/26
+        """
+        import pyarrow.feather as pa_feather
+        import pyarrow.parquet as pa_parquet
+
+        cols = self.SetImportParam(None, 'usecols')
+        if self.dImportParams['ftype'] == 'feather':
+            tbl_arrow = pa_feather.read_table(self.pf, columns=cols, memory_map=True)
+        else:
+            tbl_arrow = pa_parquet.read_table(self.pf, columns=cols, memory_map=True)
+
+        # Unstructured data are converted per file for later parsing
+        if self.is_unstructured: tbl_arrow = tbl_arrow.to_pandas()
+        self.lst_dfs.append(tbl_arrow)
+
     def ImportExcelDf_obsolete(self):
         """
         Import rows/cols homed table data from Excel to .df
@@ -390,6 +1238,254 @@ class Table():
             self.df = self.df.reset_index(drop=IsDrop)
             self.df = self.df.set_index(self.idx_col_name)
 
+"""
+================================================================================
+Worker pool helpers for concurrent file/sheet reads (Table.ReadFilesParallel)
+================================================================================
+"""
+# Pools kept open for reuse across tables and ImportToTblDf calls (shut down
+# at interpreter exit)
+dict_worker_pools = {}
+lock_worker_pools = threading.Lock()
+
+def GetWorkerPool(worker_mode, n_workers):
+    """
+    Return a reusable thread or process pool for worker_mode and n_workers
+    (replaces a cached pool that is broken, e.g. BrokenProcessPool after a
+    worker process died)
+    10/18/26; Modified 10/18/26 locked; replace broken pools
+    """
+    if worker_mode not in ['thread', 'process']:
+        raise ValueError(f"worker_mode must be 'thread' or 'process': {worker_mode}")
+    key = (worker_mode, n_workers)
+    with lock_worker_pools:
+        pool = dict_worker_pools.get(key)
+
+        # Executors flag ._broken once a worker dies (fails every later submit)
+        if pool is not None and getattr(pool, '_broken', False):
+            pool.shutdown(wait=False, cancel_futures=True)
+            pool = None
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=n_workers) if worker_mode == 'thread' \
+                else ProcessPoolExecutor(max_workers=n_workers)
+            dict_worker_pools[key] = pool
+        return pool
+
+def ShutdownWorkerPools():
+    """
+    Shut down and forget all reusable worker pools (also run at exit)
+    10/18/26; Modified 10/18/26 locked; registered with atexit
+    """
+    with lock_worker_pools:
+        lst_pools = list(dict_worker_pools.values())
+        dict_worker_pools.clear()
+    for pool in lst_pools:
+        pool.shutdown(wait=True)
+
+atexit.register(ShutdownWorkerPools)
+
+def ConcatArrowTables(lst_tbls_arrow, dtype_backend=None):
+    """
+    Concatenate Arrow tables (zero-copy) and convert to df in one pass
+    (dtype_backend='pyarrow' wraps Arrow columns without conversion)
+    10/18/26
+    """
+    import pyarrow as pa
+    tbl_arrow = pa.concat_tables(lst_tbls_arrow)
+    if dtype_backend == 'pyarrow': return tbl_arrow.to_pandas(types_mapper=pd.ArrowDtype)
+    return tbl_arrow.to_pandas(split_blocks=True)
+
+def GetCell(row, icol):
+    """
+    Return row[icol] or None if row is shorter (streamed rows are ragged)
+    10/18/26
+    """
+    return row[icol] if icol < len(row) else None
+
+def WriteChunksParquet(iter_chunks, pf_sink):
+    """
+    Append dfs from iter_chunks to parquet file pf_sink one row group at a
+    time; return number of rows written. Schema is from the first chunk with
+    its all-blank columns typed by ChunkSchema (chunks are held until a later
+    chunk sets a blank numeric column's type) and widened by WriteChunkArrow
+    if a later chunk needs it (e.g. int64 column with floats)
+    10/18/26; Modified 10/18/26 type leading all-blank columns; promote
+    schema across chunks
+    """
+    import pyarrow.parquet as pa_parquet
+
+    writer, n_rows, lst_held = None, 0, []
+    try:
+        for chunk in iter_chunks:
+            n_rows += len(chunk)
+            if writer is not None:
+                writer = WriteChunkArrow(writer, chunk)
+                continue
+
+            # Open writer once all first-chunk blank columns are typed
+            lst_held.append(chunk)
+            schema, is_typed = ChunkSchema(lst_held)
+            if is_typed:
+                writer = pa_parquet.ParquetWriter(pf_sink, schema)
+                for chunk_held in lst_held: writer = WriteChunkArrow(writer, chunk_held)
+                lst_held = []
+
+        # Columns blank in every chunk keep the first chunk's inferred type
+        if lst_held:
+            schema, _ = ChunkSchema(lst_held)
+            writer = pa_parquet.ParquetWriter(pf_sink, schema)
+            for chunk_held in lst_held: writer = WriteChunkArrow(writer, chunk_held)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            if writer.where != pf_sink: os.remove(writer.where)
+        raise
+    if writer is not None:
+        writer.close()
+        if writer.where != pf_sink: os.replace(writer.where, pf_sink)
+    return n_rows
+
+def WriteChunkArrow(writer, chunk):
+    """
+    Write chunk as a row group and return the writer in use. If chunk does
+    not fit writer's schema, rewrite the row groups written so far with the
+    schema widened by PromoteSchema to a new '.tmp' writer first
+    10/18/26
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pa_parquet
+    try:
+        tbl_arrow = ChunkToArrow(chunk, writer.schema)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        schema = PromoteSchema(writer.schema, chunk)
+        writer.close()
+        pf_prev = writer.where
+        writer = pa_parquet.ParquetWriter(pf_prev + '.tmp', schema)
+        with pa_parquet.ParquetFile(pf_prev) as pq_prev:
+            for i in range(pq_prev.num_row_groups):
+                writer.write_table(pq_prev.read_row_group(i).cast(schema))
+        if pf_prev.endswith('.tmp'): os.remove(pf_prev)
+        tbl_arrow = ChunkToArrow(chunk, schema)
+    writer.write_table(tbl_arrow)
+    return writer
+
+def PromoteSchema(schema, chunk):
+    """
+    Return schema with each field widened to also hold chunk's values (e.g.
+    int64 and double to double); raise ValueError if types are incompatible
+    (e.g. int64 and string; set the column's dImportParams['dtypes'])
+    10/18/26
+    """
+    import pyarrow as pa
+    for i, field in enumerate(schema):
+        ser = chunk[field.name]
+        if ser.isna().all(): continue
+        try:
+            field_chunk = field.with_type(pa.array(ser, from_pandas=True).type)
+            schema_pair = pa.unify_schemas([pa.schema([field]), pa.schema([field_chunk])],
+                                           promote_options='permissive')
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(ChunkTypesMsg(field.name, field.type, ser.dtype)) from e
+        schema = schema.set(i, schema_pair.field(0))
+    return schema
+
+def CheckChunkDtypes(lst_chunks):
+    """
+    Raise ValueError if a column is str (object) in some chunks and another
+    type in others (concat would mix types unlike a single read); all-blank
+    chunks and numeric types that concat promotes (int to float) are allowed
+    10/18/26
+    """
+    if not lst_chunks: return
+    for col in lst_chunks[0].columns:
+        lst_dtypes = [c[col].dtype for c in lst_chunks if not c[col].isna().all()]
+        is_object = [dtype == object for dtype in lst_dtypes]
+        if any(is_object) and not all(is_object):
+            dtype_other = lst_dtypes[is_object.index(False)]
+            raise ValueError(ChunkTypesMsg(col, 'object', dtype_other))
+
+def ChunkTypesMsg(col, type1, type2):
+    """
+    Return error message for column col with incompatible types in chunks
+    10/18/26
+    """
+    return f"column {col} types differ between CSV chunks ({type1} vs " + \
+        f"{type2}); set its type with dImportParams['dtypes']"
+
+def ChunkSchema(lst_chunks):
+    """
+    Return (Arrow schema, is_typed) from first of lst_chunks. Columns blank
+    in the first chunk take their type from the first chunk with values,
+    else string if object dtype (e.g. dtypes 'str'); is_typed False if a
+    blank non-object column has no values yet
+    10/18/26
+    """
+    import pyarrow as pa
+    chunk = lst_chunks[0]
+    schema, is_typed = pa.Schema.from_pandas(chunk, preserve_index=False), True
+    for i, field in enumerate(schema):
+        if not chunk[field.name].isna().all(): continue
+        lst_filled = [c[field.name] for c in lst_chunks[1:] if not c[field.name].isna().all()]
+        if lst_filled:
+            schema = schema.set(i, field.with_type(pa.array(lst_filled[0], from_pandas=True).type))
+        elif chunk[field.name].dtype == object:
+            schema = schema.set(i, field.with_type(pa.string()))
+        else:
+            is_typed = False
+    return schema, is_typed
+
+def ChunkToArrow(chunk, schema):
+    """
+    Convert df chunk to Arrow table with schema (all-blank columns as typed
+    nulls since pandas infers float64 for them)
+    10/18/26
+    """
+    import pyarrow as pa
+    lst_arrays = [pa.nulls(len(chunk), field.type) if chunk[field.name].isna().all()
+                  else pa.array(chunk[field.name], type=field.type, from_pandas=True)
+                  for field in schema]
+    return pa.Table.from_arrays(lst_arrays, schema=schema)
+
+def ReadFileTask(dImportParams, dParseParams, pf, sht=None):
+    """
+    Worker task - read one file (and sheet if Excel) with a temporary Table
+    and return the df that Table.ImportToTblDf would append to lst_dfs
+    10/18/26
+    """
+    tbl = Table('worker', dImportParams, dParseParams)
+    tbl.SetFileIngestParams()
+    tbl.pf, tbl.sht, tbl.lst_dfs = pf, sht, []
+
+    if dImportParams['ftype'] == 'excel':
+        tbl.ReadExcelSht()
+        return tbl.df_temp
+    elif dImportParams['ftype'] == 'csv':
+        tbl.ReadCSVFile()
+        return tbl.lst_dfs[0]
+    elif dImportParams['ftype'] in ['feather', 'parquet']:
+        tbl.ReadColumnarFile()
+        return tbl.lst_dfs[0]
+    raise ValueError(f"ftype not supported for worker reads: {dImportParams['ftype']}")
+
+def ParseFrameTask(dParseParams, df_raw):
+    """
+    Worker task - parse one raw frame's row major blocks with a temporary
+    Table; return (list of block dfs, list of (block_id name, value), stage
+    timings). The frame is not merged here (Table.MergeParsedFrame)
+    10/18/26
+    """
+    tbl = Table('worker', {}, dParseParams)
+    parse = RowMajorTbl(tbl, df_raw)
+    parse.SetBlockIndex()
+    with instrument.TimeStage(tbl, 'block_read'):
+        lst_blocks = parse.ReadBlocksList()
+
+    block_id = RowMajorBlockID(parse)
+    block_id.ConvertTupleToList()
+    lst_block_id_vals = [block_id.BlockIDValue(tup)
+                         for tup in dParseParams.get('block_id_vars', [])]
+    return lst_blocks, lst_block_id_vals, tbl.timings
+
 class CheckInputs:
     """
     Check the tbls dataframes for errors
@@ -416,6 +1512,7 @@ class InterleavedColBlocksTbl():
     def __init__(self, tbl):
 
         #Raw DataFrame and column list parsed from raw data
+        self.tbl = tbl
         self.df_raw = tbl.df_raw
 
         # Start index to allow for initial, blank/unused columns
@@ -429,6 +1526,9 @@ class InterleavedColBlocksTbl():
         # n columns per block
         self.n_cols_block = tbl.dParseParams['n_cols_block']
 
+        # Reshape all blocks in one pass (False uses column-by-column transfer)
+        self.is_vectorized = tbl.dParseParams.get('is_vectorized_parse', True)
+
         self.df = pd.DataFrame()
 
         # Iteration variables
@@ -436,6 +1536,7 @@ class InterleavedColBlocksTbl():
         self.block_name_cur = None
         self.idx_col_cur = None
 
+    @Timed('parse_interleaved')
     def ParseInterleavedBlocksProcedure(self):
         """
         Procedure to parse interleaved blocks of columns
@@ -443,7 +1544,10 @@ class InterleavedColBlocksTbl():
         """
         self.SetDfMetadata()
         self.DeleteTrailingRows()
-        self.TransferAllBlocks()
+        if self.is_vectorized:
+            self.TransferAllBlocksVectorized()
+        else:
+            self.TransferAllBlocks()
     
     def SetDfMetadata(self):
         """
@@ -463,13 +1567,51 @@ class InterleavedColBlocksTbl():
         JDL 3/17/25
         """
         # Find the index of last non-null metadata row
-        idx_last = self.df_metadata.apply(lambda row: \
-            not row.isnull().all(), axis=1).cumsum().idxmax()
+        idx_last = self.df_metadata.notna().any(axis=1).cumsum().idxmax()
 
         # Delete trailing rows from .df_metadata and corresponding .df_raw rows
         self.df_metadata = self.df_metadata.iloc[:idx_last + 1]
         self.df_raw = self.df_raw.iloc[:idx_last + 3]
 
+    def TransferAllBlocksVectorized(self):
+        """
+        Transfer all blocks of columns to .df in one reshape of .df_raw (repeat
+        .df_metadata once per block column and tile block and variable names)
+        10/18/26
+        """
+        idx_block_starts = self.SetBlockStartIndices()
+        idx_cols = (idx_block_starts[:, None] + np.arange(self.n_cols_block)).ravel()
+        n_rows = len(self.df_metadata)
+
+        # Repeat metadata rows once per block column
+        idx_rows = np.tile(np.arange(n_rows), len(idx_cols))
+        self.df = self.df_metadata.iloc[idx_rows].reset_index(drop=True)
+
+        # Block names (.df_raw row index 0) and variable names (row index 1)
+        block_names = self.df_raw.iloc[0, idx_block_starts].to_numpy()
+        self.df['block_name'] = np.repeat(block_names, self.n_cols_block * n_rows)
+        var_names = self.df_raw.iloc[1, idx_cols].to_numpy()
+        self.df['var_name'] = np.repeat(var_names, n_rows)
+
+        # Stack block columns' values column-by-column
+        values = self.df_raw.iloc[2:, idx_cols].to_numpy()
+        self.df['values'] = values.ravel(order='F')
+
+    def SetBlockStartIndices(self):
+        """
+        Return array of .df_raw column indices where blocks start (blocks
+        continue until end of columns or blank block name in row 0)
+        10/18/26
+        """
+        idx_first = self.idx_start + self.n_cols_metadata
+        idx_block_starts = np.arange(idx_first, len(self.df_raw.columns),
+                                     self.n_cols_block)
+
+        # Truncate at first blank block name
+        is_blank = self.df_raw.iloc[0, idx_block_starts].isna().to_numpy()
+        if is_blank.any(): idx_block_starts = idx_block_starts[:is_blank.argmax()]
+        return idx_block_starts
+
     def TransferAllBlocks(self):
         """
         Transfer all blocks of columns to .df
@@ -544,6 +1686,10 @@ class RowMajorTbl():
         self.tbl = tbl
         self.lst_block_ids = []
 
+        #Block index for all blocks (start, header and end bound row indices)
+        self.header_row_indices = []
+        self.end_bound_indices = []
+
         #Start, header, end, first data row indices for current block in loop
         self.idx_start_current = None
         self.idx_header_row = None
@@ -558,19 +1704,15 @@ class RowMajorTbl():
     """
     def ReadBlocksProcedure(self):
         """
-        Procedure to iteratively parse row major blocks
-        JDL 9/26/24
+        Procedure to parse row major blocks (block index for all blocks built
+        in one pass; blocks concatenated to tbl.df once)
+        JDL 9/26/24; Modified 10/18/26
         """
-        # Append blank row at end of .df_raw (to ensure find last <blank> flag)
-        self.AddTrailingBlankRow()
-
-        #Create list of row indices with start bound flag
-        self.SetStartBoundIndices()
+        #Create arrays of start, header and end bound row indices for all blocks
+        self.SetBlockIndex()
 
-        #Iteratively read blocks 
-        for i in self.start_bound_indices:
-            self.idx_start_current = i
-            self.ParseBlockProcedure()
+        #Read blocks and concatenate them to tbl.df
+        self.ReadAllBlocks()
 
         #Extract block_id values if specified (Note: self arg is RowMajorTbl instance)
         self.tbl.df, self.lst_block_ids = RowMajorBlockID(self).ExtractBlockIDs
@@ -582,6 +1724,216 @@ class RowMajorTbl():
         #Optionally stack parsed data (if .dParams['is_stack_parsed_cols']
         #self.StackParsedCols()
 
+    @Timed('block_scan')
+    def SetBlockIndex(self):
+        """
+        Set start, header and end bound row indices for all blocks in one pass
+        (end bound search uses a virtual trailing blank row vs copying .df_raw)
+        10/18/26
+        """
+        dParams = self.tbl.dParseParams
+        n_rows = len(self.df_raw)
+
+        # Rows with start bound flag and corresponding header and data rows
+        col_start = self.df_raw.iloc[:, dParams['icol_start_bound']]
+        idx_starts = np.flatnonzero((col_start == dParams['flag_start_bound']).to_numpy())
+        idx_headers = idx_starts + dParams['iheader_rowoffset_from_flag']
+        idx_data = idx_starts + dParams['idata_rowoffset_from_flag']
+
+        # Candidate end bound rows (<blank> flag ends at virtual row n_rows)
+        col_end = self.df_raw.iloc[:, dParams['icol_end_bound']]
+        is_blank = dParams['flag_end_bound'] == '<blank>'
+        if is_blank:
+            idx_cands = np.flatnonzero(col_end.isnull().to_numpy())
+            idx_cands = np.append(idx_cands, n_rows)
+        else:
+            idx_cands = np.flatnonzero(col_end.eq(dParams['flag_end_bound']).to_numpy())
+
+        # First candidate at/after each block's first data row (or empty block)
+        ipos = np.searchsorted(idx_cands, idx_data)
+        is_found = ipos < len(idx_cands)
+        idx_ends = idx_data.copy()
+        idx_ends[is_found] = idx_cands[ipos[is_found]]
+
+        self.start_bound_indices = idx_starts.tolist()
+        self.header_row_indices = idx_headers.tolist()
+        self.end_bound_indices = idx_ends.tolist()
+
+    @Timed('block_read')
+    def ReadAllBlocks(self):
+        """
+        Read each block in the block index and concatenate once to tbl.df
+        10/18/26
+        """
+        self.tbl.df = pd.concat([self.tbl.df] + self.ReadBlocksList(), axis=0)
+
+    def ReadBlocksList(self):
+        """
+        Return list of block dfs for the block index (sets current block
+        attributes to the last block as in the serial loop)
+        10/18/26
+        """
+        lst_blocks = []
+        zip_idx = zip(self.start_bound_indices, self.header_row_indices,
+                      self.end_bound_indices)
+        for self.idx_start_current, self.idx_header_row, self.idx_end_bound in zip_idx:
+            self.idx_start_data = self.idx_start_current + \
+                self.tbl.dParseParams['idata_rowoffset_from_flag']
+            lst_blocks.append(self.ReadBlock())
+        return lst_blocks
+
+    def ReadBlock(self):
+        """
+        Return current block's data rows with header as column names (drop
+        columns with null column name and all null values)
+        10/18/26
+        """
+        cols = pd.Index(self.df_raw.iloc[self.idx_header_row].values)
+        df_block = self.df_raw.iloc[self.idx_start_data:self.idx_end_bound]
+
+        # Subset columns positionally and set column names
+        fil = (~cols.isnull() & df_block.notna().any().to_numpy())
+        df_block = df_block.iloc[:, fil]
+        df_block.columns = cols[fil]
+        return df_block
+
+    """
+    ================================================================================
+    Streaming parse -- rows from an iterator (e.g. openpyxl read_only rows);
+    memory scales with open blocks plus a lookback buffer (vs whole sheet)
+    ================================================================================
+    """
+    @Timed('block_scan')
+    def ReadBlocksStreamProcedure(self, iter_rows):
+        """
+        Procedure to parse row major blocks row by row from iter_rows and
+        concatenate them (in start row order) to tbl.df. Block values are raw
+        cells (object dtype; str if import_dtype is str); block_id_vars values
+        are set per block
+        10/18/26
+        """
+        self.SetStreamParams()
+        buffer = deque(maxlen=self.n_lookback + 1)
+        lst_open, dict_closed = [], {}
+
+        for idx, row in enumerate(iter_rows):
+            row = self.StreamRowValues(row)
+            buffer.append((idx, row))
+
+            # Open a block at start flag (header/block_id rows from buffer)
+            if GetCell(row, self.dStream['icol_start']) == self.dStream['flag_start']:
+                lst_open.append(self.OpenStreamBlock(idx, buffer))
+
+            # Add row to open blocks; close blocks at their end bound
+            for block in list(lst_open):
+                if self.AddStreamRow(block, idx, row):
+                    lst_open.remove(block)
+                    dict_closed[block['idx_start']] = self.StreamBlockDf(block)
+
+        # End of rows is end bound for <blank> flag (else block is empty)
+        for block in lst_open:
+            if not self.dStream['is_blank']: block['lst_rows'] = []
+            dict_closed[block['idx_start']] = self.StreamBlockDf(block)
+
+        lst_blocks = [self.tbl.df] + [dict_closed[i] for i in sorted(dict_closed)]
+        self.tbl.df = pd.concat(lst_blocks, axis=0).reset_index(drop=True)
+
+    def SetStreamParams(self):
+        """
+        Set .dStream flags, offsets and block_id_vars from tbl.dParseParams
+        and .n_lookback (rows before a start flag needed for header/block_ids)
+        10/18/26
+        """
+        dParams = self.tbl.dParseParams
+        lst_ids = dParams.get('block_id_vars', [])
+        if isinstance(lst_ids, tuple): lst_ids = [lst_ids]
+
+        self.dStream = {'flag_start':dParams['flag_start_bound'],
+            'icol_start':dParams['icol_start_bound'],
+            'flag_end':dParams['flag_end_bound'],
+            'icol_end':dParams['icol_end_bound'],
+            'is_blank':dParams['flag_end_bound'] == '<blank>',
+            'ioff_header':dParams['iheader_rowoffset_from_flag'],
+            'ioff_data':dParams['idata_rowoffset_from_flag'],
+            'is_str':dParams.get('import_dtype') == str,
+            'lst_ids':lst_ids}
+
+        lst_offsets = [self.dStream['ioff_header']] + \
+            [self.dStream['ioff_data'] + tup[1] for tup in lst_ids]
+        self.n_lookback = max([0] + [-ioff for ioff in lst_offsets])
+
+    def StreamRowValues(self, row):
+        """
+        Return row tuple with blanks/errors as None (and str values if
+        import_dtype is str) to match pd.read_excel raw import
+        10/18/26
+        """
+        row = tuple(None if (v is None or v == '' or v in ERROR_CODES) else v
+                    for v in row)
+        if self.dStream['is_str']: row = tuple(pd_util.CellToStr(v) for v in row)
+        return row
+
+    def OpenStreamBlock(self, idx, buffer):
+        """
+        Return dict for block starting at row idx; header and block_id rows
+        already read are taken from buffer
+        10/18/26
+        """
+        idx_data = idx + self.dStream['ioff_data']
+        block = {'idx_start':idx, 'idx_header':idx + self.dStream['ioff_header'],
+                 'idx_data':idx_data, 'header':(), 'lst_rows':[], 'lst_idx':[],
+                 'lst_ids':[(tup[0], idx_data + tup[1], tup[2])
+                            for tup in self.dStream['lst_ids']],
+                 'dict_ids':{tup[0]:None for tup in self.dStream['lst_ids']}}
+
+        for idx_buf, row_buf in buffer:
+            if idx_buf < idx: self.SetStreamBlockRefs(block, idx_buf, row_buf)
+        return block
+
+    def SetStreamBlockRefs(self, block, idx, row):
+        """
+        Set block header and block_id values if row idx is one of their rows
+        10/18/26
+        """
+        if idx == block['idx_header']: block['header'] = row
+        for name, idx_id, icol in block['lst_ids']:
+            if idx == idx_id: block['dict_ids'][name] = GetCell(row, icol)
+
+    def AddStreamRow(self, block, idx, row):
+        """
+        Add row to block's data rows; return True if row is its end bound
+        10/18/26
+        """
+        self.SetStreamBlockRefs(block, idx, row)
+        if idx < block['idx_data']: return False
+
+        val_end = GetCell(row, self.dStream['icol_end'])
+        if self.dStream['is_blank'] and val_end is None: return True
+        if not self.dStream['is_blank'] and val_end == self.dStream['flag_end']:
+            return True
+
+        block['lst_rows'].append(row)
+        block['lst_idx'].append(idx)
+        return False
+
+    def StreamBlockDf(self, block):
+        """
+        Return block df with header as column names (drop columns with null
+        column name or all null values) plus block_id columns
+        10/18/26
+        """
+        lst_rows, header = block['lst_rows'], block['header']
+        n_cols = max([len(header)] + [len(row) for row in lst_rows])
+        lst_keep = [i for i in range(n_cols) if GetCell(header, i) is not None and
+                    any(GetCell(row, i) is not None for row in lst_rows)]
+
+        df_block = pd.DataFrame([[GetCell(row, i) for i in lst_keep] for row in lst_rows],
+                                columns=[header[i] for i in lst_keep],
+                                index=block['lst_idx'], dtype=object)
+        for name, val in block['dict_ids'].items():
+            df_block[name] = val
+        return df_block
+
     def AddTrailingBlankRow(self):
         """
         Add a trailing blank row to self.df_raw (to ensure last <blank> flag to
@@ -797,14 +2149,21 @@ class RowMajorBlockID:
         Set internal values based current block_id tuple
         JDL 9/27/24; Modified 4/22/25 for RowMajorTbl refactor
         """
-        name, row_offset = tup_block_id[0], tup_block_id[1]
-        idx_row, idx_col = self.idx_start_data + row_offset, tup_block_id[2]
+        name, value_block_id = self.BlockIDValue(tup_block_id)
 
         #Set the current value and add the name list
-        value_block_id = self.df_raw.iloc[idx_row, idx_col]
         self.block_id_names.append(name)
         self.tbl.df[name] = value_block_id
 
+    def BlockIDValue(self, tup_block_id):
+        """
+        Return (name, value) for block_id tuple from df_raw
+        10/18/26
+        """
+        name, row_offset = tup_block_id[0], tup_block_id[1]
+        idx_row, idx_col = self.idx_start_data + row_offset, tup_block_id[2]
+        return name, self.df_raw.iloc[idx_row, idx_col]
+
     def ReorderColumns(self):
         """
         Reorder so that block_id columns are first
@@ -34,12 +34,59 @@ def test_DataIngestionProcedure(tbls, col_info):
     """
     Procedure to import Excel data, subset to keep_cols_import and
     replace import names
-    JDL 4/3/25
+    JDL 4/3/25; Modified 10/18/26 (keep cols and renames applied at read)
+    """
+    col_info.DataIngestionProcedure(tbls)
+
+    assert list(tbls.ExampleTbl1.df.columns) == ['date1', 'col_1a', 'col_1b']
+    assert list(tbls.ExampleTbl2.df.columns) == ['date2', 'col_2a', 'col_2c']
+    assert len(tbls.ExampleTbl2.df) == 6
+
+    # ColInfo types set at read
+    assert tbls.ExampleTbl2.df['col_2a'].iloc[0] == '1'
+    assert tbls.ExampleTbl2.df['col_2c'].dtype == 'float64'
+    assert tbls.ExampleTbl2.df['date2'].dtype == 'datetime64[ns]'
+
+def test_DataIngestionProcedure_arrow(files, col_info):
+    """
+    ProjectTables(dtype_backend='pyarrow') reads input tables to
+    Arrow-backed columns with the same values as the NumPy backend
+    (ColInfo sheet is read NumPy-backed)
+    10/18/26
     """
+    tbls = ProjectTables(files, dtype_backend='pyarrow')
+    assert 'dtype_backend' not in tbls.ColInfo.dImportParams
+    assert not any(isinstance(dtype, pd.ArrowDtype) for dtype in tbls.ColInfo.df.dtypes)
     col_info.DataIngestionProcedure(tbls)
+    tbls_numpy = ProjectTables(files)
+    col_info.DataIngestionProcedure(tbls_numpy)
 
-    print('\n\n', tbls.ExampleTbl1.df)
-    print('\n', tbls.ExampleTbl2.df, '\n')
+    for tbl_name in ['ExampleTbl1', 'ExampleTbl2']:
+        df, df_numpy = getattr(tbls, tbl_name).df, getattr(tbls_numpy, tbl_name).df
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        pd.testing.assert_frame_equal(df.astype(df_numpy.dtypes.to_dict()), df_numpy)
+
+    # Removing the backend restores NumPy-backed reads
+    tbls.SetDtypeBackend(None)
+    tbls.ImportExcelInputs()
+    assert tbls.ExampleTbl2.df['col_2c'].dtype == 'float64'
+
+def test_DataIngestionScheduled(files, tbls, col_info):
+    """
+    DataIngestionProcedure with ColInfo setup, per-table ColInfo apply
+    and imports run as a DAG on n_workers threads (see
+    ProjectTables.ImportScheduled); return IngestScheduler
+    10/18/26
+    """
+    scheduler = col_info.DataIngestionScheduled(tbls, n_workers=2)
+    tbls_serial = ProjectTables(files)
+    col_info.DataIngestionProcedure(tbls_serial)
+
+    for tbl_name in ['ExampleTbl1', 'ExampleTbl2']:
+        pd.testing.assert_frame_equal(getattr(tbls, tbl_name).df,
+                                      getattr(tbls_serial, tbl_name).df)
+    assert len(scheduler.df_schedule) == 6
+    assert scheduler.lst_critical_path[0] == ('ColInfo', 'import')
 
 def test_ReplaceImportNames1(col_info, tbls):
     """
@@ -75,6 +122,30 @@ def test_ReplaceImportNames2(col_info, tbls):
     expected = ['date2', 'col_2a', 'col_2c']
     assert list(tbls.ExampleTbl2.df.columns) == expected
 
+def test_SetTblImportCols(col_info, tbls):
+    """
+    Set tbl.dImportParams['usecols'] to keep_col_import names,
+    ['dict_rename'] to map them to names, ['dtypes'] to their ColInfo
+    types and ['dict_defaults'] to their val_default so file readers only
+    read kept columns, set types and defaults and rename at read time
+    10/18/26
+    """
+    col_info.SetFlagColsBoolean(tbls)
+    col_info.SetTblImportCols(tbls, 'ExampleTbl2')
+
+    # col_dummy is not a keep column
+    expected = ['date2_import_name', 'col_2a_import_name', 'col_2c_import_name']
+    assert tbls.ExampleTbl2.dImportParams['usecols'] == expected
+    assert tbls.ExampleTbl2.dImportParams['dict_rename']['col_2c_import_name'] == 'col_2c'
+    assert 'usecols' not in tbls.ExampleTbl1.dImportParams
+    assert tbls.ExampleTbl2.dImportParams['dtypes']['date2_import_name'] == 'date'
+
+    # No val_default values in test col_info.xlsx
+    assert tbls.ExampleTbl2.dImportParams['dict_defaults'] == {}
+
+    # No bool/category types or storage hints in test col_info.xlsx
+    assert tbls.ExampleTbl2.dImportParams['memory_hints'] == {}
+
 def test_SetTblKeepColsFromImport(col_info, tbls):
     """
     Subset tbl.df columns based on ColInfo.df
@@ -103,6 +174,49 @@ def test_tbls_ImportExcelInputs(tbls):
     assert len(tbls.ExampleTbl1.df) == 3
     assert len(tbls.ExampleTbl2.df) == 6
 
+def test_tbls_TimingsSummary(tbls, col_info):
+    """
+    Return df of all tables' stage timings (table, stage, wall, cpu, n_calls)
+    10/18/26
+    """
+    col_info.DataIngestionProcedure(tbls)
+    df = tbls.TimingsSummary()
+    assert set(df['table']) == {'ExampleTbl1', 'ExampleTbl2', 'ColInfo'}
+
+    df_tbl1 = df[df['table'] == 'ExampleTbl1']
+    assert list(df_tbl1['stage'])[0] == 'colinfo_setup'
+    assert {'open_file', 'read_file', 'subset_rename', 'set_types',
+            'concat', 'import'} <= set(df_tbl1['stage'])
+
+def test_tbls_MemorySummary(tbls, col_info):
+    """
+    Return df of all tables' stage memory rows (tracemalloc peak/retained
+    bytes and deep df/df_raw/lst_dfs bytes; empty unless tracking is on)
+    10/18/26
+    """
+    col_info.DataIngestionProcedure(tbls)
+    assert tbls.MemorySummary().empty
+
+    tbls.SetMemoryTracking(lst_tbls=[tbls.ExampleTbl2])
+    tbls.ExampleTbl2.ImportToTblDf()
+    df = tbls.MemorySummary()
+    assert set(df['table']) == {'ExampleTbl2'}
+    assert df['stage'].iloc[-1] == 'import'
+    assert df['df_bytes'].iloc[-1] == tbls.ExampleTbl2.df.memory_usage(deep=True).sum()
+
+def test_tbls_SetProfileHook(tbls, col_info, tmp_path):
+    """
+    Profile stage (e.g. 'read_file') with cProfile for lst_tbls (default
+    all tables); stats written to files.path_profile as <tbl>_<stage>.prof
+    10/18/26
+    """
+    tbls.files.path_profile = str(tmp_path) + os.sep
+    tbls.SetProfileHook('read_file', lst_tbls=[tbls.ExampleTbl1])
+    col_info.DataIngestionProcedure(tbls)
+
+    assert os.listdir(tmp_path) == ['ExampleTbl1_read_file.prof']
+    assert tbls.ExampleTbl2.pf_profile is None
+
 def test_SetFlagColsBoolean(col_info, tbls):
     """
     Fill False for NaN values in tblCI flag columns 
@@ -0,0 +1,144 @@
+# Version 10/18/26
+import sys, os
+import pandas as pd
+import numpy as np
+import pytest
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+from colinfo import ColInfo
+
+@pytest.fixture
+def colinfo():
+    """
+    ColInfo instance with in-memory .dftable (bypass __init__ file import)
+    10/18/26
+    """
+    ci = ColInfo.__new__(ColInfo)
+    ci.col_type, ci.col_importname, ci.col_defaultval = 'type', 'name_import', 'val_default'
+    ci.col_storage = 'storage'
+    idx = pd.Index(['date1', 'qty', 'region', 'flag', 'dup_a', 'dup_b'], name='name')
+    ci.dftable = pd.DataFrame(index=idx,
+        data={'name_import':['Date', 'Qty', 'Region', 'Flag', 'Dup', 'Dup'],
+              'type':['date', 'float', 'str', 'bool', 'int', 'int'],
+              'val_default':[np.nan, 0.0, 'none', np.nan, 1, 2]})
+    ci.BuildLookupDicts()
+    return ci
+
+@pytest.fixture
+def df_import():
+    return pd.DataFrame({'Date':['2025-01-01', '2025-02-01'], 'Qty':[1.5, np.nan],
+                         'Region':['east', 'nan'], 'Dup':[1, 2], 'Other':['a', 'b']})
+
+"""
+=============================================================================
+Class ColInfo - dict lookups and bulk rename, type and default operations
+=============================================================================
+"""
+def test_BuildLookupDicts(colinfo):
+    """
+    Build dicts from .dftable once for bulk rename, type and default
+    operations (vs boolean scan of .dftable for each column)
+    10/18/26
+    """
+    assert colinfo.dict_import_to_name['Qty'] == 'qty'
+    assert colinfo.dict_import_to_name['Dup'] == 'dup_a'
+    assert 'Dup' not in colinfo.dict_import_to_name_unique
+    assert colinfo.dict_name_to_type['date1'] == 'date'
+    assert colinfo.dict_name_to_default['qty'] == 0.0
+
+def test_RenameDFColsFromImport(colinfo, df_import):
+    """
+    Rename df columns and index name(s) from import names to ColInfo names
+    10/18/26
+    """
+    df = colinfo.RenameDFColsFromImport(df_import.set_index('Date'))
+    assert list(df.columns) == ['qty', 'region', 'dup_a', 'Other']
+    assert df.index.name == 'date1'
+
+def test_SetTypes(colinfo, df_import):
+    """
+    Set DF col variable types based on ColInfo
+    10/18/26
+    """
+    df = colinfo.SetTypes(df_import, IsImportNames=True)
+    assert df['Date'].dtype == 'datetime64[ns]'
+    assert df['Qty'].dtype == 'float64'
+
+    # Dup import name is on two ColInfo rows; Other not in ColInfo
+    assert df['Dup'].dtype == 'int64'
+    assert df['Other'].dtype == object
+
+def test_SetDefaultVals(colinfo, df_import):
+    """
+    Set DF col default values based on ColInfo
+    10/18/26
+    """
+    df = colinfo.SetDefaultVals(df_import, IsImportNames=True)
+    assert list(df['Qty']) == [1.5, 0.0]
+    assert list(df['Region']) == ['east', 'none']
+
+    # ColInfo names (not import names) after rename
+    df = colinfo.RenameDFColsFromImport(df_import)
+    df.loc[0, 'qty'] = np.nan
+    df = colinfo.SetDefaultVals(df, IsImportNames=False, lstCols=['qty'])
+    assert list(df['qty']) == [0.0, 0.0]
+
+def test_SetTypes_arrow(colinfo, df_import):
+    """
+    Arrow-backed columns keep Arrow dtypes (e.g. str -> string[pyarrow]
+    vs object with '<NA>' strings)
+    10/18/26
+    """
+    df_import = df_import.convert_dtypes(dtype_backend='pyarrow')
+    df_import.loc[1, 'Region'] = None
+    df = colinfo.SetTypes(df_import, IsImportNames=True)
+    assert str(df['Date'].dtype) == 'timestamp[ns][pyarrow]'
+    assert str(df['Qty'].dtype) == 'double[pyarrow]'
+    assert str(df['Region'].dtype) == 'string[pyarrow]'
+    assert df['Region'].isna().tolist() == [False, True]
+
+def test_SetDefaultVals_arrow(colinfo, df_import):
+    """
+    Arrow-backed columns (fill values cast to str for string columns)
+    10/18/26
+    """
+    df_import = df_import.convert_dtypes(dtype_backend='pyarrow')
+    df = colinfo.SetDefaultVals(df_import, IsImportNames=True)
+    assert list(df['Qty']) == [1.5, 0.0]
+    assert list(df['Region']) == ['east', 'none']
+    assert str(df['Region'].dtype) == 'string[pyarrow]'
+
+    # Numeric default for a string column
+    colinfo.dict_name_to_default['region'] = 0.0
+    df = colinfo.SetDefaultVals(df_import, IsImportNames=True)
+    assert list(df['Region']) == ['east', '0']
+
+def test_RecodeFlagColsToBool(colinfo):
+    """
+    Recode all flag (boolean) columns from 1/blank to Boolean coding
+    (columns with non flag-like values are left unchanged)
+    JDL 5/22/22; Modified 10/18/26 implemented with pd_util
+    """
+    df = pd.DataFrame({'Flag':[1, None, 1], 'Qty':[1, None, 1]})
+    df = colinfo.RecodeFlagColsToBool(df, IsImportNames=True)
+    assert list(df['Flag']) == [True, False, True]
+    assert df['Qty'].dtype == 'float64'
+
+def test_OptimizeMemory(colinfo):
+    """
+    Return (df with categoricals, downcast numerics and bool flags, df
+    report of bytes saved per column) using ColInfo types/storage hints
+    10/18/26
+    """
+    df = pd.DataFrame({'region':['east', 'west', 'east', 'east'],
+                       'flag':[1, None, None, 1], 'qty':[1.5, 2.0, 0.25, 8.0]})
+    df_opt, df_report = colinfo.OptimizeMemory(df)
+    assert list(df_opt.dtypes.astype(str)) == ['category', 'bool', 'float32']
+
+    # 'storage' hint overrides type and cardinality
+    colinfo.dftable['storage'] = [None, None, 'keep', None, None, None]
+    df_opt, df_report = colinfo.OptimizeMemory(df)
+    assert df_opt['region'].dtype == object
+    assert df_report.loc['region', 'bytes_saved'] == 0
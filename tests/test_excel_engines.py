@@ -0,0 +1,144 @@
+# Version 10/18/26
+import sys, os, glob
+import pandas as pd
+import pytest
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+import excel_engines
+from excel_engines import ValuesExcelFile, OpenExcelFile, RegisterExcelEngine
+from projfiles import Files
+
+@pytest.fixture
+def files():
+    return Files(IsTest=True, subdir_tests='test_data')
+
+"""
+=============================================================================
+Engine registry
+=============================================================================
+"""
+def test_OpenExcelFile(files):
+    """
+    Return workbook handle for pf from named engine (None for pandas default)
+    10/18/26
+    """
+    pf = files.path_data + 'Example2_multisheet.xlsx'
+    for engine in [None, 'openpyxl', 'values']:
+        with OpenExcelFile(pf, engine) as xl:
+            assert xl.sheet_names == ['data1', 'data2']
+
+    with pytest.raises(ValueError, match='Unrecognized Excel engine'):
+        OpenExcelFile(pf, 'not_an_engine')
+
+def test_RegisterExcelEngine(files, monkeypatch):
+    """
+    Add or replace a named engine in dict_excel_engines
+    10/18/26
+    """
+    monkeypatch.setattr(excel_engines, 'dict_excel_engines',
+                        dict(excel_engines.dict_excel_engines))
+    RegisterExcelEngine('values2', ValuesExcelFile)
+    with OpenExcelFile(files.path_data + 'Example2.xlsx', 'values2') as xl:
+        assert isinstance(xl, ValuesExcelFile)
+
+"""
+=============================================================================
+ValuesExcelFile Class
+=============================================================================
+"""
+def test_ValuesExcelFile_parse(files):
+    """
+    Return df (or dict of dfs if sheet_name is list or None) for sheet(s)
+    with same header/skiprows/usecols/dtype handling as pd.read_excel
+    10/18/26
+    """
+    # Same values and dtypes as openpyxl for all test workbooks and sheets
+    lst_pf = glob.glob(os.path.join(files.path_data, '..', 'test_data*', '*.xlsx'))
+    for pf in lst_pf:
+        for header in [0, None]:
+            dict_expected = pd.read_excel(pf, sheet_name=None, header=header)
+            with ValuesExcelFile(pf) as xl:
+                dict_dfs = xl.parse(sheet_name=None, header=header)
+            for sht, df_expected in dict_expected.items():
+                pd.testing.assert_frame_equal(dict_dfs[sht], df_expected)
+
+    # skiprows, usecols and dtype
+    pf = files.path_data + 'Example2_skiprows.xlsx'
+    kwargs = {'sheet_name':'data', 'skiprows':2, 'dtype':{'col_2a_import_name':str},
+              'usecols':['col_2a_import_name', 'date2_import_name']}
+    with ValuesExcelFile(pf) as xl:
+        pd.testing.assert_frame_equal(xl.parse(**kwargs), pd.read_excel(pf, **kwargs))
+
+def test_ValuesExcelFile_escapes(tmp_path):
+    """
+    Return text with _xHHHH_ escapes decoded to their characters
+    10/18/26
+    """
+    from openpyxl import Workbook
+    pf = str(tmp_path) + os.sep + 'escapes.xlsx'
+    wb = Workbook()
+    wb.active.title = 'data'
+    for val in ['txt', 'a_x000D_b', 'c_x005F_x000D_d', 'e_x00e9_', 'plain_x']:
+        wb.active.append([val])
+    wb.save(pf)
+
+    with ValuesExcelFile(pf) as xl:
+        df = xl.parse('data')
+    assert list(df['txt']) == ['a\rb', 'c_x000D_d', 'e\u00e9', 'plain_x']
+
+def test_SheetNamesFromZip(files):
+    """
+    Return sheet names in workbook order from xl/workbook.xml of an .xlsx/.xlsm
+    zip (no workbook object, shared strings or sheet data loaded); None if pf
+    is not a SpreadsheetML zip (e.g. .xls, .xlsb, .ods)
+    10/18/26
+    """
+    pf = files.path_data + 'Example2_multisheet.xlsx'
+    assert excel_engines.SheetNamesFromZip(pf) == ['data1', 'data2']
+    assert excel_engines.SheetNamesFromZip(files.path_data + 'Example2.csv') is None
+
+def test_ProbeWorkbook(files):
+    """
+    Return dict of 'sheet_names' (workbook order) and 'sheets' (name: dict of
+    'index', 'path', 'dimension' ref and 'n_rows'/'n_cols' or None if sheet
+    has no dimension) for an .xlsx/.xlsm zip; None if pf is not a
+    SpreadsheetML zip (e.g. .xls, .xlsb, .ods). Cached by path and mtime
+    10/18/26
+    """
+    excel_engines.ClearWorkbookProbes()
+    dProbe = excel_engines.ProbeWorkbook(files.path_data + 'Example2_multisheet.xlsx')
+    assert dProbe['sheet_names'] == ['data1', 'data2']
+    assert dProbe['sheets']['data2']['index'] == 1
+    assert dProbe['sheets']['data2']['dimension'] == 'A1:D5'
+    assert (dProbe['sheets']['data2']['n_rows'], dProbe['sheets']['data2']['n_cols']) == (5, 4)
+
+    # Offset used range
+    dProbe = excel_engines.ProbeWorkbook(files.path_data + 'tbl1_raw.xlsx')
+    assert dProbe['sheets']['raw_table']['dimension'] == 'B3:E13'
+    assert excel_engines.ProbeWorkbook(files.path_data + 'Example2.csv') is None
+
+def test_ProbeWorkbook_cache(files, tmp_path):
+    """
+    Probe results are reused until file's size/mtime changes
+    10/18/26
+    """
+    pf = str(tmp_path / 'probe.xlsx')
+    pd.DataFrame({'a':[1, 2]}).to_excel(pf, sheet_name='first', index=False)
+    dProbe = excel_engines.ProbeWorkbook(pf)
+    assert excel_engines.ProbeWorkbook(pf) is dProbe
+
+    # Rewrite with a different sheet and bump mtime: probed again
+    with pd.ExcelWriter(pf) as writer:
+        pd.DataFrame({'a':[1, 2, 3]}).to_excel(writer, sheet_name='second', index=False)
+        pd.DataFrame({'b':[1]}).to_excel(writer, sheet_name='third', index=False)
+    stat = os.stat(pf)
+    os.utime(pf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    dProbe2 = excel_engines.ProbeWorkbook(pf)
+    assert dProbe2 is not dProbe
+    assert dProbe2['sheet_names'] == ['second', 'third']
+    assert dProbe2['sheets']['second']['n_rows'] == 4
+
+    excel_engines.ClearWorkbookProbes()
+    assert excel_engines.ProbeWorkbook(pf) is not dProbe2
@@ -0,0 +1,158 @@
+# Version 10/18/26
+import sys, os, time
+import pandas as pd
+import pytest
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+from ingest_cache import IngestCache, WriteFrame, ReadFrame
+from projfiles import Files
+
+@pytest.fixture
+def files():
+    return Files(IsTest=True, subdir_tests='test_data')
+
+@pytest.fixture
+def cache(tmp_path):
+    return IngestCache(str(tmp_path) + os.sep + 'cache' + os.sep)
+
+@pytest.fixture
+def df_example():
+    return pd.DataFrame({'a':[1, 2, 3], 'b':['x', None, 'z']})
+
+"""
+=============================================================================
+IngestCache Class
+=============================================================================
+"""
+def test_init(cache):
+    """
+    Test - cache folder created and empty index
+    10/18/26
+    """
+    assert os.path.isdir(cache.path_cache)
+    assert cache.dict_index == {}
+    assert cache.key_mode == 'mtime'
+
+def test_BuildKey(cache, files, tmp_path):
+    """
+    Return cache key from stage ('import' or 'parse'), source files'
+    signatures and canonical hash of import and parse params
+    10/18/26
+    """
+    lst_files = [files.path_data + 'Example2.csv']
+    dImport = {'ftype':'csv', 'lst_files':'Example2.csv'}
+    key = cache.BuildKey('import', lst_files, dImport, {'parse_type':'none'})
+
+    # Same inputs (and params not affecting results) give same key
+    dImport2 = dict(dImport, n_workers=4)
+    assert cache.BuildKey('import', lst_files, dImport2, {'parse_type':'none'}) == key
+
+    # Changed stage or params give different keys
+    assert cache.BuildKey('parse', lst_files, dImport, {'parse_type':'none'}) != key
+    dParse = {'parse_type':'none', 'import_dtype':str}
+    assert cache.BuildKey('import', lst_files, dImport, dParse) != key
+
+    # Changed file contents give different key (size/mtime or content hash)
+    pf = str(tmp_path) + os.sep + 'temp.csv'
+    for key_mode in ['mtime', 'hash']:
+        cache.key_mode = key_mode
+        with open(pf, 'w') as f: f.write('a\n1\n')
+        key1 = cache.BuildKey('import', [pf], dImport, {})
+        with open(pf, 'w') as f: f.write('a\n12\n')
+        assert cache.BuildKey('import', [pf], dImport, {}) != key1
+
+def test_Save_Load(cache, df_example):
+    """
+    Save list of dfs as a cache entry; Load returns (kind, lst of dfs)
+    10/18/26
+    """
+    assert cache.Load('key1') is None
+
+    df_raw = pd.DataFrame([[None, 'x'], [1.0, 'y']])
+    cache.Save('key1', 'tbl1', 'lst_dfs', [df_example, df_raw])
+    kind, lst_dfs = IngestCache(cache.path_cache).Load('key1')
+
+    assert kind == 'lst_dfs'
+    pd.testing.assert_frame_equal(lst_dfs[0], df_example)
+    pd.testing.assert_frame_equal(lst_dfs[1], df_raw)
+
+def test_Evict(cache, df_example):
+    """
+    Remove least-recently-used entries until total bytes <= .max_bytes
+    10/18/26
+    """
+    for key in ['key1', 'key2', 'key3']:
+        cache.Save(key, 'tbl1', 'df', [df_example])
+        time.sleep(0.01)
+    cache.Load('key1')
+
+    # Limit allows two entries; key2 is least recently used
+    cache.max_bytes = 2 * cache.dict_index['key1']['bytes']
+    cache.Evict()
+    assert sorted(cache.dict_index) == ['key1', 'key3']
+    assert not os.path.exists(cache.path_cache + 'key2')
+
+def test_Invalidate(cache, df_example):
+    """
+    Remove all entries or only those for tbl_name
+    10/18/26
+    """
+    cache.Save('key1', 'tbl1', 'df', [df_example])
+    cache.Save('key2', 'tbl2', 'df', [df_example])
+
+    cache.Invalidate('tbl1')
+    assert list(cache.dict_index) == ['key2']
+
+    cache.Invalidate()
+    assert cache.dict_index == {}
+    assert cache.total_bytes == 0
+
+def test_WriteFrame(tmp_path, df_example):
+    """
+    Write df as feather if columnar-compatible (str column names, default
+    index, single-type columns) else as pickle; return file name
+    10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path) + os.sep
+    assert WriteFrame(df_example, path + 'df1') == 'df1.feather'
+
+    # Integer column names (header=None raw import) and mixed types
+    df_raw = pd.DataFrame([['flag', 1], [2.5, 'x']])
+    assert WriteFrame(df_raw, path + 'df2') == 'df2.pkl'
+    pd.testing.assert_frame_equal(ReadFrame(path + 'df2.pkl'), df_raw)
+
+def test_concurrent_imports(tmp_path):
+    """
+    Concurrent imports of tables sharing one path_cache (separate
+    IngestCache instances share a lock; index replaced atomically and
+    merged so no entries are lost)
+    10/18/26
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from projtables import Table
+
+    path = str(tmp_path) + os.sep
+    path_cache = path + 'cache' + os.sep
+    for i in range(8):
+        pd.DataFrame({'a':range(i + 1), 'b':['x'] * (i + 1)}).to_csv(
+            path + f'f{i}.csv', index=False)
+
+    def ImportTbl(i):
+        dImportParams = {'ftype':'csv', 'import_path':path, 'lst_files':f'f{i}.csv',
+                         'path_cache':path_cache}
+        tbl = Table(f'tbl{i}', dImportParams)
+        tbl.ImportToTblDf()
+        return len(tbl.df)
+
+    # Save (misses) then load (hits) concurrently
+    for _ in range(2):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert list(pool.map(ImportTbl, range(8))) == list(range(1, 9))
+
+    cache = IngestCache(path_cache)
+    assert sorted(entry['tbl_name'] for entry in cache.dict_index.values()) == \
+        [f'tbl{i}' for i in range(8)]
+    assert not [f for f in os.listdir(path_cache) if f.endswith('.tmp')]
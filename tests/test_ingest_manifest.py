@@ -0,0 +1,80 @@
+# Version 10/18/26
+import sys, os, time
+import pandas as pd
+import pytest
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+from ingest_manifest import IngestManifest
+
+@pytest.fixture
+def manifest(tmp_path):
+    return IngestManifest(str(tmp_path) + os.sep + 'incremental' + os.sep, 'tbl1')
+
+@pytest.fixture
+def dict_paths(tmp_path):
+    """
+    dict of file name: path for two small files in tmp_path
+    10/18/26
+    """
+    dict_paths = {}
+    for f, text in [('a.csv', 'x\n1\n'), ('b.csv', 'x\n2\n')]:
+        dict_paths[f] = str(tmp_path) + os.sep + f
+        with open(dict_paths[f], 'w') as fh: fh.write(text)
+    return dict_paths
+
+"""
+=============================================================================
+IngestManifest Class
+=============================================================================
+"""
+def test_DiffFiles(manifest, dict_paths):
+    """
+    Return dict of 'new', 'changed', 'deleted' and 'unchanged' file name
+    lists for dict_paths (file name: path) vs manifest; sets
+    .dict_entries_pending with entries for new/changed files
+    10/18/26
+    """
+    dDiff = manifest.DiffFiles(dict_paths)
+    assert dDiff == {'new':['a.csv', 'b.csv'], 'changed':[], 'deleted':[], 'unchanged':[]}
+    manifest.CommitFiles(dDiff)
+    manifest.WriteManifest()
+
+    # Re-read manifest; rewrite a.csv with new contents, touch b.csv, remove c.csv
+    manifest = IngestManifest(manifest.path_store, 'tbl1')
+    manifest.dict_files['c.csv'] = dict(manifest.dict_files['a.csv'])
+    time.sleep(0.01)
+    with open(dict_paths['a.csv'], 'w') as fh: fh.write('x\n3\n')
+    os.utime(dict_paths['b.csv'])
+
+    dDiff = manifest.DiffFiles(dict_paths)
+    assert dDiff == {'new':[], 'changed':['a.csv'], 'deleted':['c.csv'],
+                     'unchanged':['b.csv']}
+    assert list(manifest.dict_entries_pending) == ['a.csv']
+
+def test_SetParamsKey(manifest):
+    """
+    Set .params_key from import/parse params; return True if params
+    changed since last ingestion
+    10/18/26
+    """
+    dImport = {'ftype':'csv', 'lst_files':['a.csv']}
+    assert not manifest.SetParamsKey(dImport, {}, ['lst_files'])
+    assert not manifest.SetParamsKey(dict(dImport, lst_files=['a.csv', 'b.csv']),
+                                     {}, ['lst_files'])
+    assert manifest.SetParamsKey(dImport, {'is_unstructured':True}, ['lst_files'])
+
+def test_WriteBase_Reset(manifest):
+    """
+    Write base table df and read it back; Reset removes manifest and base
+    10/18/26
+    """
+    df = pd.DataFrame({'x':[1, 2], 'source_file':['a.csv', 'b.csv']})
+    manifest.WriteBase(df)
+    manifest.WriteManifest()
+    pd.testing.assert_frame_equal(IngestManifest(manifest.path_store, 'tbl1').ReadBase(), df)
+
+    manifest.Reset()
+    assert os.listdir(manifest.path_store) == []
+    assert manifest.ReadBase() is None
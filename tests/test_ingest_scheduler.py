@@ -0,0 +1,120 @@
+# Version 10/18/26
+import sys, os
+import pytest
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+from ingest_scheduler import IngestScheduler
+from col_info import ColumnInfo
+from projfiles import Files
+from projtables import ProjectTables, Table
+
+@pytest.fixture
+def files():
+    return Files(IsTest=True, subdir_tests='test_data')
+
+@pytest.fixture
+def tbls(files):
+    """
+    tbls with a row major raw table (TblRaw) added to CSV inputs list
+    10/18/26
+    """
+    tbls = ProjectTables(files)
+    dImportParams={'ftype':'excel', 'import_path':files.path_data,
+                   'lst_files':'tbl1_raw.xlsx', 'sht':'raw_table'}
+    dParseParams={'is_unstructured':True, 'import_dtype':str, 'parse_type':'row_major',
+        'flag_start_bound':'Answer Choices', 'flag_end_bound':'<blank>',
+        'icol_start_bound':0, 'icol_end_bound':0,
+        'iheader_rowoffset_from_flag':0, 'idata_rowoffset_from_flag':1}
+    tbls.TblRaw = Table('TblRaw', dImportParams, dParseParams)
+    tbls.lstImportsCSV = [tbls.TblRaw]
+    return tbls
+
+"""
+=============================================================================
+IngestScheduler Class
+=============================================================================
+"""
+def test_BuildGraph(tbls):
+    """
+    Set .dict_nodes stage functions and dependencies; check depends_on
+    names and cycles
+    10/18/26
+    """
+    tbls.TblRaw.dImportParams['depends_on'] = 'ExampleTbl2'
+    scheduler = IngestScheduler(tbls, col_info=ColumnInfo(IsPrint=False))
+
+    dict_deps = {node:d['deps'] for node, d in scheduler.dict_nodes.items()}
+    assert dict_deps == {
+        ('ColInfo', 'import'):[],
+        ('ColInfo', 'colinfo_setup'):[('ColInfo', 'import')],
+        ('ExampleTbl1', 'colinfo'):[('ColInfo', 'colinfo_setup')],
+        ('ExampleTbl1', 'import'):[('ExampleTbl1', 'colinfo')],
+        ('ExampleTbl2', 'colinfo'):[('ColInfo', 'colinfo_setup')],
+        ('ExampleTbl2', 'import'):[('ExampleTbl2', 'colinfo')],
+        ('TblRaw', 'import'):[('ExampleTbl2', 'import')],
+        ('TblRaw', 'parse'):[('TblRaw', 'import')]}
+
+    # No col_info: no ColInfo stages beyond import
+    scheduler = IngestScheduler(tbls)
+    assert scheduler.dict_nodes[('ExampleTbl1', 'import')]['deps'] == []
+    assert ('ExampleTbl1', 'colinfo') not in scheduler.dict_nodes
+
+def test_BuildGraph_errors(tbls):
+    """
+    Unscheduled depends_on table and depends_on cycles raise ValueError
+    10/18/26
+    """
+    tbls.ExampleTbl1.dImportParams['depends_on'] = ['NoSuchTbl']
+    with pytest.raises(ValueError, match='not scheduled: NoSuchTbl'):
+        IngestScheduler(tbls)
+
+    tbls.ExampleTbl1.dImportParams['depends_on'] = ['TblRaw']
+    tbls.TblRaw.dImportParams['depends_on'] = ['ExampleTbl1']
+    with pytest.raises(ValueError, match="cycle among tables: \\['ExampleTbl1', 'TblRaw'\\]"):
+        IngestScheduler(tbls)
+
+def test_Run(tbls):
+    """
+    Run stages on a worker pool as their dependencies finish; set
+    .df_schedule and .lst_critical_path. A failed stage cancels stages
+    not yet started and raises RuntimeError naming the table and stage
+    10/18/26
+    """
+    tbls.TblRaw.dImportParams['depends_on'] = 'ExampleTbl2'
+    scheduler = IngestScheduler(tbls, col_info=ColumnInfo(IsPrint=False), n_workers=3)
+    df = scheduler.Run()
+
+    # Same tables as serial ingestion
+    assert list(tbls.ExampleTbl1.df.columns) == ['date1', 'col_1a', 'col_1b']
+    assert len(tbls.ExampleTbl2.df) == 6
+    assert tbls.TblRaw.timings['parse']['n_calls'] == 1
+
+    # Stages start after their dependencies end
+    df = df.set_index(['table', 'stage'])
+    assert len(df) == 8
+    assert df.loc[('TblRaw', 'import'), 'start'] >= df.loc[('ExampleTbl2', 'import'), 'end']
+    assert df.loc[('ExampleTbl1', 'colinfo'), 'start'] >= \
+        df.loc[('ColInfo', 'colinfo_setup'), 'end']
+
+    # Critical path is a dependency chain from a root stage
+    lst_path = scheduler.lst_critical_path
+    assert scheduler.dict_nodes[lst_path[0]]['deps'] == []
+    for prev, node in zip(lst_path, lst_path[1:]):
+        assert prev in scheduler.dict_nodes[node]['deps']
+    assert df['is_critical'].sum() == len(lst_path)
+    assert scheduler.CriticalPathSummary().index[0] in ['ColInfo', 'ExampleTbl1',
+                                                        'ExampleTbl2', 'TblRaw']
+
+def test_Run_failure(tbls):
+    """
+    Failed stage raises RuntimeError naming the table and stage; dependent
+    stages do not run
+    10/18/26
+    """
+    tbls.ExampleTbl1.dImportParams['lst_files'] = 'missing.xlsx'
+    tbls.TblRaw.dImportParams['depends_on'] = 'ExampleTbl1'
+    with pytest.raises(RuntimeError, match='ExampleTbl1: failed stage import'):
+        IngestScheduler(tbls, n_workers=1).Run()
+    assert 'import' not in tbls.TblRaw.timings
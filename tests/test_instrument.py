@@ -0,0 +1,161 @@
+# Version 10/18/26
+import sys, os, threading, pstats, tracemalloc
+import pandas as pd
+import pytest
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+from instrument import TimeStage, Timed, TimingsDf, MemoryDf, FrameBytes
+from projtables import Table
+
+@pytest.fixture
+def tbl():
+    return Table('tbl1', dImportParams={'ftype':'csv'})
+
+"""
+=============================================================================
+Stage timings and cProfile hook
+=============================================================================
+"""
+def test_TimeStage(tbl):
+    """
+    Context manager to add wall/CPU time of with-block to tbl.timings[stage]
+    (and profile it if stage is tbl's profile_stage)
+    10/18/26
+    """
+    for _ in range(2):
+        with TimeStage(tbl, 'stage1'):
+            sum(range(10000))
+    assert tbl.timings['stage1']['n_calls'] == 2
+    assert tbl.timings['stage1']['wall'] > 0
+    assert tbl.profiler is None
+
+    # Timing recorded if with-block raises
+    with pytest.raises(ValueError):
+        with TimeStage(tbl, 'stage2'): raise ValueError
+    assert tbl.timings['stage2']['n_calls'] == 1
+
+def test_TimeStage_profile(tbl, tmp_path):
+    """
+    cProfile stats written to <path_profile><tbl.name>_<stage>.prof
+    10/18/26
+    """
+    path_profile = str(tmp_path) + os.sep + 'profiles' + os.sep
+    tbl.dImportParams.update({'profile_stage':'stage1', 'path_profile':path_profile})
+    with TimeStage(tbl, 'stage2'): pass
+    assert tbl.profiler is None
+
+    with TimeStage(tbl, 'stage1'):
+        sorted(range(1000), key=lambda x: -x)
+    assert tbl.pf_profile == path_profile + 'tbl1_stage1.prof'
+    assert pstats.Stats(tbl.pf_profile).total_calls > 0
+
+def test_Timed():
+    """
+    Decorator to time a method as stage on its Table (self, or self.tbl for
+    parsing classes)
+    10/18/26
+    """
+    class Parse():
+        def __init__(self, tbl): self.tbl = tbl
+        @Timed('parse_step')
+        def Step(self): return 1
+
+    tbl = Table('tbl1')
+    assert Parse(tbl).Step() == 1
+    assert list(tbl.timings) == ['parse_step']
+
+def test_TimeStage_memory(tbl):
+    """
+    tracemalloc peak/retained bytes per stage call and deep df bytes
+    appended to tbl.memory if dImportParams['track_memory']
+    10/18/26
+    """
+    with TimeStage(tbl, 'stage1'): pass
+    assert tbl.memory == []
+
+    tbl.dImportParams['track_memory'] = True
+    with TimeStage(tbl, 'outer'):
+        with TimeStage(tbl, 'inner'):
+            lst = [str(i) for i in range(100000)]
+            del lst
+        tbl.df = pd.DataFrame({'a':['x'] * 1000})
+
+    # Inner row first; inner peak carried to outer stage
+    assert [d['stage'] for d in tbl.memory] == ['inner', 'outer']
+    dInner, dOuter = tbl.memory
+    assert dInner['peak_bytes'] > 1000000
+    assert dOuter['peak_bytes'] >= dInner['peak_bytes']
+    assert dInner['df_bytes'] < dOuter['df_bytes'] == FrameBytes(tbl.df)
+    assert not tracemalloc.is_tracing()
+
+def test_TimeStage_memory_threads(tbl):
+    """
+    Stages in concurrent threads share one tracemalloc session (a stage
+    ending in one thread does not stop or reset tracing for another's)
+    10/18/26
+    """
+    tbl.dImportParams['track_memory'] = True
+    tbl2 = Table('tbl2', {'track_memory':True})
+    event_b_open, event_a_done = threading.Event(), threading.Event()
+
+    def StageA():
+        with TimeStage(tbl, 'stage_a'):
+            event_b_open.wait(5)
+        event_a_done.set()
+
+    def StageB():
+        with TimeStage(tbl2, 'stage_b'):
+            event_b_open.set()
+            event_a_done.wait(5)
+            lst = [str(i) for i in range(100000)]
+            assert tracemalloc.is_tracing()
+        del lst
+
+    lst_threads = [threading.Thread(target=StageA), threading.Thread(target=StageB)]
+    for thread in lst_threads: thread.start()
+    for thread in lst_threads: thread.join()
+
+    dB = tbl2.memory[0]
+    assert dB['peak_bytes'] > 1000000 and dB['retained_bytes'] > 1000000
+    assert tbl.memory[0]['stage'] == 'stage_a'
+    assert not tracemalloc.is_tracing()
+
+def test_FrameBytes():
+    """
+    Return deep memory bytes of df (incl. index) or Arrow table (0 if None)
+    10/18/26
+    """
+    df = pd.DataFrame({'a':['x', 'yy'], 'b':[1, 2]})
+    assert FrameBytes(df) == df.memory_usage(deep=True).sum()
+    assert FrameBytes(None) == 0
+
+def test_MemoryDf(tbl):
+    """
+    Return df of memory rows with one row per table and stage call
+    10/18/26
+    """
+    tbl.dImportParams['track_memory'] = True
+    for _ in range(2):
+        with TimeStage(tbl, 'read_file'): pass
+    df = MemoryDf([tbl, Table('tbl2')])
+    assert list(df['stage']) == ['read_file', 'read_file']
+    assert list(df.columns) == ['table', 'stage', 'peak_bytes', 'retained_bytes',
+                                'df_bytes', 'df_raw_bytes', 'lst_dfs_bytes']
+
+def test_TimingsDf(tbl):
+    """
+    Return df of timings with one row per table and stage (in recorded order)
+    10/18/26
+    """
+    tbl2 = Table('tbl2')
+    with TimeStage(tbl, 'read_file'): pass
+    with TimeStage(tbl, 'concat'): pass
+    with TimeStage(tbl2, 'read_file'): pass
+
+    df = TimingsDf([tbl, tbl2])
+    assert list(df.columns) == ['table', 'stage', 'wall', 'cpu', 'n_calls']
+    assert list(zip(df['table'], df['stage'])) == \
+        [('tbl1', 'read_file'), ('tbl1', 'concat'), ('tbl2', 'read_file')]
+    assert TimingsDf([]).empty
@@ -16,6 +16,7 @@ from projtables import ProjectTables
 from projtables import Table
 from projtables import RowMajorTbl
 from projtables import RowMajorBlockID
+from projtables import InterleavedColBlocksTbl
 
 IsPrint = False
 
@@ -111,6 +112,79 @@ class TestParseRowMajorTbl1Survey:
 
         if False: print_tables(row_maj_tbl1_survey)
 
+    def test_survey_SetBlockIndex(self, row_maj_tbl1_survey):
+        """
+        Set start, header and end bound row indices for all blocks in one pass
+        (end bound search uses a virtual trailing blank row vs copying .df_raw)
+        10/18/26
+        """
+        row_maj_tbl1_survey.SetBlockIndex()
+
+        # Last block ends at virtual trailing blank row; .df_raw not copied
+        assert row_maj_tbl1_survey.start_bound_indices == [3, 14, 24]
+        assert row_maj_tbl1_survey.header_row_indices == [3, 14, 24]
+        assert row_maj_tbl1_survey.end_bound_indices == [9, 18, 28]
+        assert row_maj_tbl1_survey.df_raw.shape == (28, 4)
+
+    def test_survey_ReadAllBlocks(self, row_maj_tbl1_survey):
+        """
+        Read each block in the block index and concatenate once to tbl.df
+        (matches block-by-block ParseBlockProcedure result)
+        10/18/26
+        """
+        row_maj_tbl1_survey.SetBlockIndex()
+        row_maj_tbl1_survey.ReadAllBlocks()
+        df_all = row_maj_tbl1_survey.tbl.df
+
+        # Parse same blocks one at a time for comparison
+        row_maj_tbl1_survey.tbl.df = pd.DataFrame()
+        row_maj_tbl1_survey.AddTrailingBlankRow()
+        for i in row_maj_tbl1_survey.start_bound_indices:
+            row_maj_tbl1_survey.idx_start_current = i
+            row_maj_tbl1_survey.ParseBlockProcedure()
+
+        assert len(df_all) == 11
+        pd.testing.assert_frame_equal(df_all, row_maj_tbl1_survey.tbl.df)
+
+    def test_survey_ReadBlock(self, row_maj_tbl1_survey):
+        """
+        Return current block's data rows with header as column names (drop
+        columns with null column name and all null values)
+        10/18/26
+        """
+        row_maj_tbl1_survey.SetBlockIndex()
+        row_maj_tbl1_survey.idx_header_row = 24
+        row_maj_tbl1_survey.idx_start_data = 25
+        row_maj_tbl1_survey.idx_end_bound = 28
+        df_block = row_maj_tbl1_survey.ReadBlock()
+
+        assert list(df_block.columns) == ['Answer Choices', '1', '2', '3']
+        assert list(df_block.iloc[-1]) == ['Improved cleaning', '18', '11', '17']
+
+    def test_survey_ReadBlocksStreamProcedure(self, tbl1_survey, row_maj_tbl1_survey):
+        """
+        Procedure to parse row major blocks row by row from iter_rows and
+        concatenate them (in start row order) to tbl.df. Block values are raw
+        cells (object dtype; str if import_dtype is str); block_id_vars values
+        are set per block
+        10/18/26
+        """
+        row_maj_tbl1_survey.ReadBlocksProcedure()
+        df_expected = row_maj_tbl1_survey.tbl.df
+
+        # Streaming import parses blocks from read_only rows (no .lst_dfs)
+        tbl1_survey.dParseParams['is_streaming_parse'] = True
+        tbl1_survey.ImportToTblDf()
+        assert tbl1_survey.lst_dfs == []
+        pd.testing.assert_frame_equal(tbl1_survey.df, df_expected)
+
+        # Rows from any iterator; only open blocks' rows are kept
+        parse = RowMajorTbl(tbl1_survey)
+        parse.tbl.df = pd.DataFrame()
+        rows = [tuple(r) for r in row_maj_tbl1_survey.df_raw.values]
+        parse.ReadBlocksStreamProcedure(iter(rows))
+        pd.testing.assert_frame_equal(parse.tbl.df, df_expected)
+
     def xtest_survey_ReadBlocksProcedure2(self, row_maj_tbl1_survey):
         """
         ===Move to ApplyColInfo===
@@ -362,6 +436,32 @@ class TestParseRowMajorTbl1:
 
         if False: print_tables(row_maj_tbl1)
 
+    def test_ReadBlocksStreamProcedure(self, tbl1):
+        """
+        Procedure to parse row major blocks row by row from iter_rows and
+        concatenate them (in start row order) to tbl.df. Block values are raw
+        cells (object dtype; str if import_dtype is str); block_id_vars values
+        are set per block
+        10/18/26
+        """
+        tbl1.dParseParams['is_streaming_parse'] = True
+        tbl1.ImportToTblDf()
+        tbl1.ParseRawData()
+        self.check_tbl1_values(RowMajorTbl(tbl1))
+
+    def test_SetStreamParams(self, tbl1):
+        """
+        Set .dStream flags, offsets and block_id_vars from tbl.dParseParams
+        and .n_lookback (rows before a start flag needed for header/block_ids)
+        10/18/26
+        """
+        parse = RowMajorTbl(tbl1)
+        parse.SetStreamParams()
+
+        # block_id 'stuff' is 4 rows above first data row (flag row + 2)
+        assert parse.dStream['lst_ids'] == [('stuff', -4, 2)]
+        assert parse.n_lookback == 2
+
     def test_ParseBlockProcedure(self, row_maj_tbl1):
         """
         Parse an individual block
@@ -711,6 +811,137 @@ class TestExtractBlockIDs:
         row_maj_block_id.ConvertTupleToList()
         assert isinstance(tbl1.dParseParams['block_id_vars'], list)
 
+"""
+================================================================================
+Table.ParseFramesParallel - process pool parse of .lst_dfs frames
+================================================================================
+"""
+class TestParseFramesParallel:
+
+    @pytest.mark.parametrize('tbl_name', ['tbl1', 'tbl1_survey'])
+    def test_ParseFramesParallel(self, request, tbl_name):
+        """
+        Parse each .lst_dfs frame with ParseFrameTask on a reusable process
+        pool; merge results to .df in frame order (same output as serial)
+        10/18/26
+        """
+        tbl_serial = self.MultiFrameTbl(request, tbl_name)
+        tbl_serial.ParseRawData()
+
+        tbl = self.MultiFrameTbl(request, tbl_name)
+        tbl.dImportParams['n_workers_parse'] = 2
+        tbl.ParseRawData()
+
+        assert 'parse_parallel' in tbl.timings
+        assert tbl.timings['block_read']['n_calls'] == 3
+        assert len(tbl.df) > 0
+        pd.testing.assert_frame_equal(tbl.df, tbl_serial.df)
+
+    def test_ParseFramesParallel_error(self, tbl1):
+        """
+        Failed frame parse raises RuntimeError naming the table and frame
+        10/18/26
+        """
+        tbl1.lst_dfs = [tbl1.lst_dfs[0], tbl1.lst_dfs[0].iloc[:, :1]]
+        tbl1.dImportParams['n_workers_parse'] = 2
+        with pytest.raises(RuntimeError, match='tbl1_raw: failed parsing frame 1'):
+            tbl1.ParseRawData()
+
+    def MultiFrameTbl(self, request, tbl_name):
+        """
+        Helper - return imported fixture table with .lst_dfs of three frames
+        (second frame's cells changed so block IDs differ by frame)
+        """
+        tbl = request.getfixturevalue(tbl_name)
+        tbl = Table(tbl.name, dict(tbl.dImportParams), dict(tbl.dParseParams))
+        tbl.ImportToTblDf()
+        df_raw = tbl.lst_dfs[0]
+        tbl.lst_dfs = [df_raw, df_raw.replace({'Stuff in C':'Other stuff'}), df_raw.copy()]
+        return tbl
+
+"""
+================================================================================
+InterleavedColBlocksTbl Class - Data in interleaved, repeating column blocks
+================================================================================
+"""
+@pytest.fixture
+def tbl_interleaved():
+    """
+    Table with interleaved column blocks raw data (one initial blank column,
+    two metadata columns and two 2-column blocks; trailing blank row)
+    10/18/26
+    """
+    lst_rows = [[None, None, None, 'blk_A', None, 'blk_B', None, None],
+                [None, 'id', 'name', 'units', 'price', 'units', 'price', None],
+                [None, 1, 'a', 10, 1.5, 20, 2.5, None],
+                [None, 2, 'b', 11, 3.5, 21, 4.5, None],
+                [None, 3, 'c', 12, 5.5, 22, 6.5, None],
+                [None, None, None, None, None, None, None, None]]
+    dParseParams = {'idx_start':1, 'n_cols_metadata':2, 'n_cols_block':2}
+    tbl = Table('tbl_interleaved', dParseParams=dParseParams)
+    tbl.df_raw = pd.DataFrame(lst_rows)
+    return tbl
+
+class TestParseInterleavedColBlocks:
+    """Parsing interleaved column blocks to long format .df"""
+
+    def test_ParseInterleavedBlocksProcedure(self, tbl_interleaved):
+        """
+        Procedure to parse interleaved blocks of columns
+        (vectorized and column-by-column modes give identical .df)
+        10/18/26
+        """
+        parse = InterleavedColBlocksTbl(tbl_interleaved)
+        parse.ParseInterleavedBlocksProcedure()
+
+        tbl_interleaved.dParseParams['is_vectorized_parse'] = False
+        parse_iter = InterleavedColBlocksTbl(tbl_interleaved)
+        parse_iter.ParseInterleavedBlocksProcedure()
+
+        # 2 blocks x 2 vars x 3 metadata rows
+        assert len(parse.df) == 12
+        assert list(parse.df.columns) == ['id', 'name', 'block_name', 'var_name', 'values']
+        pd.testing.assert_frame_equal(parse.df, parse_iter.df)
+
+    def test_DeleteTrailingRows(self, tbl_interleaved):
+        """
+        Delete trailing rows with blank metadata
+        10/18/26
+        """
+        parse = InterleavedColBlocksTbl(tbl_interleaved)
+        parse.SetDfMetadata()
+        assert len(parse.df_metadata) == 4
+
+        parse.DeleteTrailingRows()
+        assert len(parse.df_metadata) == 3
+        assert len(parse.df_raw) == 5
+
+    def test_TransferAllBlocksVectorized(self, tbl_interleaved):
+        """
+        Transfer all blocks of columns to .df in one reshape of .df_raw (repeat
+        .df_metadata once per block column and tile block and variable names)
+        10/18/26
+        """
+        parse = InterleavedColBlocksTbl(tbl_interleaved)
+        parse.SetDfMetadata()
+        parse.DeleteTrailingRows()
+        parse.TransferAllBlocksVectorized()
+
+        # Check first and last rows and block/var name tiling
+        assert list(parse.df.iloc[0]) == [1, 'a', 'blk_A', 'units', 10]
+        assert list(parse.df.iloc[-1]) == [3, 'c', 'blk_B', 'price', 6.5]
+        assert list(parse.df['var_name'].iloc[::3]) == 2 * ['units', 'price']
+        assert list(parse.df['block_name'].iloc[::6]) == ['blk_A', 'blk_B']
+
+    def test_SetBlockStartIndices(self, tbl_interleaved):
+        """
+        Return array of .df_raw column indices where blocks start (blocks
+        continue until end of columns or blank block name in row 0)
+        10/18/26
+        """
+        parse = InterleavedColBlocksTbl(tbl_interleaved)
+        assert list(parse.SetBlockStartIndices()) == [3, 5]
+
 """
 ================================================================================
 Helper methods for testing
@@ -0,0 +1,178 @@
+# Version 10/18/26
+import sys, os
+import pandas as pd
+import numpy as np
+import pytest
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+import pd_util
+
+@pytest.fixture
+def df_raw():
+    """
+    Unstructured (header=None) style df with mixed-type and blank cells
+    10/18/26
+    """
+    return pd.DataFrame({0:['Question', 1.0, 2.5, np.nan, 1e20, True],
+                         1:[1.0, 2.0, np.nan, -3.0, 0.5, 7.0],
+                         2:[1, 2, 3, 4, 5, 6],
+                         3:[None, 'a', pd.Timestamp('2025-01-01'), 'b', np.nan, 4]})
+
+"""
+=============================================================================
+Str coercion of unstructured imports
+=============================================================================
+"""
+def test_DfToStr(df_raw):
+    """
+    Convert df values to str column-by-column (vectorized equivalent of
+    df.astype(object).map(CellToStr))
+    10/18/26
+    """
+    df_str = pd_util.DfToStr(df_raw)
+    assert list(df_str[0]) == ['Question', '1', '2.5', None, '100000000000000000000', 'True']
+    assert list(df_str[1]) == ['1', '2', None, '-3', '0.5', '7']
+    assert list(df_str[2]) == ['1', '2', '3', '4', '5', '6']
+    assert list(df_str[3]) == [None, 'a', '2025-01-01 00:00:00', 'b', None, '4']
+
+    # Identical to per-cell conversion (including for test_data_parse sheets)
+    df_expected = df_raw.astype(object).map(pd_util.CellToStr)
+    pd.testing.assert_frame_equal(df_str, df_expected)
+
+    pf = os.path.join(os.path.dirname(__file__), 'test_data_parse', 'tbl1_survey.xlsx')
+    for df in pd.read_excel(pf, sheet_name=None, header=None).values():
+        df_expected = df.astype(object).map(pd_util.CellToStr)
+        pd.testing.assert_frame_equal(pd_util.DfToStr(df), df_expected)
+
+"""
+=============================================================================
+Memory optimization
+=============================================================================
+"""
+def test_OptimizeDfMemory():
+    """
+    Return (df with compact column dtypes, df report of bytes before/after
+    and saved per column)
+    10/18/26
+    """
+    df = pd.DataFrame({'region':['east', 'west'] * 50, 'id':[str(i) for i in range(100)],
+                       'qty':np.arange(100), 'flag':[1, None] * 50, 'code':['a', 'b'] * 50})
+    df_opt, df_report = pd_util.OptimizeDfMemory(df, {'flag':'bool', 'code':'keep'})
+
+    assert list(df_opt.dtypes.astype(str)) == ['category', 'object', 'int8', 'bool', 'object']
+    assert list(df_opt['flag'][:2]) == [True, False]
+    assert df['qty'].dtype == 'int64'
+
+    assert list(df_report.index) == list(df.columns)
+    assert df_report.loc['region', 'bytes_saved'] > 0
+    assert df_report.loc['id', 'bytes_saved'] == 0
+    assert df_report['bytes_saved'].sum() == \
+        df.memory_usage(deep=True, index=False).sum() - \
+        df_opt.memory_usage(deep=True, index=False).sum()
+
+def test_DowncastNumeric():
+    """
+    Return Series downcast to smallest signed int (ints) or to float32 if
+    lossless (floats); None if no smaller width is safe
+    10/18/26
+    """
+    assert pd_util.DowncastNumeric(pd.Series([0, 255])).dtype == 'int16'
+    assert pd_util.DowncastNumeric(pd.Series([-1, 100])).dtype == 'int8'
+    assert pd_util.DowncastNumeric(pd.Series([0.5, np.nan])).dtype == 'float32'
+    assert pd_util.DowncastNumeric(pd.Series([0.1, 2.0])) is None
+    assert pd_util.DowncastNumeric(pd.Series([1, 2], dtype='int8')) is None
+
+def test_RecodeFlagColToBool():
+    """
+    Return bool Series for 1/blank (or True/False-like) flag column; None if
+    already bool or if any value is not flag-like
+    10/18/26
+    """
+    ser = pd_util.RecodeFlagColToBool(pd.Series([1.0, np.nan, 0, '1', 'Yes', None]))
+    assert list(ser) == [True, False, False, True, True, False]
+    assert pd_util.RecodeFlagColToBool(pd.Series([1, 2])) is None
+    assert pd_util.RecodeFlagColToBool(pd.Series([True, False])) is None
+
+"""
+=============================================================================
+ColInfo dtypes
+=============================================================================
+"""
+def test_ResolveDtype():
+    """
+    Return dtype for a ColInfo type string (e.g. 'str', 'np.int64', 'date');
+    case-sensitive match first so nullable 'Int64' is not numpy 'int64'
+    10/18/26
+    """
+    assert pd_util.ResolveDtype('Int64') == 'Int64'
+    assert pd_util.ResolveDtype('INT64') == 'int64'
+    assert pd_util.ResolveDtype(' Date ') == 'datetime64[ns]'
+    with pytest.raises(ValueError, match='Unrecognized ColInfo type'):
+        pd_util.ResolveDtype('decimal')
+
+def test_SplitReadDtypes():
+    """
+    Resolve dict of column:type string and split into dicts of dtypes to
+    pass to readers (dtype=) and to set after read with one df.astype()
+    10/18/26
+    """
+    dict_read, dict_post = pd_util.SplitReadDtypes({'a':'str', 'b':'int',
+        'c':'nullable_int', 'd':'bool', 'e':'date'})
+    assert dict_read == {'a':str, 'c':'Int64'}
+    assert dict_post == {'b':'int64', 'd':'bool', 'e':'datetime64[ns]'}
+
+def test_AstypePostRead():
+    """
+    Return df with post-read dtypes set in one astype; bool columns are
+    recoded from 1/blank flags first (blank as False vs astype's NaN as True)
+    10/18/26
+    """
+    df = pd.DataFrame({'flag':[1.0, np.nan], 'yes':['Yes', None],
+                       'qty':[1.0, 2.0], 'other':[1, 2]})
+    df = pd_util.AstypePostRead(df, {'flag':'bool', 'yes':'bool', 'qty':'int64',
+                                     'missing':'bool'})
+    assert list(df['flag']) == [True, False] and list(df['yes']) == [True, False]
+    assert df['qty'].dtype == 'int64' and df['other'].dtype == 'int64'
+
+"""
+=============================================================================
+Arrow dtype backend
+=============================================================================
+"""
+def test_ArrowDtype():
+    """
+    Return pd.ArrowDtype equivalent of a resolved ColInfo dtype (e.g. str ->
+    string[pyarrow], 'datetime64[ns]' -> timestamp[ns][pyarrow]); object and
+    category are returned unchanged
+    10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    assert str(pd_util.ArrowDtype(str)) == 'string[pyarrow]'
+    assert str(pd_util.ArrowDtype(pd_util.ResolveDtype('nullable_int'))) == 'int64[pyarrow]'
+    assert str(pd_util.ArrowDtype(pd_util.ResolveDtype('date'))) == 'timestamp[ns][pyarrow]'
+    assert pd_util.ArrowDtype('category') == 'category'
+    assert pd_util.ArrowDtype(object) is object
+
+def test_ArrowFillValue():
+    """
+    Return fill value compatible with Arrow-backed ser (str for string
+    columns, e.g. a numeric ColInfo val_default; else value)
+    10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    ser = pd.Series(['a', None]).convert_dtypes(dtype_backend='pyarrow')
+    assert pd_util.ArrowFillValue(ser, 0.0) == '0'
+    assert pd_util.ArrowFillValue(pd.Series(['a', None]), 0.0) == 0.0
+
+def test_BackendKwds():
+    """
+    Return reader kwargs dict for dtype_backend (empty if None; pandas
+    readers reject dtype_backend=None)
+    10/18/26
+    """
+    assert pd_util.BackendKwds(None) == {}
+    assert pd_util.BackendKwds('pyarrow') == {'dtype_backend':'pyarrow'}
+    with pytest.raises(ValueError):
+        pd_util.BackendKwds('arrow')
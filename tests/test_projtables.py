@@ -1,9 +1,11 @@
 # Version 4/11/25
 # cd Box\ Sync/Projects/Python_Col_Info/tests
-import sys, os
+import sys, os, re, time, asyncio
 import pandas as pd
 import numpy as np
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Add libs folder to sys.path and import project-specific modules
 libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
@@ -11,6 +13,7 @@ sys.path.insert(0, os.path.abspath(libs_path))
 from projfiles import Files
 from projtables import ProjectTables
 from projtables import Table
+from projtables import GetWorkerPool
 
 IsPrint = False
 
@@ -193,6 +196,197 @@ def test_ImportToTblDf_CSV4(tbls_CSVFile):
     assert tbls_CSVFile.lst_dfs[0].iloc[2, 1] == 'Stuff'
 
 
+def test_ImportToTblDf_CSV5(tbls_CSVFile):
+    """
+    Import CSV structured table reading only usecols (in usecols order) and
+    renaming at read time
+    10/18/26
+    """
+    lst_cols = ['col_2c_import_name', 'date2_import_name']
+    tbls_CSVFile.dImportParams.update({'lst_files':'Example2.csv', 
+        'usecols':lst_cols, 'dict_rename':{'col_2c_import_name':'col_2c'}})
+    tbls_CSVFile.ImportToTblDf()
+
+    check_CSVFile(tbls_CSVFile)
+    assert list(tbls_CSVFile.df.columns) == ['col_2c', 'date2_import_name']
+
+def test_ImportToTblDf_CSV6(tbls_CSVFile):
+    """
+    Import CSV structured table with ColInfo type strings (read-time dtypes
+    plus post-read date conversion)
+    10/18/26
+    """
+    dtypes = {'date2_import_name':'date', 'col_2a_import_name':'str',
+              'col_2c_import_name':'float'}
+    tbls_CSVFile.dImportParams.update({'lst_files':'Example2.csv', 'dtypes':dtypes})
+    tbls_CSVFile.ImportToTblDf()
+
+    check_CSVFile(tbls_CSVFile)
+    assert tbls_CSVFile.df['date2_import_name'].dtype == 'datetime64[ns]'
+    assert tbls_CSVFile.df['col_2a_import_name'].iloc[0] == '1'
+    assert tbls_CSVFile.df['col_2c_import_name'].dtype == 'float64'
+
+    # Type strings are looked up (not evaluated)
+    tbls_CSVFile.dImportParams['dtypes'] = {'col_dummy':'__import__("os")'}
+    with pytest.raises(ValueError, match='Unrecognized ColInfo type'):
+        tbls_CSVFile.ImportToTblDf()
+
+def test_ImportToTblDf_CSV7(tbls_CSVFile, tmp_path):
+    """
+    Import CSV structured table with blank cells in int and bool flag
+    columns (ints set after defaults fill blanks; blank flags as False)
+    10/18/26
+    """
+    path = str(tmp_path) + os.sep
+    with open(path + 'blanks.csv', 'w') as f:
+        f.write('qty,n,flag\n1,5,1\n,,\n3,7,1\n')
+    tbls_CSVFile.dImportParams.update({'import_path':path, 'lst_files':'blanks.csv',
+        'dtypes':{'qty':'int', 'n':'Int64', 'flag':'bool'}, 'dict_defaults':{'qty':0}})
+    tbls_CSVFile.ImportToTblDf()
+
+    df = tbls_CSVFile.df
+    assert df['qty'].dtype == 'int64' and list(df['qty']) == [1, 0, 3]
+    assert df['n'].dtype == 'Int64' and df['n'].isna().tolist() == [False, True, False]
+    assert df['flag'].dtype == bool and list(df['flag']) == [True, False, True]
+
+def test_ImportToTblDf_OptimizeMemory(tbls_CSVFile):
+    """
+    Convert .df to compact dtypes after import if dImportParams['optimize_memory']
+    (Table.OptimizeMemory sets .df_memory_report)
+    10/18/26
+    """
+    dImportParams = {'lst_files':['Example2.csv', 'Example2.csv'],
+                     'dtypes':{'date2_import_name':'date'}}
+    tbls_CSVFile.dImportParams.update(dImportParams)
+    tbls_CSVFile.ImportToTblDf()
+    df_expected = tbls_CSVFile.df
+    assert tbls_CSVFile.df_memory_report is None
+
+    tbls_CSVFile.dImportParams['optimize_memory'] = True
+    tbls_CSVFile.ImportToTblDf()
+    df_report = tbls_CSVFile.df_memory_report
+    assert list(df_report.index) == list(df_expected.columns)
+    assert (df_report['bytes_saved'] >= 0).all()
+    assert df_report['bytes_saved'].sum() > 0
+    pd.testing.assert_frame_equal(tbls_CSVFile.df, df_expected, check_dtype=False,
+                                  check_categorical=False)
+
+def test_ImportToTblDf_CSVChunked1(tbls_CSVFile):
+    """
+    Import CSV structured table in chunks (dImportParams['chunksize']) with
+    usecols, dtypes, defaults and renames applied per chunk and concatenated
+    10/18/26
+    """
+    dImportParams = {'lst_files':['Example2.csv', 'Example2.csv'],
+        'usecols':['col_2c_import_name', 'date2_import_name', 'col_dummy'],
+        'dtypes':{'date2_import_name':'date', 'col_2c_import_name':'float'},
+        'dict_defaults':{'col_dummy':'none'},
+        'dict_rename':{'col_2c_import_name':'col_2c'}}
+    tbls_CSVFile.dImportParams.update(dImportParams)
+    tbls_CSVFile.ImportToTblDf()
+    df_expected = tbls_CSVFile.df
+
+    tbls_CSVFile.dImportParams['chunksize'] = 4
+    tbls_CSVFile.ImportToTblDf()
+    pd.testing.assert_frame_equal(tbls_CSVFile.df, df_expected)
+    assert list(tbls_CSVFile.df.columns) == ['col_2c', 'date2_import_name', 'col_dummy']
+    assert tbls_CSVFile.df['date2_import_name'].dtype == 'datetime64[ns]'
+
+def test_ImportToTblDf_CSVChunked2(tbls_CSVFile, tmp_path):
+    """
+    Stream CSV chunks from IterCSVChunks to .df (concat) or, if
+    dImportParams['chunk_sink'] is set, append them to parquet .pf_sink
+    (peak memory bounded by chunksize; .df left empty)
+    10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    pf_sink = str(tmp_path) + os.sep + 'tbl.parquet'
+    tbls_CSVFile.dImportParams.update({'lst_files':['Example2.csv', 'Example2.csv'],
+        'dtypes':{'col_2a_import_name':'str'}, 'chunksize':4, 'chunk_sink':pf_sink})
+    tbls_CSVFile.ImportToTblDf()
+    assert tbls_CSVFile.df.empty
+
+    df = pd.read_parquet(pf_sink)
+    assert len(df) == 12
+    assert df['col_2a_import_name'].iloc[0] == '1'
+
+def test_ImportToTblDf_CSVChunked3(tbls_CSVFile, tmp_path):
+    """
+    Return (Arrow schema, is_typed) from first of lst_chunks. Columns blank
+    in the first chunk take their type from the first chunk with values,
+    else string if object dtype (e.g. dtypes 'str'); is_typed False if a
+    blank non-object column has no values yet
+    10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path) + os.sep
+    pf_sink = path + 'tbl.parquet'
+
+    # Columns a, b and c blank throughout first chunk; c blank in every chunk
+    lst_rows = ['a,b,c,d'] + [f',,,{i}' for i in range(4)] + \
+        [f's{i},{i}.5,,{i}' for i in range(4, 6)]
+    with open(path + 'blanks.csv', 'w') as f: f.write('\n'.join(lst_rows) + '\n')
+    tbls_CSVFile.dImportParams.update({'import_path':path, 'lst_files':'blanks.csv',
+        'dtypes':{'a':'str'}, 'chunksize':4, 'chunk_sink':pf_sink})
+    tbls_CSVFile.ImportToTblDf()
+
+    df = pd.read_parquet(pf_sink)
+    assert len(df) == 6
+    assert list(df['a'].iloc[4:]) == ['s4', 's5'] and df['a'].iloc[:4].isna().all()
+    assert list(df['b'].iloc[4:]) == [4.5, 5.5]
+    assert df['c'].isna().all()
+
+def test_ImportToTblDf_CSVChunked4(tbls_CSVFile, tmp_path):
+    """
+    Return schema with each field widened to also hold chunk's values (e.g.
+    int64 and double to double); raise ValueError if types are incompatible
+    (e.g. int64 and string; set the column's dImportParams['dtypes'])
+    10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path) + os.sep
+    pf_sink = path + 'tbl.parquet'
+
+    # Column a int in chunks 1-2 and float in chunk 3
+    lst_rows = ['a,b'] + [f'{i},x{i}' for i in range(8)] + ['2.5,y', '3.5,z']
+    with open(path + 'types.csv', 'w') as f: f.write('\n'.join(lst_rows) + '\n')
+    tbls_CSVFile.dImportParams.update({'import_path':path, 'lst_files':'types.csv',
+                                       'chunksize':4})
+    tbls_CSVFile.ImportToTblDf()
+    df_expected = pd.read_csv(path + 'types.csv')
+    pd.testing.assert_frame_equal(tbls_CSVFile.df, df_expected)
+
+    tbls_CSVFile.dImportParams['chunk_sink'] = pf_sink
+    tbls_CSVFile.ImportToTblDf()
+    pd.testing.assert_frame_equal(pd.read_parquet(pf_sink), df_expected)
+    assert sorted(os.listdir(path)) == ['tbl.parquet', 'types.csv']
+
+    # Str values after int chunks need dtypes (both paths)
+    with open(path + 'types.csv', 'a') as f: f.write('abc,w\n')
+    for pf in [pf_sink, None]:
+        tbls_CSVFile.dImportParams['chunk_sink'] = pf
+        with pytest.raises(ValueError, match="CSVFile: column a types differ"):
+            tbls_CSVFile.ImportToTblDf()
+    tbls_CSVFile.dImportParams['dtypes'] = {'a':'str'}
+    tbls_CSVFile.ImportToTblDf()
+    assert list(tbls_CSVFile.df['a'].iloc[-3:]) == ['2.5', '3.5', 'abc']
+
+def test_ImportToTblDf_IterCSVChunks(tbls_CSVFile):
+    """
+    Generator of .chunksize-row dfs from CSV files with keep columns,
+    types, defaults and renames applied to each chunk (structured)
+    10/18/26
+    """
+    tbls_CSVFile.dImportParams.update({'lst_files':'Example2.csv', 'chunksize':4,
+        'usecols':['col_2a_import_name'], 'dict_rename':{'col_2a_import_name':'col_2a'}})
+    lst_chunks = list(tbls_CSVFile.IterCSVChunks())
+    assert [len(chunk) for chunk in lst_chunks] == [4, 2]
+    assert list(lst_chunks[0].columns) == ['col_2a']
+
+    tbls_CSVFile.dImportParams.pop('chunksize')
+    with pytest.raises(ValueError, match='chunksize'):
+        next(tbls_CSVFile.IterCSVChunks())
+
 def check_CSVFile(tbls_CSVFile):
     """
     Helper function to check CSVFile import
@@ -201,6 +395,220 @@ def check_CSVFile(tbls_CSVFile):
     assert isinstance(tbls_CSVFile.df, pd.DataFrame)
     assert len(tbls_CSVFile.df) == 6
 
+"""
+importing feather and parquet files
+"""
+@pytest.fixture
+def tbls_ColumnarFile(files, tmp_path):
+    """
+    Like tbls.ColumnarFile (Example2a/b.csv written as feather and parquet)
+    10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path) + os.sep
+    for f in ['Example2a', 'Example2b']:
+        df = pd.read_csv(files.path_data + f + '.csv')
+        df.to_feather(path + f + '.feather')
+        df.to_parquet(path + f + '.parquet')
+    return Table('ColumnarFile', dImportParams={'import_path':path})
+
+def test_ImportToTblDf_Feather(tbls_ColumnarFile):
+    """
+    Import feather structured table from multiple files
+    10/18/26
+    """
+    f_lst = ['Example2a.feather', 'Example2b.feather']
+    tbls_ColumnarFile.dImportParams.update({'ftype':'feather', 'lst_files':f_lst})
+    tbls_ColumnarFile.ImportToTblDf()
+
+    assert tbls_ColumnarFile.df.shape == (6, 4)
+    assert list(tbls_ColumnarFile.df['col_dummy']) == ['x', 'y', 'xx', 'yy', 'xxx', 'yyy']
+
+def test_ImportToTblDf_Parquet(tbls_ColumnarFile):
+    """
+    Import parquet structured table from multiple files with column projection
+    10/18/26
+    """
+    f_lst = ['Example2a.parquet', 'Example2b.parquet']
+    lst_cols = ['col_2c_import_name', 'date2_import_name']
+    tbls_ColumnarFile.dImportParams.update({'ftype':'parquet', 'lst_files':f_lst,
+                                            'usecols':lst_cols})
+    tbls_ColumnarFile.ImportToTblDf()
+
+    assert list(tbls_ColumnarFile.df.columns) == lst_cols
+    assert list(tbls_ColumnarFile.df['col_2c_import_name']) == [10, 15, 20, 25, 30, 35]
+
+def test_ImportToTblDf_ReadColumnarFile(tbls_ColumnarFile):
+    """
+    Read current feather or parquet file (memory-mapped) with optional
+    dImportParams['usecols'] column projection and append to lst_dfs
+    (Arrow table if structured for single conversion in ConcatArrowTables)
+    10/18/26
+    """
+    tbls_ColumnarFile.dImportParams.update({'ftype':'feather', 'usecols':['col_dummy']})
+    tbls_ColumnarFile.SetFileIngestParams()
+    tbls_ColumnarFile.lst_dfs = []
+    tbls_ColumnarFile.pf = tbls_ColumnarFile.dImportParams['import_path'] + 'Example2b.feather'
+
+    tbls_ColumnarFile.ReadColumnarFile()
+    assert tbls_ColumnarFile.lst_dfs[0].num_rows == 4
+    assert tbls_ColumnarFile.lst_dfs[0].column_names == ['col_dummy']
+
+"""
+Arrow dtype backend
+"""
+@pytest.mark.parametrize('engine', [None, 'values'])
+def test_ImportToTblDf_Arrow(tbls_ExcelFile, tbls_CSVFile, engine):
+    """
+    Structured Excel and CSV reads with dtype_backend='pyarrow' return
+    Arrow-backed columns (ColInfo types mapped to Arrow dtypes) and concat
+    per-file frames without combining their Arrow chunks
+    10/18/26
+    """
+    pa = pytest.importorskip('pyarrow')
+    dTypes = {'date2_import_name':'date', 'col_2a_import_name':'str',
+              'col_2c_import_name':'float'}
+    tbls_ExcelFile.dImportParams.update({'sht_type':'all', 'engine':engine})
+    for tbl, ext in [(tbls_ExcelFile, '.xlsx'), (tbls_CSVFile, '.csv')]:
+        tbl.dImportParams.update({'lst_files':['Example2a' + ext, 'Example2b' + ext],
+                                  'dtype_backend':'pyarrow', 'dtypes':dTypes})
+        tbl.ImportToTblDf()
+
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in tbl.df.dtypes)
+        assert str(tbl.df['col_2a_import_name'].dtype) == 'string[pyarrow]'
+        assert str(tbl.df['date2_import_name'].dtype) == 'timestamp[ns][pyarrow]'
+        assert list(tbl.df['col_2a_import_name']) == ['1', '2', '1', '2', '1', '2']
+        assert pa.array(tbl.df['col_dummy'].array).num_chunks == 2
+
+def test_ImportToTblDf_Arrow_Feather(tbls_ColumnarFile):
+    """
+    Feather read with dtype_backend='pyarrow' wraps Arrow columns without
+    conversion to NumPy
+    10/18/26
+    """
+    f_lst = ['Example2a.feather', 'Example2b.feather']
+    tbls_ColumnarFile.dImportParams.update({'ftype':'feather', 'lst_files':f_lst,
+                                            'dtype_backend':'pyarrow'})
+    tbls_ColumnarFile.ImportToTblDf()
+    assert str(tbls_ColumnarFile.df['col_dummy'].dtype) == 'string[pyarrow]'
+    assert tbls_ColumnarFile.df.shape == (6, 4)
+
+def test_ImportToTblDf_Arrow_invalid(tbls_CSVFile):
+    """
+    Unrecognized dtype_backend raises ValueError
+    10/18/26
+    """
+    tbls_CSVFile.dImportParams.update({'lst_files':'Example2.csv', 'dtype_backend':'arrow'})
+    with pytest.raises(ValueError, match='dtype_backend must be one of'):
+        tbls_CSVFile.ImportToTblDf()
+
+"""
+concurrent file/sheet reads
+"""
+def test_ImportToTblDf_Parallel1(tbls_ExcelFile):
+    """
+    Read Excel files' sheets on a thread pool (same .df as serial import)
+    10/18/26
+    """
+    f_lst = ['Example2_multisheet.xlsx', 'Example2a.xlsx', 'Example2b.xlsx']
+    tbls_ExcelFile.dImportParams.update({'lst_files':f_lst, 'sht_type':'all'})
+    tbls_ExcelFile.ImportToTblDf()
+    df_serial = tbls_ExcelFile.df
+
+    tbls_ExcelFile.dImportParams.update({'n_workers':3, 'worker_mode':'thread'})
+    tbls_ExcelFile.ImportToTblDf()
+
+    assert len(tbls_ExcelFile.df) == 12
+    pd.testing.assert_frame_equal(tbls_ExcelFile.df, df_serial)
+
+def test_ImportToTblDf_Parallel2(tbls_CSVFile):
+    """
+    Read CSV files on a process pool (lst_dfs order follows lst_files)
+    10/18/26
+    """
+    f_lst = ['Example2b.csv', 'Example2a.csv']
+    tbls_CSVFile.dImportParams.update({'lst_files':f_lst, 'n_workers':2,
+                                       'worker_mode':'process'})
+    tbls_CSVFile.ImportToTblDf()
+
+    check_CSVFile(tbls_CSVFile)
+    assert list(tbls_CSVFile.df['col_dummy']) == ['xx', 'yy', 'xxx', 'yyy', 'x', 'y']
+
+def test_ImportToTblDf_ReadFilesParallel(tbls_ExcelFile):
+    """
+    Read all files (and Excel files' sheets) on a reusable worker pool;
+    (worker error message identifies file and sheet)
+    10/18/26
+    """
+    tbls_ExcelFile.dImportParams.update({'lst_files':'Example2.xlsx',
+                    'sht':'not_a_sheet', 'n_workers':2})
+    with pytest.raises(RuntimeError, match='Example2.xlsx, sheet not_a_sheet'):
+        tbls_ExcelFile.ImportToTblDf()
+
+def test_GetWorkerPool():
+    """
+    Return a reusable thread or process pool for worker_mode and n_workers
+    10/18/26
+    """
+    pool = GetWorkerPool('thread', 2)
+    assert GetWorkerPool('thread', 2) is pool
+    assert GetWorkerPool('thread', 3) is not pool
+
+    with pytest.raises(ValueError):
+        GetWorkerPool('fiber', 2)
+
+    # Concurrent first calls share one pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        lst_pools = list(executor.map(lambda _: GetWorkerPool('thread', 7), range(8)))
+    assert all(pool is lst_pools[0] for pool in lst_pools)
+
+    # Broken process pool is replaced
+    pool = GetWorkerPool('process', 1)
+    with pytest.raises(BrokenProcessPool):
+        pool.submit(os._exit, 1).result()
+    pool_new = GetWorkerPool('process', 1)
+    assert pool_new is not pool
+    assert pool_new.submit(abs, -2).result() == 2
+
+"""
+ingestion cache
+"""
+def test_ImportToTblDf_Cache(tbls_ExcelFile, tmp_path, monkeypatch):
+    """
+    Import loads from cache if files and import/parse params are unchanged
+    10/18/26
+    """
+    path_cache = str(tmp_path) + os.sep + 'cache' + os.sep
+    tbls_ExcelFile.dImportParams.update({'lst_files':'Example2.xlsx',
+                                         'path_cache':path_cache})
+    tbls_ExcelFile.ImportToTblDf()
+    df_first = tbls_ExcelFile.df
+    assert len(tbls_ExcelFile.cache.dict_index) == 1
+
+    # Second import is a cache hit (sheet reads disabled)
+    def NoRead(self): raise AssertionError('read despite cache hit')
+    monkeypatch.setattr(Table, 'ReadExcelFileSheets', NoRead)
+    tbls_ExcelFile.ImportToTblDf()
+
+    check_ExcelFile(tbls_ExcelFile)
+    pd.testing.assert_frame_equal(tbls_ExcelFile.df, df_first)
+
+def test_ImportToTblDf_InvalidateCache(tbls_CSVFile, tmp_path):
+    """
+    Remove this table's cache entries (next import re-reads files)
+    10/18/26
+    """
+    path_cache = str(tmp_path) + os.sep + 'cache' + os.sep
+    tbls_CSVFile.dImportParams.update({'lst_files':'Example2.csv',
+                                       'path_cache':path_cache})
+    tbls_CSVFile.ImportToTblDf()
+    tbls_CSVFile.ImportToTblDf()
+    check_CSVFile(tbls_CSVFile)
+    assert len(tbls_CSVFile.cache.dict_index) == 1
+
+    tbls_CSVFile.InvalidateCache()
+    assert tbls_CSVFile.cache.dict_index == {}
+
 """
 Tests of ImportToTblDf procedure methods
 """
@@ -307,6 +715,75 @@ def test_ImportToTblDf_Excel_SetLstSheets3(files):
     tbl.SetLstSheets()
     assert tbl.lst_sheets == ['data']
 
+@pytest.fixture
+def pf_many_sheets(tmp_path):
+    """
+    Workbook with sheets jan_sales, feb_sales, jan_costs and summary
+    10/18/26
+    """
+    pf = str(tmp_path) + os.sep + 'many_sheets.xlsx'
+    with pd.ExcelWriter(pf) as writer:
+        for i, sht in enumerate(['jan_sales', 'feb_sales', 'jan_costs', 'summary']):
+            pd.DataFrame({'sht':[sht], 'i':[i]}).to_excel(writer, sheet_name=sht, index=False)
+    return pf
+
+def test_ImportToTblDf_Excel_SetLstSheets4(pf_many_sheets):
+    """
+    Set .lst_sheets for list, regex, startswith, endswith and contains
+    sht_type selectors (sheet names from workbook.xml probe)
+    10/18/26
+    """
+    lst_cases = [('list', ['summary', 'jan_sales', 'missing'], ['summary', 'jan_sales']),
+                 ('list', [1, 'summary'], ['feb_sales', 'summary']),
+                 ('regex', r'^(jan|feb)_sales$', ['jan_sales', 'feb_sales']),
+                 ('startswith', 'jan', ['jan_sales', 'jan_costs']),
+                 ('endswith', ['_costs', 'ary'], ['jan_costs', 'summary']),
+                 ('contains', '_', ['jan_sales', 'feb_sales', 'jan_costs'])]
+    for sht_type, sht, expected in lst_cases:
+        tbl = Table('ExcelFile', dImportParams={'ftype':'excel', 'sht_type':sht_type,
+                                               'sht':sht})
+        tbl.SetFileIngestParams()
+        tbl.pf = pf_many_sheets
+        tbl.SetLstSheets()
+        assert tbl.lst_sheets == expected
+
+    tbl.sht_type = 'bogus'
+    with pytest.raises(ValueError):
+        tbl.SetLstSheets()
+
+    # regex needs a pattern (default sht=0 is not one)
+    tbl.sht_type = 'regex'
+    tbl.dImportParams.pop('sht')
+    with pytest.raises(ValueError, match="ExcelFile: sht_type 'regex' requires sht"):
+        tbl.SetLstSheets()
+    tbl.dImportParams['sht'] = re.compile('SALES$', re.IGNORECASE)
+    tbl.SetLstSheets()
+    assert tbl.lst_sheets == ['jan_sales', 'feb_sales']
+
+def test_ImportToTblDf_Excel_SetLstSheets5(pf_many_sheets, monkeypatch):
+    """
+    Import only matching sheets; workbooks with no matching sheets not opened
+    10/18/26
+    """
+    lst_opened = []
+    class ExcelFileCount(pd.ExcelFile):
+        def __init__(self, path_or_buffer, *args, **kwargs):
+            lst_opened.append(path_or_buffer)
+            super().__init__(path_or_buffer, *args, **kwargs)
+    monkeypatch.setattr(pd, 'ExcelFile', ExcelFileCount)
+
+    dImportParams = {'ftype':'excel', 'sht_type':'startswith', 'sht':'jan',
+                     'lst_files':pf_many_sheets}
+    tbl = Table('ExcelFile', dImportParams=dImportParams)
+    tbl.ImportToTblDf()
+    assert list(tbl.df['sht']) == ['jan_sales', 'jan_costs']
+    assert len(lst_opened) == 1
+
+    tbl.dImportParams['sht'] = 'dec'
+    tbl.ImportToTblDf()
+    assert tbl.df.empty
+    assert len(lst_opened) == 1
+
 def test_ImportToTblDf_Excel_ReadExcelSht1(files):
     """
     Read from structured Excel sheet into a temporary DataFrame
@@ -371,6 +848,24 @@ def test_ImportToTblDf_Excel_ReadExcelSht3(files):
     tbl.ReadExcelSht()
     assert tbl.df_temp.iloc[2, 1] == 'Stuff'
 
+def test_ImportToTblDf_Excel_ReadExcelSht4(files):
+    """
+    Read from structured Excel sheet into a temporary DataFrame
+    (usecols subset and rename at read time)
+    10/18/26
+    """
+    dImportParams={'ftype':'excel', 'sht_type':'single', 'sht':'data',
+                   'usecols':['col_2a_import_name', 'date2_import_name'],
+                   'dict_rename':{'col_2a_import_name':'col_2a'}}
+    tbl = Table('ExcelFile', dImportParams=dImportParams)
+
+    tbl.pf = files.path_data + 'Example2.xlsx'
+    tbl.SetFileIngestParams()
+    tbl.sht = 'data'
+    tbl.ReadExcelSht()
+    assert list(tbl.df_temp.columns) == ['col_2a', 'date2_import_name']
+    assert len(tbl.df_temp) == 6
+
 def test_ImportToTblDf_Excel_ReadExcelFileSheets1(files):
     """
     Loop through sheets in lst_sheets and read their data
@@ -418,6 +913,293 @@ def test_ImportToTblDf_Excel_ReadExcelFileSheets2(files):
     assert len(tbl.lst_dfs) == 1
     assert tbl.lst_dfs[0].shape == (6, 4)
 
+def test_ImportToTblDf_Excel_OpenExcelFile(files, monkeypatch):
+    """
+    Open .xl pd.ExcelFile handle for .pf (shared by sheet listing and reads)
+    10/18/26
+    """
+    # Count workbook opens during import of two multi-sheet files
+    lst_opened = []
+    class ExcelFileCount(pd.ExcelFile):
+        def __init__(self, path_or_buffer, *args, **kwargs):
+            lst_opened.append(path_or_buffer)
+            super().__init__(path_or_buffer, *args, **kwargs)
+    monkeypatch.setattr(pd, 'ExcelFile', ExcelFileCount)
+
+    dImportParams={'ftype':'excel', 'sht_type':'all', 'import_path':files.path_data,
+                   'lst_files':['Example2_multisheet.xlsx', 'Example2_multisheet.xlsx']}
+    tbl = Table('ExcelFile', dImportParams=dImportParams)
+    tbl.ImportToTblDf()
+    assert len(lst_opened) == 2
+    assert tbl.df.shape == (12, 4)
+    assert tbl.xl is None
+
+def test_ImportToTblDf_Excel_Engine(files):
+    """
+    Read Excel with dImportParams['engine'] reader (same df for all engines)
+    10/18/26
+    """
+    dImportParams={'ftype':'excel', 'sht_type':'all', 'import_path':files.path_data,
+                   'lst_files':['Example2_multisheet.xlsx']}
+    dParseParams={'is_unstructured':True, 'import_dtype':str}
+    lst_dfs_expected = None
+    for engine in [None, 'openpyxl', 'values']:
+        tbl = Table('ExcelFile', dImportParams=dict(dImportParams, engine=engine),
+                    dParseParams=dParseParams)
+        tbl.ImportToTblDf()
+        assert tbl.engine == engine
+        if lst_dfs_expected is None: lst_dfs_expected = tbl.lst_dfs
+        for df, df_expected in zip(tbl.lst_dfs, lst_dfs_expected):
+            pd.testing.assert_frame_equal(df, df_expected)
+
+def test_ImportToTblDf_Timings(files):
+    """
+    Stage timings recorded in tbl.timings during import and parse
+    10/18/26
+    """
+    dImportParams={'ftype':'excel', 'import_path':files.path_data,
+                   'lst_files':'tbl1_raw.xlsx', 'sht':'raw_table'}
+    dParseParams={'is_unstructured':True, 'import_dtype':str, 'parse_type':'row_major',
+        'flag_start_bound':'Answer Choices', 'flag_end_bound':'<blank>',
+        'icol_start_bound':0, 'icol_end_bound':0,
+        'iheader_rowoffset_from_flag':0, 'idata_rowoffset_from_flag':1}
+    tbl = Table('tbl1', dImportParams=dImportParams, dParseParams=dParseParams)
+    tbl.ImportToTblDf()
+    tbl.ParseRawData()
+
+    lst_stages = ['open_file', 'read_file', 'str_coercion', 'import',
+                  'block_scan', 'block_read', 'parse']
+    assert list(tbl.timings) == lst_stages
+    assert all(tbl.timings[s]['n_calls'] == 1 for s in lst_stages)
+    assert tbl.timings['import']['wall'] >= tbl.timings['read_file']['wall']
+
+    tbl.ResetTimings()
+    assert tbl.timings == {}
+
+"""
+Incremental sweep-folder ingestion
+"""
+def test_ImportIncremental(files, tmp_path):
+    """
+    Procedure to update .df from persisted base table plus new/changed
+    files (rows of changed and deleted files replaced/removed); rows ordered
+    by lst_files. Sets .dict_incremental to file diff lists
+    10/18/26
+    """
+    # Sweep folder with copies of Example2 CSV files
+    path_sweep = str(tmp_path) + os.sep + 'sweep' + os.sep
+    os.makedirs(path_sweep)
+    df_src = pd.read_csv(files.path_data + 'Example2.csv')
+    for i in range(3): df_src.assign(day=i).to_csv(path_sweep + f'day{i}.csv', index=False)
+
+    dImportParams = {'ftype':'csv', 'import_path':path_sweep, 'sweep_glob':'day*.csv',
+                     'path_incremental':str(tmp_path) + os.sep + 'incremental' + os.sep}
+    def Run():
+        tbl = Table('Sweep', dImportParams=dict(dImportParams))
+        tbl.ImportIncremental()
+        return tbl
+
+    def Expected(lst_files):
+        return pd.concat([pd.read_csv(path_sweep + f).assign(source_file=f)
+                          for f in lst_files], ignore_index=True)
+
+    tbl = Run()
+    assert tbl.dict_incremental['new'] == ['day0.csv', 'day1.csv', 'day2.csv']
+    pd.testing.assert_frame_equal(tbl.df, Expected(['day0.csv', 'day1.csv', 'day2.csv']))
+
+    # Unchanged files are not read
+    tbl = Run()
+    assert tbl.dict_incremental['unchanged'] == ['day0.csv', 'day1.csv', 'day2.csv']
+    assert 'import' not in tbl.timings
+    assert len(tbl.df) == 3 * len(df_src)
+
+    # Changed, deleted and new files
+    df_src.assign(day=10).head(2).to_csv(path_sweep + 'day1.csv', index=False)
+    os.remove(path_sweep + 'day0.csv')
+    df_src.assign(day=3).to_csv(path_sweep + 'day3.csv', index=False)
+    tbl = Run()
+    dDiff = tbl.dict_incremental
+    assert (dDiff['new'], dDiff['changed'], dDiff['deleted']) == \
+        (['day3.csv'], ['day1.csv'], ['day0.csv'])
+    assert tbl.timings['import']['n_calls'] == 2
+    pd.testing.assert_frame_equal(tbl.df, Expected(['day1.csv', 'day2.csv', 'day3.csv']))
+
+    # Changed import params re-read all files
+    dImportParams['usecols'] = ['date2_import_name', 'day']
+    tbl = Run()
+    assert tbl.dict_incremental['new'] == ['day1.csv', 'day2.csv', 'day3.csv']
+    assert list(tbl.df.columns) == ['date2_import_name', 'day', 'source_file']
+
+"""
+Lazy loading
+"""
+def test_Table_SetLazy(files):
+    """
+    Mark table to load on first .df access (import and, for unstructured
+    tables, parse); same .df as eager import and parse
+    10/18/26
+    """
+    dImportParams={'ftype':'excel', 'import_path':files.path_data,
+                   'lst_files':'tbl1_raw.xlsx', 'sht':'raw_table'}
+    dParseParams={'is_unstructured':True, 'import_dtype':str, 'parse_type':'row_major',
+        'flag_start_bound':'Answer Choices', 'flag_end_bound':'<blank>',
+        'icol_start_bound':0, 'icol_end_bound':0,
+        'iheader_rowoffset_from_flag':0, 'idata_rowoffset_from_flag':1}
+    tbl_eager = Table('tbl1', dImportParams=dImportParams, dParseParams=dParseParams)
+    tbl_eager.ImportToTblDf()
+    tbl_eager.ParseRawData()
+
+    tbl = Table('tbl1', dImportParams=dImportParams, dParseParams=dParseParams)
+    tbl.SetLazy()
+    assert not tbl.is_loaded and tbl.timings == {}
+
+    pd.testing.assert_frame_equal(tbl.df, tbl_eager.df)
+    assert tbl.is_loaded
+    assert tbl.timings['import']['n_calls'] == 1 and tbl.timings['parse']['n_calls'] == 1
+
+    # Loaded once
+    tbl.df
+    assert tbl.timings['import']['n_calls'] == 1
+
+def test_tbls_IsLazy(files):
+    """
+    IsLazy=True defers each table's import/parse to first access of tbl.df;
+    Prefetch loads tables in background threads
+    10/18/26
+    """
+    tbls = ProjectTables(files, IsLazy=True)
+    assert not tbls.ColInfo.is_loaded and not tbls.ExampleTbl1.is_loaded
+
+    tbls.ImportExcelInputs()
+    assert len(tbls.ExampleTbl2.df) == 6
+    assert tbls.ExampleTbl1.timings == {} and tbls.ColInfo.timings == {}
+
+    lst_futures = tbls.Prefetch()
+    assert len(lst_futures) == 2
+    for future in lst_futures: future.result()
+    assert tbls.ExampleTbl1.is_loaded and tbls.ColInfo.is_loaded
+    assert len(tbls.ExampleTbl1.df) == 3
+    assert tbls.Prefetch() == []
+
+"""
+Async import
+"""
+def test_ImportAllAsync(files):
+    """
+    Import lst_tbls (default Excel and CSV inputs) concurrently from an
+    asyncio event loop: at most max_concurrency tables import at once on a
+    call-scoped thread pool, each with its own timeout (seconds; None for
+    no limit). Returns dict of table name: None or the table's exception
+    (IsRaise=True raises the first failure and cancels the other tables).
+    Cancelling the awaiting task cancels all tables
+    10/18/26
+    """
+    tbls = ProjectTables(files)
+    dResults = asyncio.run(tbls.ImportAllAsync(max_concurrency=2))
+    assert dResults == {'ExampleTbl1':None, 'ExampleTbl2':None}
+    assert len(tbls.ExampleTbl1.df) == 3 and len(tbls.ExampleTbl2.df) == 6
+
+    # Slow table times out without holding up the other table
+    tbls = ProjectTables(files)
+    SetSlowReads(tbls.ExampleTbl1, n_files=5)
+    dResults = asyncio.run(tbls.ImportAllAsync(timeout=0.1))
+    assert isinstance(dResults['ExampleTbl1'], TimeoutError)
+    assert dResults['ExampleTbl2'] is None and len(tbls.ExampleTbl2.df) == 6
+
+    # Worker thread stops at next file check without setting .df
+    with tbls.ExampleTbl1.lock_load:
+        assert tbls.ExampleTbl1.n_reads < 5
+        assert tbls.ExampleTbl1.df.empty
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(tbls.ImportAllAsync(timeout=0.1, IsRaise=True))
+
+def test_ImportToTblDfAsync_cancel(files):
+    """
+    Cancelling the awaiting task stops the table's import
+    10/18/26
+    """
+    tbls = ProjectTables(files)
+    tbl = tbls.ExampleTbl1
+    SetSlowReads(tbl, n_files=5)
+
+    async def CancelImport():
+        task = asyncio.ensure_future(tbl.ImportToTblDfAsync())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(CancelImport())
+    with tbl.lock_load:
+        assert tbl.n_reads < 5 and tbl.df.empty
+
+    # Table imports normally after a cancelled import
+    asyncio.run(tbl.ImportToTblDfAsync(timeout=5))
+    assert len(tbl.df) == 15
+
+def test_ImportToTblDfAsync_unstructured(files):
+    """
+    Await Load (import and parse as unstructured tables need; run on
+    executor; default loop executor) with optional timeout in seconds
+    (raises TimeoutError)
+    10/18/26
+    """
+    dImportParams = {'ftype':'excel', 'import_path':files.path_data,
+                     'lst_files':'tbl1_raw.xlsx', 'sht':'raw_table'}
+    dParseParams = {'is_unstructured':True, 'import_dtype':str, 'parse_type':'row_major',
+        'flag_start_bound':'flag', 'flag_end_bound':'<blank>',
+        'icol_start_bound':1, 'icol_end_bound':2,
+        'iheader_rowoffset_from_flag':1, 'idata_rowoffset_from_flag':2}
+
+    # Unstructured table is imported and parsed
+    tbl = Table('tbl1_raw', dict(dImportParams), dict(dParseParams))
+    asyncio.run(tbl.ImportToTblDfAsync(timeout=5))
+    df_expected = tbl.df
+    assert not df_expected.empty and 'parse' in tbl.timings
+
+    # Cancelled streaming parse leaves previous .df (no partial blocks)
+    tbl = Table('tbl1_raw', dImportParams, dict(dParseParams, is_streaming_parse=True))
+    tbl.dImportParams['lst_files'] = ['tbl1_raw.xlsx'] * 5
+    tbl.n_reads = 0
+    ReadStreaming = tbl.ReadExcelFileStreaming
+    def ReadStreamingSlow():
+        ReadStreaming()
+        tbl.n_reads += 1
+        time.sleep(0.1)
+    tbl.ReadExcelFileStreaming = ReadStreamingSlow
+
+    async def CancelImport():
+        task = asyncio.ensure_future(tbl.ImportToTblDfAsync())
+        await asyncio.sleep(0.15)
+        assert tbl.df.empty
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(CancelImport())
+    with tbl.lock_load:
+        assert 1 <= tbl.n_reads < 5 and tbl.df.empty
+
+    tbl.dImportParams['lst_files'] = 'tbl1_raw.xlsx'
+    asyncio.run(tbl.ImportToTblDfAsync(timeout=5))
+    pd.testing.assert_frame_equal(tbl.df.reset_index(drop=True),
+                                  df_expected.reset_index(drop=True), check_dtype=False)
+
+def SetSlowReads(tbl, n_files):
+    """
+    Helper - set tbl to read its file n_files times with a delay per file
+    (count of files read in tbl.n_reads)
+    """
+    tbl.dImportParams['lst_files'] = [tbl.dImportParams['lst_files']] * n_files
+    tbl.n_reads = 0
+    ReadSheets = tbl.ReadExcelFileSheets
+    def ReadSheetsSlow():
+        time.sleep(0.1)
+        tbl.n_reads += 1
+        ReadSheets()
+    tbl.ReadExcelFileSheets = ReadSheetsSlow
+
 """
 Tests of fixtures and utilities
 """